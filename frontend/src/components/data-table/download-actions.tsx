@@ -11,13 +11,17 @@ import { toast } from "../ui/use-toast";
 import { downloadByURL } from "@/utils/download";
 import { ChevronDownIcon } from "lucide-react";
 
+export type DownloadFormat = "csv" | "json" | "parquet" | "arrow";
+
 export interface DownloadActionProps {
-  downloadAs: (req: { format: "csv" | "json" }) => Promise<string>;
+  downloadAs: (req: { format: DownloadFormat }) => Promise<string>;
 }
 
 const options = [
   { label: "CSV", format: "csv" },
   { label: "JSON", format: "json" },
+  { label: "Parquet", format: "parquet" },
+  { label: "Arrow", format: "arrow" },
 ] as const;
 
 export const DownloadAs: React.FC<DownloadActionProps> = (props) => {
@@ -2,13 +2,44 @@
 import { VariableTable } from "@/components/variables/variables-table";
 import { useCellIds } from "@/core/cells/cells";
 import { useVariables } from "@/core/variables/state";
+import type { Variable, VariableName } from "@/core/variables/types";
+import { previewVariables } from "@/core/network/requests";
+import { isStaticNotebook } from "@/core/static/static-state";
 import type React from "react";
+import { useEffect, useRef } from "react";
 import { PanelEmptyState } from "./empty-state";
 import { FunctionSquareIcon } from "lucide-react";
 
 export const VariablePanel: React.FC = () => {
   const variables = useVariables();
   const cellIds = useCellIds();
+  // Variables whose preview has been requested, as they were when it was
+  // requested; a response replaces the variable, even when the kernel ran
+  // out of time to preview it
+  const pendingPreviews = useRef(new Map<VariableName, Variable>());
+
+  // The kernel only broadcasts variable types; previews are computed on
+  // request, and only while this panel is open.
+  useEffect(() => {
+    if (isStaticNotebook()) {
+      return;
+    }
+    const pending = pendingPreviews.current;
+    const missing: VariableName[] = [];
+    for (const variable of Object.values(variables)) {
+      if (variable.value != null) {
+        pending.delete(variable.name);
+      } else if (pending.get(variable.name) !== variable) {
+        // Not requested yet, or skipped by the kernel: previewed values are
+        // never null, and each request previews at least one variable
+        pending.set(variable.name, variable);
+        missing.push(variable.name);
+      }
+    }
+    if (missing.length > 0) {
+      void previewVariables({ variableNames: missing });
+    }
+  }, [variables]);
 
   if (Object.keys(variables).length === 0) {
     return (
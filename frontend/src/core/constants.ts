@@ -19,6 +19,14 @@ export const KnownQueryParams = {
    * Session ID for the current notebook
    */
   sessionId: "session_id",
+  /**
+   * Whether the websocket client accepts batched frames
+   */
+  batchFrames: "batch_frames",
+  /**
+   * Sequence number of the last websocket frame received, when reconnecting
+   */
+  lastSeq: "last_seq",
   /**
    * Kiosk mode. If the editor is running in kiosk mode
    */
@@ -103,6 +103,7 @@ export async function initialize() {
       case "variable-values":
       case "data-column-preview":
       case "datasets":
+      case "cell-profiles":
         // Unsupported
         return;
       case "kernel-ready":
@@ -159,6 +159,13 @@ export function createNetworkRequests(): EditRequests & RunRequests {
         })
         .then(handleResponseReturnNull);
     },
+    previewVariables: (request) => {
+      return marimoClient
+        .POST("/api/kernel/preview_variables", {
+          body: request,
+        })
+        .then(handleResponseReturnNull);
+    },
     openFile: async (request) => {
       await marimoClient
         .POST("/api/kernel/open", {
@@ -31,6 +31,7 @@ export function createErrorToastingRequests(
     readCode: "Failed to read code",
     readSnippets: "Failed to fetch snippets",
     previewDatasetColumn: "Failed to fetch data sources",
+    previewVariables: "Failed to fetch variable previews",
     openFile: "Failed to open file",
     getUsageStats: "", // No toast
     sendListFiles: "Failed to list files",
@@ -49,6 +49,7 @@ export const {
   readCode,
   readSnippets,
   previewDatasetColumn,
+  previewVariables,
   openFile,
   getUsageStats,
   sendListFiles,
@@ -53,6 +53,7 @@ export type MarimoFile = schemas["MarimoFile"];
 export type OpenFileRequest = schemas["OpenFileRequest"];
 export type PreviewDatasetColumnRequest =
   schemas["PreviewDatasetColumnRequest"];
+export type PreviewVariablesRequest = schemas["PreviewVariablesRequest"];
 export type ReadCodeResponse = schemas["ReadCodeResponse"];
 export type RecentFilesResponse = schemas["RecentFilesResponse"];
 export type RenameFileRequest = schemas["RenameFileRequest"];
@@ -121,6 +122,7 @@ export interface EditRequests {
   readCode: () => Promise<{ contents: string }>;
   readSnippets: () => Promise<Snippets>;
   previewDatasetColumn: (request: PreviewDatasetColumnRequest) => Promise<null>;
+  previewVariables: (request: PreviewVariablesRequest) => Promise<null>;
   openFile: (request: { path: string }) => Promise<null>;
   getUsageStats: () => Promise<UsageResponse>;
   // File explorer requests
@@ -455,6 +455,11 @@ export class PyodideBridge implements RunRequests, EditRequests {
     await this.putControlRequest(request);
     return null;
   };
+
+  previewVariables: EditRequests["previewVariables"] = async (request) => {
+    await this.putControlRequest(request);
+    return null;
+  };
   syncCellIds = () => Promise.resolve(null);
   getUsageStats = throwNotImplemented;
   openTutorial = throwNotImplemented;
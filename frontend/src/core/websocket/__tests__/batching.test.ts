@@ -0,0 +1,56 @@
+/* Copyright 2024 Marimo. All rights reserved. */
+
+import { describe, expect, it } from "vitest";
+import { latestSequence, unbatchOperations } from "../batching";
+import type { OperationMessage } from "@/core/kernel/messages";
+
+describe("unbatchOperations", () => {
+  const completedRun = {
+    op: "completed-run",
+    data: {},
+  } as unknown as OperationMessage;
+  const interrupted = {
+    op: "interrupted",
+    data: {},
+  } as unknown as OperationMessage;
+
+  it("should return a single operation as is", () => {
+    expect(unbatchOperations(completedRun)).toEqual([completedRun]);
+  });
+
+  it("should unpack batched operations in order", () => {
+    expect(
+      unbatchOperations({ op: "batch", data: [completedRun, interrupted] }),
+    ).toEqual([completedRun, interrupted]);
+  });
+});
+
+describe("latestSequence", () => {
+  it("should keep the previous sequence number for unnumbered frames", () => {
+    const msg = {
+      op: "completed-run",
+      data: {},
+    } as unknown as OperationMessage;
+    expect(latestSequence(msg, 3)).toBe(3);
+    expect(latestSequence(msg, undefined)).toBeUndefined();
+  });
+
+  it("should use the sequence number of the frame", () => {
+    const msg = {
+      op: "completed-run",
+      data: {},
+      seq: 4,
+    } as unknown as OperationMessage;
+    expect(latestSequence(msg, 3)).toBe(4);
+    expect(latestSequence({ op: "batch", data: [], seq: 1 }, 3)).toBe(1);
+  });
+
+  it("should use the last numbered operation of a batch", () => {
+    const data = [
+      { op: "completed-run", data: {}, seq: 5 },
+      { op: "completed-run", data: {}, seq: 6 },
+      { op: "kernel-ready", data: {} },
+    ] as unknown as OperationMessage[];
+    expect(latestSequence({ op: "batch", data }, 3)).toBe(6);
+  });
+});
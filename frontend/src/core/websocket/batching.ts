@@ -0,0 +1,45 @@
+/* Copyright 2024 Marimo. All rights reserved. */
+import type { OperationMessage } from "@/core/kernel/messages";
+
+/**
+ * The server may coalesce several operations into a single frame,
+ * sent as `{"op": "batch", "data": [...operations]}`.
+ */
+interface BatchMessage {
+  op: "batch";
+  data: OperationMessage[];
+  seq?: number;
+}
+
+/**
+ * Frames logged by the session carry a sequence number, which the client
+ * sends back when reconnecting to only receive the frames it missed.
+ */
+type Sequenced<T> = T & { seq?: number };
+
+/**
+ * Unpack a parsed websocket frame into the operations it carries,
+ * in the order they were sent.
+ */
+export function unbatchOperations(
+  msg: Sequenced<OperationMessage> | BatchMessage,
+): Array<Sequenced<OperationMessage>> {
+  if (msg.op === "batch") {
+    return (msg as BatchMessage).data;
+  }
+  return [msg as OperationMessage];
+}
+
+/**
+ * The sequence number of the latest frame received, given the previous one.
+ */
+export function latestSequence(
+  msg: Sequenced<OperationMessage> | BatchMessage,
+  previous: number | undefined,
+): number | undefined {
+  let latest = msg.seq ?? previous;
+  for (const operation of unbatchOperations(msg)) {
+    latest = operation.seq ?? latest;
+  }
+  return latest;
+}
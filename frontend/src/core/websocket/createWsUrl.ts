@@ -2,9 +2,15 @@
 import { Strings } from "@/utils/strings";
 import { KnownQueryParams } from "../constants";
 
-export function createWsUrl(sessionId: string): string {
+export function createWsUrl(sessionId: string, lastSeq?: number): string {
   const searchParams = new URLSearchParams(window.location.search);
   searchParams.set(KnownQueryParams.sessionId, sessionId);
+  // Let the server coalesce operations into batched frames
+  searchParams.set(KnownQueryParams.batchFrames, "true");
+  // When reconnecting, only ask for the frames we missed
+  if (lastSeq !== undefined) {
+    searchParams.set(KnownQueryParams.lastSeq, String(lastSeq));
+  }
 
   return resolveToWsUrl(`ws?${searchParams.toString()}`);
 }
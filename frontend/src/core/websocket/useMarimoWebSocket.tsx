@@ -38,6 +38,7 @@ import type { CellId, UIElementId } from "../cells/ids";
 import { kioskModeAtom } from "../mode";
 import { focusAndScrollCellOutputIntoView } from "../cells/scrollCellIntoView";
 import { capabilitiesAtom } from "../config/capabilities";
+import { latestSequence, unbatchOperations } from "./batching";
 import { UI_ELEMENT_REGISTRY } from "../dom/uiregistry";
 import { reloadSafe } from "@/utils/reload-safe";
 import { useRunsActions } from "../cells/runs";
@@ -53,6 +54,8 @@ export function useMarimoWebSocket(opts: {
 }) {
   // Track whether we want to try reconnecting.
   const shouldTryReconnecting = useRef<boolean>(true);
+  // Sequence number of the last frame received from the server
+  const lastSeq = useRef<number | undefined>(undefined);
   const { autoInstantiate, sessionId, setCells } = opts;
   const { showBoundary } = useErrorBoundary();
 
@@ -70,7 +73,14 @@ export function useMarimoWebSocket(opts: {
   const setCapabilities = useSetAtom(capabilitiesAtom);
 
   const handleMessage = (e: MessageEvent<JsonString<OperationMessage>>) => {
-    const msg = jsonParseWithSpecialChar(e.data);
+    const frame = jsonParseWithSpecialChar(e.data);
+    for (const msg of unbatchOperations(frame)) {
+      handleOperation(msg);
+    }
+    lastSeq.current = latestSequence(frame, lastSeq.current);
+  };
+
+  const handleOperation = (msg: OperationMessage) => {
     switch (msg.op) {
       case "reload":
         reloadSafe();
@@ -192,6 +202,9 @@ export function useMarimoWebSocket(opts: {
       case "data-column-preview":
         addColumnPreview(msg.data);
         return;
+      case "cell-profiles":
+        // Served by the /api/kernel/cell_profiles endpoint
+        return;
 
       case "reconnected":
         return;
@@ -228,7 +241,7 @@ export function useMarimoWebSocket(opts: {
     /**
      * Unique URL for this session.
      */
-    url: createWsUrl(sessionId),
+    url: () => createWsUrl(sessionId, lastSeq.current),
 
     /**
      * Open callback. Set the connection status to open.
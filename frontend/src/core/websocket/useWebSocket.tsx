@@ -8,7 +8,10 @@ import { PyodideBridge, PyodideWebsocket } from "../wasm/bridge";
 import { Logger } from "@/utils/Logger";
 
 interface UseWebSocketOptions {
-  url: string;
+  /**
+   * URL to connect to, or a function computing it on each (re)connection.
+   */
+  url: string | (() => string);
   static: boolean;
   onOpen?: (event: WebSocketEventMap["open"]) => void;
   onMessage?: (event: WebSocketEventMap["message"]) => void;
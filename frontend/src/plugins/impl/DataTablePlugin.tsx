@@ -15,6 +15,7 @@ import { getVegaFieldTypes } from "./vega/utils";
 import { Banner } from "./common/error-banner";
 import { ColumnChartSpecModel } from "@/components/data-table/chart-spec-model";
 import { ColumnChartContext } from "@/components/data-table/column-summary";
+import type { DownloadFormat } from "@/components/data-table/download-actions";
 import { Logger } from "@/utils/Logger";
 
 import {
@@ -81,7 +82,7 @@ interface Data<T> {
 
 // eslint-disable-next-line @typescript-eslint/consistent-type-definitions
 type Functions = {
-  download_as: (req: { format: "csv" | "json" }) => Promise<string>;
+  download_as: (req: { format: DownloadFormat }) => Promise<string>;
   get_column_summaries: <T>(opts: {}) => Promise<ColumnSummaries<T>>;
   search: <T>(req: {
     sort?: {
@@ -135,7 +136,9 @@ export const DataTablePlugin = createPlugin<S>("marimo-table")
   )
   .withFunctions<Functions>({
     download_as: rpc
-      .input(z.object({ format: z.enum(["csv", "json"]) }))
+      .input(
+        z.object({ format: z.enum(["csv", "json", "parquet", "arrow"]) }),
+      )
       .output(z.string()),
     get_column_summaries: rpc.input(z.object({}).passthrough()).output(
       z.object({
@@ -1,4 +1,5 @@
 # Copyright 2024 Marimo. All rights reserved.
+# ruff: noqa: TCH004
 """The marimo library.
 
 The marimo library brings marimo notebooks to life with powerful
@@ -16,6 +17,8 @@ marimo is designed to be:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 __all__ = [
     # Core API
     "App",
@@ -84,59 +87,153 @@ __all__ = [
 ]
 __version__ = "0.10.10"
 
-import marimo._ai as ai
-import marimo._islands as islands
-from marimo._ast.app import App
-from marimo._ast.cell import Cell
-from marimo._islands.island_generator import MarimoIslandGenerator
-from marimo._output.doc import doc
-from marimo._output.formatting import as_html, iframe, plain
-from marimo._output.hypertext import Html
-from marimo._output.justify import center, left, right
-from marimo._output.md import md
-from marimo._output.show_code import show_code
-from marimo._plugins import ui
-from marimo._plugins.stateless import mpl, status
-from marimo._plugins.stateless.accordion import accordion
-from marimo._plugins.stateless.audio import audio
-from marimo._plugins.stateless.callout import callout
-from marimo._plugins.stateless.carousel import carousel
-from marimo._plugins.stateless.download import download
-from marimo._plugins.stateless.flex import hstack, vstack
-from marimo._plugins.stateless.icon import icon
-from marimo._plugins.stateless.image import image
-from marimo._plugins.stateless.lazy import lazy
-from marimo._plugins.stateless.mermaid import mermaid
-from marimo._plugins.stateless.nav_menu import nav_menu
-from marimo._plugins.stateless.pdf import pdf
-from marimo._plugins.stateless.plain_text import plain_text
-from marimo._plugins.stateless.routes import routes
-from marimo._plugins.stateless.sidebar import sidebar
-from marimo._plugins.stateless.stat import stat
-from marimo._plugins.stateless.style import style
-from marimo._plugins.stateless.tabs import tabs
-from marimo._plugins.stateless.tree import tree
-from marimo._plugins.stateless.video import video
-from marimo._runtime import output
-from marimo._runtime.capture import (
-    capture_stderr,
-    capture_stdout,
-    redirect_stderr,
-    redirect_stdout,
-)
-from marimo._runtime.context.utils import running_in_notebook
-from marimo._runtime.control_flow import MarimoStopError, stop
-from marimo._runtime.runtime import (
-    app_meta,
-    cli_args,
-    defs,
-    notebook_dir,
-    notebook_location,
-    query_params,
-    refs,
-)
-from marimo._runtime.state import state
-from marimo._runtime.threads import Thread
-from marimo._save.save import cache, lru_cache, persistent_cache
-from marimo._server.asgi import create_asgi_app
-from marimo._sql.sql import sql
+# The public API is resolved lazily, so that `import marimo` (in scripts,
+# kernel processes and the CLI) doesn't pay for the whole import graph.
+# Maps each attribute to the module it is defined in, and its name there;
+# a name of None means the attribute is the module itself.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "ai": ("marimo._ai", None),
+    "islands": ("marimo._islands", None),
+    "App": ("marimo._ast.app", "App"),
+    "Cell": ("marimo._ast.cell", "Cell"),
+    "MarimoIslandGenerator": (
+        "marimo._islands.island_generator",
+        "MarimoIslandGenerator",
+    ),
+    "doc": ("marimo._output.doc", "doc"),
+    "as_html": ("marimo._output.formatting", "as_html"),
+    "iframe": ("marimo._output.formatting", "iframe"),
+    "plain": ("marimo._output.formatting", "plain"),
+    "Html": ("marimo._output.hypertext", "Html"),
+    "center": ("marimo._output.justify", "center"),
+    "left": ("marimo._output.justify", "left"),
+    "right": ("marimo._output.justify", "right"),
+    "md": ("marimo._output.md", "md"),
+    "show_code": ("marimo._output.show_code", "show_code"),
+    "ui": ("marimo._plugins.ui", None),
+    "mpl": ("marimo._plugins.stateless.mpl", None),
+    "status": ("marimo._plugins.stateless.status", None),
+    "accordion": ("marimo._plugins.stateless.accordion", "accordion"),
+    "audio": ("marimo._plugins.stateless.audio", "audio"),
+    "callout": ("marimo._plugins.stateless.callout", "callout"),
+    "carousel": ("marimo._plugins.stateless.carousel", "carousel"),
+    "download": ("marimo._plugins.stateless.download", "download"),
+    "hstack": ("marimo._plugins.stateless.flex", "hstack"),
+    "vstack": ("marimo._plugins.stateless.flex", "vstack"),
+    "icon": ("marimo._plugins.stateless.icon", "icon"),
+    "image": ("marimo._plugins.stateless.image", "image"),
+    "lazy": ("marimo._plugins.stateless.lazy", "lazy"),
+    "mermaid": ("marimo._plugins.stateless.mermaid", "mermaid"),
+    "nav_menu": ("marimo._plugins.stateless.nav_menu", "nav_menu"),
+    "pdf": ("marimo._plugins.stateless.pdf", "pdf"),
+    "plain_text": ("marimo._plugins.stateless.plain_text", "plain_text"),
+    "routes": ("marimo._plugins.stateless.routes", "routes"),
+    "sidebar": ("marimo._plugins.stateless.sidebar", "sidebar"),
+    "stat": ("marimo._plugins.stateless.stat", "stat"),
+    "style": ("marimo._plugins.stateless.style", "style"),
+    "tabs": ("marimo._plugins.stateless.tabs", "tabs"),
+    "tree": ("marimo._plugins.stateless.tree", "tree"),
+    "video": ("marimo._plugins.stateless.video", "video"),
+    "output": ("marimo._runtime.output", None),
+    "capture_stderr": ("marimo._runtime.capture", "capture_stderr"),
+    "capture_stdout": ("marimo._runtime.capture", "capture_stdout"),
+    "redirect_stderr": ("marimo._runtime.capture", "redirect_stderr"),
+    "redirect_stdout": ("marimo._runtime.capture", "redirect_stdout"),
+    "running_in_notebook": (
+        "marimo._runtime.context.utils",
+        "running_in_notebook",
+    ),
+    "MarimoStopError": ("marimo._runtime.control_flow", "MarimoStopError"),
+    "stop": ("marimo._runtime.control_flow", "stop"),
+    "app_meta": ("marimo._runtime.runtime", "app_meta"),
+    "cli_args": ("marimo._runtime.runtime", "cli_args"),
+    "defs": ("marimo._runtime.runtime", "defs"),
+    "notebook_dir": ("marimo._runtime.runtime", "notebook_dir"),
+    "notebook_location": ("marimo._runtime.runtime", "notebook_location"),
+    "query_params": ("marimo._runtime.runtime", "query_params"),
+    "refs": ("marimo._runtime.runtime", "refs"),
+    "state": ("marimo._runtime.state", "state"),
+    "Thread": ("marimo._runtime.threads", "Thread"),
+    "cache": ("marimo._save.save", "cache"),
+    "lru_cache": ("marimo._save.save", "lru_cache"),
+    "persistent_cache": ("marimo._save.save", "persistent_cache"),
+    "create_asgi_app": ("marimo._server.asgi", "create_asgi_app"),
+    "sql": ("marimo._sql.sql", "sql"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    import importlib
+
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name)
+        value = module if attribute is None else getattr(module, attribute)
+        # Cache the attribute, so __getattr__ is only called once per name
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    # Re-exported for type checkers; resolved lazily at runtime
+    import marimo._ai as ai
+    import marimo._islands as islands
+    from marimo._ast.app import App
+    from marimo._ast.cell import Cell
+    from marimo._islands.island_generator import MarimoIslandGenerator
+    from marimo._output.doc import doc
+    from marimo._output.formatting import as_html, iframe, plain
+    from marimo._output.hypertext import Html
+    from marimo._output.justify import center, left, right
+    from marimo._output.md import md
+    from marimo._output.show_code import show_code
+    from marimo._plugins import ui
+    from marimo._plugins.stateless import mpl, status
+    from marimo._plugins.stateless.accordion import accordion
+    from marimo._plugins.stateless.audio import audio
+    from marimo._plugins.stateless.callout import callout
+    from marimo._plugins.stateless.carousel import carousel
+    from marimo._plugins.stateless.download import download
+    from marimo._plugins.stateless.flex import hstack, vstack
+    from marimo._plugins.stateless.icon import icon
+    from marimo._plugins.stateless.image import image
+    from marimo._plugins.stateless.lazy import lazy
+    from marimo._plugins.stateless.mermaid import mermaid
+    from marimo._plugins.stateless.nav_menu import nav_menu
+    from marimo._plugins.stateless.pdf import pdf
+    from marimo._plugins.stateless.plain_text import plain_text
+    from marimo._plugins.stateless.routes import routes
+    from marimo._plugins.stateless.sidebar import sidebar
+    from marimo._plugins.stateless.stat import stat
+    from marimo._plugins.stateless.style import style
+    from marimo._plugins.stateless.tabs import tabs
+    from marimo._plugins.stateless.tree import tree
+    from marimo._plugins.stateless.video import video
+    from marimo._runtime import output
+    from marimo._runtime.capture import (
+        capture_stderr,
+        capture_stdout,
+        redirect_stderr,
+        redirect_stdout,
+    )
+    from marimo._runtime.context.utils import running_in_notebook
+    from marimo._runtime.control_flow import MarimoStopError, stop
+    from marimo._runtime.runtime import (
+        app_meta,
+        cli_args,
+        defs,
+        notebook_dir,
+        notebook_location,
+        query_params,
+        refs,
+    )
+    from marimo._runtime.state import state
+    from marimo._runtime.threads import Thread
+    from marimo._save.save import cache, lru_cache, persistent_cache
+    from marimo._server.asgi import create_asgi_app
+    from marimo._sql.sql import sql
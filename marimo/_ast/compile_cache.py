@@ -0,0 +1,227 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Content-addressed cache of compiled cells.
+
+Compiling a cell parses it, runs the scoped visitor over it (which may
+parse embedded SQL) and compiles it to bytecode. The results only depend
+on the cell's code and how it is compiled, so, like `__pycache__`, they
+are cached on disk under a stable digest and reused across processes; an
+in-memory layer serves repeated compiles within a process, e.g. when many
+run-mode sessions open the same notebook.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib.util
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+    from marimo._ast.cell import SourcePosition
+    from marimo._ast.visitor import Language, Name, VariableData
+
+LOGGER = _loggers.marimo_logger()
+
+# Bump when the layout of cached entries changes
+CACHE_FORMAT = 1
+MAX_MEMORY_ENTRIES = 4096
+
+
+@dataclasses.dataclass
+class CompiledCell:
+    """The results of compiling a cell that can be reused."""
+
+    body: CodeType
+    last_expr: CodeType
+    defs: set[Name]
+    refs: set[Name]
+    temporaries: set[Name]
+    variable_data: dict[Name, list[VariableData]]
+    deleted_refs: set[Name]
+    language: Language
+
+
+def cache_key(
+    code: str, cell_id: str, source_position: Optional[SourcePosition]
+) -> str:
+    """Stable digest of everything a compiled cell depends on."""
+    from marimo import __version__
+
+    position = (
+        ""
+        if source_position is None
+        else (
+            f"{source_position.filename}:{source_position.lineno}:"
+            f"{source_position.col_offset}"
+        )
+    )
+    h = hashlib.sha256()
+    for part in (
+        str(CACHE_FORMAT),
+        __version__,
+        sys.version,
+        importlib.util.MAGIC_NUMBER.hex(),
+        # Private names are mangled with the cell id
+        cell_id,
+        position,
+        _sql_parser_version(code),
+        code,
+    ):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _sql_parser_version(code: str) -> str:
+    """The duckdb version that the refs and defs of SQL cells depend on.
+
+    The visitor only parses SQL when duckdb is installed, so entries
+    written with and without it (or with another version) differ.
+    """
+    from marimo._dependencies.dependencies import DependencyManager
+
+    # Cheap pre-check for `mo.sql(...)`, `duckdb.execute(...)`, etc.
+    if ".sql" not in code and ".execute" not in code:
+        return ""
+    if not DependencyManager.duckdb.has():
+        return "no-duckdb"
+    return f"duckdb-{DependencyManager.duckdb.get_version()}"
+
+
+class CompileCache:
+    """Compiled cells, in memory and optionally on disk."""
+
+    def __init__(self, directory: Optional[str]) -> None:
+        self.directory = directory
+        self._memory: OrderedDict[str, CompiledCell] = OrderedDict()
+        # Run-mode kernels compile from different threads
+        self._lock = threading.Lock()
+
+    def get(self, key: str, filename: str) -> Optional[CompiledCell]:
+        """Look up a compiled cell, with its code objects set to `filename`."""
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is None:
+                return None
+        self._remember(key, entry)
+        if entry.body.co_filename != filename:
+            entry = dataclasses.replace(
+                entry,
+                body=_with_filename(entry.body, filename),
+                last_expr=_with_filename(entry.last_expr, filename),
+            )
+        return entry
+
+    def put(self, key: str, entry: CompiledCell) -> None:
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def _remember(self, key: str, entry: CompiledCell) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > MAX_MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def _read(self, key: str) -> Optional[CompiledCell]:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+            return CompiledCell(
+                **{
+                    **data,
+                    "body": marshal.loads(data["body"]),
+                    "last_expr": marshal.loads(data["last_expr"]),
+                }
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt or incompatible entry is a miss
+            LOGGER.debug("Failed to read compiled cell %s: %s", path, e)
+            return None
+
+    def _write(self, key: str, entry: CompiledCell) -> None:
+        path = self._path(key)
+        if path is None or sys.dont_write_bytecode:
+            return
+        data = {
+            **{
+                field.name: getattr(entry, field.name)
+                for field in dataclasses.fields(entry)
+            },
+            "body": marshal.dumps(entry.body),
+            "last_expr": marshal.dumps(entry.last_expr),
+        }
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            # Write atomically, other processes may be reading
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            LOGGER.debug("Failed to write compiled cell %s: %s", path, e)
+
+
+def _with_filename(code: CodeType, filename: str) -> CodeType:
+    """Set the filename of a code object and the code objects nested in
+    it (functions, classes, comprehensions)."""
+    consts = tuple(
+        _with_filename(const, filename)
+        if isinstance(const, type(code))
+        else const
+        for const in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def _default_directory() -> Optional[str]:
+    directory = os.environ.get("MARIMO_COMPILE_CACHE_DIR")
+    if directory is not None:
+        # An empty value disables the on-disk cache
+        return directory or None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "marimo", "compiled")
+
+
+_compile_cache: Optional[CompileCache] = None
+
+
+def get_compile_cache() -> CompileCache:
+    global _compile_cache
+    if _compile_cache is None:
+        _compile_cache = CompileCache(_default_directory())
+    return _compile_cache
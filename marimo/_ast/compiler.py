@@ -20,6 +20,11 @@ from marimo._ast.cell import (
     ImportWorkspace,
     SourcePosition,
 )
+from marimo._ast.compile_cache import (
+    CompiledCell,
+    cache_key,
+    get_compile_cache,
+)
 from marimo._ast.visitor import ImportData, Name, ScopedVisitor
 from marimo._utils.tmpdir import get_tmpdir
 from marimo._utils.variables import is_local
@@ -130,12 +135,34 @@ def compile_cell(
             cell_id=cell_id,
         )
 
+    filename: str
+    if source_position:
+        filename = source_position.filename
+    else:
+        # store the cell's code in Python's linecache so debuggers can find it
+        filename = get_filename(cell_id)
+        # cache the entire cell's code, doesn't need to be done in source case
+        # since there is an actual file to read from.
+        cache(filename, code)
+
+    # Assertion rewriting depends on the installed pytest, so those cells
+    # aren't cached
+    compile_cache = None if test_rewrite else get_compile_cache()
+    key = cache_key(code, cell_id, source_position)
+    compiled = (
+        compile_cache.get(key, filename) if compile_cache is not None else None
+    )
+
     is_import_block = all(
         isinstance(stmt, (ast.Import, ast.ImportFrom)) for stmt in module.body
     )
 
-    v = ScopedVisitor("cell_" + cell_id)
-    v.visit(module)
+    # The visitor runs over the whole cell, before the final expression is
+    # split off of it
+    visitor: Optional[ScopedVisitor] = None
+    if compiled is None:
+        visitor = ScopedVisitor("cell_" + cell_id)
+        visitor.visit(module)
 
     expr: ast.Expression
     final_expr = module.body[-1]
@@ -154,19 +181,65 @@ def compile_cell(
     expr.col_offset = final_expr.end_col_offset
     expr.end_col_offset = final_expr.end_col_offset
 
-    filename: str
     if source_position:
         # Modify the "source" position for meaningful stacktraces
         fix_source_position(module, source_position)
         fix_source_position(expr, source_position)
-        filename = source_position.filename
-    else:
-        # store the cell's code in Python's linecache so debuggers can find it
-        filename = get_filename(cell_id)
-        # cache the entire cell's code, doesn't need to be done in source case
-        # since there is an actual file to read from.
-        cache(filename, code)
 
+    if compiled is None:
+        assert visitor is not None
+        compiled = _compile(
+            code, module, expr, visitor, filename, test_rewrite
+        )
+        if compile_cache is not None:
+            compile_cache.put(key, compiled)
+
+    # If this cell is an import cell, we carry over any imports in
+    # `carried_imports` that are also in this cell to the import workspace's
+    # definitions.
+    imported_defs: set[Name] = set()
+    if is_import_block and carried_imports is not None:
+        for data in compiled.variable_data.values():
+            for datum in data:
+                import_data = datum.import_data
+                if import_data is None:
+                    continue
+                for previous_import_data in carried_imports:
+                    if previous_import_data == import_data:
+                        imported_defs.add(import_data.definition)
+
+    return CellImpl(
+        # keyed by original (user) code, for cache lookups
+        key=code_key(code),
+        code=code,
+        mod=module,
+        # Copied, since cached results are shared between cells
+        defs=set(compiled.defs),
+        refs=set(compiled.refs),
+        temporaries=set(compiled.temporaries),
+        variable_data=dict(compiled.variable_data),
+        import_workspace=ImportWorkspace(
+            is_import_block=is_import_block,
+            imported_defs=imported_defs,
+        ),
+        deleted_refs=set(compiled.deleted_refs),
+        language=compiled.language,
+        body=compiled.body,
+        last_expr=compiled.last_expr,
+        cell_id=cell_id,
+    )
+
+
+def _compile(
+    code: str,
+    module: ast.Module,
+    expr: ast.Expression,
+    v: ScopedVisitor,
+    filename: str,
+    test_rewrite: bool,
+) -> CompiledCell:
+    """Compile a cell's module and final expression, given the results of
+    visiting the cell."""
     # pytest assertion rewriting, gives more context for assertion failures.
     if test_rewrite:
         # pytest is not required, so fail gracefully if needed
@@ -193,39 +266,15 @@ def compile_cell(
         for name in nonlocals
         if name in v.variable_data
     }
-
-    # If this cell is an import cell, we carry over any imports in
-    # `carried_imports` that are also in this cell to the import workspace's
-    # definitions.
-    imported_defs: set[Name] = set()
-    if is_import_block and carried_imports is not None:
-        for data in variable_data.values():
-            for datum in data:
-                import_data = datum.import_data
-                if import_data is None:
-                    continue
-                for previous_import_data in carried_imports:
-                    if previous_import_data == import_data:
-                        imported_defs.add(import_data.definition)
-
-    return CellImpl(
-        # keyed by original (user) code, for cache lookups
-        key=code_key(code),
-        code=code,
-        mod=module,
+    return CompiledCell(
+        body=body,
+        last_expr=last_expr,
         defs=nonlocals,
         refs=v.refs,
         temporaries=temporaries,
         variable_data=variable_data,
-        import_workspace=ImportWorkspace(
-            is_import_block=is_import_block,
-            imported_defs=imported_defs,
-        ),
         deleted_refs=v.deleted_refs,
         language=v.language,
-        body=body,
-        last_expr=last_expr,
-        cell_id=cell_id,
     )
 
 
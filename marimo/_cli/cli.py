@@ -12,7 +12,6 @@ import click
 
 import marimo._cli.cli_validators as validators
 from marimo import __version__, _loggers
-from marimo._ast import codegen
 from marimo._cli.config.commands import config
 from marimo._cli.convert.commands import convert
 from marimo._cli.development.commands import development
@@ -26,9 +25,7 @@ from marimo._cli.run_docker import (
 )
 from marimo._cli.upgrade import check_for_updates, print_latest_version
 from marimo._config.settings import GLOBAL_SETTINGS
-from marimo._server.file_router import AppFileRouter
 from marimo._server.model import SessionMode
-from marimo._server.start import start
 from marimo._server.tokens import AuthToken
 from marimo._tutorials import (
     Tutorial,
@@ -303,7 +300,10 @@ def edit(
     name: Optional[str],
     args: tuple[str, ...],
 ) -> None:
+    from marimo._ast import codegen
     from marimo._cli.sandbox import prompt_run_in_sandbox
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
 
     # If file is a url, we prompt to run in docker
     # We only do this for remote files,
@@ -455,6 +455,9 @@ def new(
         run_in_sandbox(sys.argv[1:], None)
         return
 
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+
     start(
         file_router=AppFileRouter.new_file(),
         development_mode=GLOBAL_SETTINGS.DEVELOPMENT_MODE,
@@ -544,6 +547,39 @@ Example:
         "Seconds to wait before closing a session on " "websocket disconnect."
     ),
 )
+@click.option(
+    "--max-sessions",
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of concurrent sessions. When reached, the least "
+        "recently used disconnected session is closed to make room; if "
+        "every session is connected, new viewers are asked to retry later."
+    ),
+)
+@click.option(
+    "--max-kernel-memory",
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Memory budget in megabytes for the server and its kernels. When "
+        "exceeded, the least recently used disconnected session is closed "
+        "before a new one is started."
+    ),
+)
+@click.option(
+    "--cache-initial-render",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    type=bool,
+    help=(
+        "Run the app once and serve its initial outputs to new viewers, "
+        "starting a kernel for a viewer only when they interact with the "
+        "app. Outputs that differ between runs (random numbers, the current "
+        "time) are shared by every viewer until they interact."
+    ),
+)
 @click.option(
     "--watch",
     is_flag=True,
@@ -597,6 +633,9 @@ def run(
     token_password: Optional[str],
     include_code: bool,
     session_ttl: int,
+    max_sessions: Optional[int],
+    max_kernel_memory: Optional[int],
+    cache_initial_render: bool,
     watch: bool,
     base_url: str,
     allow_origins: tuple[str, ...],
@@ -605,7 +644,10 @@ def run(
     name: str,
     args: tuple[str, ...],
 ) -> None:
+    from marimo._ast import codegen
     from marimo._cli.sandbox import prompt_run_in_sandbox
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
 
     # If file is a url, we prompt to run in docker
     # We only do this for remote files,
@@ -646,6 +688,13 @@ def run(
         mode=SessionMode.RUN,
         include_code=include_code,
         ttl_seconds=session_ttl,
+        max_sessions=max_sessions,
+        max_kernel_memory=(
+            max_kernel_memory * 1024 * 1024
+            if max_kernel_memory is not None
+            else None
+        ),
+        cache_initial_render=cache_initial_render,
         watch=watch,
         base_url=base_url,
         allow_origins=allow_origins,
@@ -662,6 +711,8 @@ def run(
     type=click.Path(exists=True, file_okay=True, dir_okay=False),
 )
 def recover(name: str) -> None:
+    from marimo._ast import codegen
+
     click.echo(codegen.recover(name))
 
 
@@ -738,6 +789,9 @@ def tutorial(
     token_password: Optional[str],
     name: Tutorial,
 ) -> None:
+    from marimo._server.file_router import AppFileRouter
+    from marimo._server.start import start
+
     temp_dir = tempfile.TemporaryDirectory()
     path = create_temp_tutorial_file(name, temp_dir)
 
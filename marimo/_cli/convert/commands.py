@@ -5,10 +5,7 @@ from pathlib import Path
 
 import click
 
-from marimo._cli.convert.markdown import convert_from_md
-from marimo._cli.convert.utils import load_external_file
 from marimo._cli.print import echo
-from marimo._convert.ipynb import convert_from_ipynb
 from marimo._utils.paths import maybe_make_dirs
 
 
@@ -54,10 +51,16 @@ def convert(
     if ext not in (".ipynb", ".md", ".qmd"):
         raise click.UsageError("File must be an .ipynb or .md file")
 
+    from marimo._cli.convert.utils import load_external_file
+
     text = load_external_file(filename, ext)
     if ext == ".ipynb":
+        from marimo._convert.ipynb import convert_from_ipynb
+
         notebook = convert_from_ipynb(text)
     else:
+        from marimo._cli.convert.markdown import convert_from_md
+
         assert ext in (".md", ".qmd")
         notebook = convert_from_md(text)
 
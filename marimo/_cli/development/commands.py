@@ -19,6 +19,7 @@ def _generate_schema() -> dict[str, Any]:
     from starlette.schemas import SchemaGenerator
 
     import marimo._data.models as data
+    import marimo._messaging.cell_profile as cell_profile
     import marimo._messaging.errors as errors
     import marimo._messaging.ops as ops
     import marimo._runtime.requests as requests
@@ -95,6 +96,9 @@ def _generate_schema() -> dict[str, Any]:
         ops.VariableValues,
         ops.Datasets,
         ops.DataColumnPreview,
+        cell_profile.CellAllocation,
+        cell_profile.CellProfile,
+        ops.CellProfiles,
         ops.QueryParamsSet,
         ops.QueryParamsAppend,
         ops.QueryParamsDelete,
@@ -151,6 +155,7 @@ def _generate_schema() -> dict[str, Any]:
         models.InstantiateRequest,
         models.OpenFileRequest,
         models.ReadCodeResponse,
+        models.CellProfilesResponse,
         models.RenameFileRequest,
         models.RunRequest,
         models.RunScratchpadRequest,
@@ -172,6 +177,7 @@ def _generate_schema() -> dict[str, Any]:
         requests.FunctionCallRequest,
         requests.InstallMissingPackagesRequest,
         requests.PreviewDatasetColumnRequest,
+        requests.PreviewVariablesRequest,
         requests.RenameRequest,
         requests.SetCellConfigRequest,
         requests.SetUserConfigRequest,
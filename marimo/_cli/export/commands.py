@@ -4,28 +4,19 @@ from __future__ import annotations
 import asyncio
 import os
 from pathlib import Path
-from typing import Callable, Literal, Optional
+from typing import TYPE_CHECKING, Callable, Literal, Optional
 
 import click
 
 from marimo._cli.parse_args import parse_args
 from marimo._cli.print import echo, green
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._server.export import (
-    ExportResult,
-    export_as_ipynb,
-    export_as_md,
-    export_as_script,
-    export_as_wasm,
-    run_app_then_export_as_html,
-    run_app_then_export_as_ipynb,
-)
-from marimo._server.export.exporter import Exporter
-from marimo._server.utils import asyncio_run
-from marimo._utils.file_watcher import FileWatcher
 from marimo._utils.marimo_path import MarimoPath
 from marimo._utils.paths import maybe_make_dirs
 
+if TYPE_CHECKING:
+    from marimo._server.export import ExportResult
+
 _watch_message = (
     "Watch notebook for changes and regenerate the output on modification. "
     "If watchdog is installed, it will be used to watch the file. "
@@ -50,6 +41,9 @@ def watch_and_export(
             + "an output file with --output."
         )
 
+    from marimo._server.utils import asyncio_run
+    from marimo._utils.file_watcher import FileWatcher
+
     def write_data(data: str) -> None:
         if output:
             # Make dirs if needed
@@ -166,6 +160,9 @@ def html(
         run_in_sandbox(sys.argv[1:], name)
         return
 
+    from marimo._server.export import run_app_then_export_as_html
+    from marimo._server.utils import asyncio_run
+
     cli_args = parse_args(args)
 
     def export_callback(file_path: MarimoPath) -> ExportResult:
@@ -224,6 +221,8 @@ def script(
     Export a marimo notebook as a flat script, in topological order.
     """
 
+    from marimo._server.export import export_as_script
+
     def export_callback(file_path: MarimoPath) -> ExportResult:
         return export_as_script(file_path)
 
@@ -274,6 +273,8 @@ def md(
     Export a marimo notebook as a code fenced markdown document.
     """
 
+    from marimo._server.export import export_as_md
+
     def export_callback(file_path: MarimoPath) -> ExportResult:
         return export_as_md(file_path)
 
@@ -367,6 +368,12 @@ def ipynb(
         run_in_sandbox(sys.argv[1:], name)
         return
 
+    from marimo._server.export import (
+        export_as_ipynb,
+        run_app_then_export_as_ipynb,
+    )
+    from marimo._server.utils import asyncio_run
+
     def export_callback(file_path: MarimoPath) -> ExportResult:
         if include_outputs:
             return asyncio_run(
@@ -444,6 +451,9 @@ def html_wasm(
         filename = os.path.basename(output)
         ignore_index_html = True
 
+    from marimo._server.export import export_as_wasm
+    from marimo._server.export.exporter import Exporter
+
     marimo_file = MarimoPath(name)
 
     def export_callback(file_path: MarimoPath) -> ExportResult:
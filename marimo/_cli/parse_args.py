@@ -4,11 +4,11 @@ from __future__ import annotations
 import sys
 from typing import TYPE_CHECKING, Any
 
-from marimo._runtime.requests import SerializedCLIArgs
-
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from marimo._runtime.requests import SerializedCLIArgs
+
 
 def parse_args(
     args: Iterable[str],
@@ -13,6 +13,7 @@ class GlobalSettings:
     YES: bool = False
     CHECK_STATUS_UPDATE: bool = False
     TRACING: bool = os.getenv("MARIMO_TRACING", "false") in ("true", "1")
+    METRICS: bool = os.getenv("MARIMO_METRICS", "false") in ("true", "1")
     PROFILE_DIR: str | None = None
     LOG_LEVEL: int = logging.WARNING
     MANAGE_SCRIPT_METADATA: bool = os.getenv(
@@ -1,7 +1,8 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import List, Optional, cast
+import weakref
+from typing import Any, Dict, Hashable, List, Optional, Tuple, cast
 
 from marimo import _loggers
 from marimo._data.models import DataTable, DataTableColumn, DataType
@@ -9,6 +10,13 @@ from marimo._plugins.ui._impl.tables.utils import get_table_manager_or_none
 
 LOGGER = _loggers.marimo_logger()
 
+# Columns of dataframes that were already introspected, keyed by id(); each
+# entry holds a weak reference to its dataframe, so that entries are dropped
+# when the dataframe is garbage collected (dataframes are generally not
+# hashable, so a WeakKeyDictionary can't be used).
+_ColumnsCacheEntry = Tuple["weakref.ref[Any]", Hashable, List[DataTableColumn]]
+_COLUMNS_CACHE: Dict[int, _ColumnsCacheEntry] = {}
+
 
 def get_datasets_from_variables(
     variables: List[tuple[str, object]],
@@ -28,19 +36,37 @@ def _get_data_table(value: object, variable_name: str) -> Optional[DataTable]:
         if table is None:
             return None
 
-        columns = [
-            DataTableColumn(
-                name=column_name,
-                type=column_type[0],
-                external_type=column_type[1],
-                sample_values=table.get_sample_values(column_name),
-            )
-            for column_name, column_type in table.get_field_types()
-        ]
+        # Don't count the rows of lazy frames, which can be expensive
+        num_rows = table.get_num_rows(force=False)
+        # Cheap fingerprint of the dataframe's shape and schema, used to
+        # detect that a cached dataframe was mutated
+        field_types = table.get_field_types()
+        version = (num_rows, tuple(field_types))
+
+        key = id(value)
+        cached = _COLUMNS_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0]() is value
+            and cached[1] == version
+        ):
+            columns = cached[2]
+        else:
+            columns = [
+                DataTableColumn(
+                    name=column_name,
+                    type=column_type[0],
+                    external_type=column_type[1],
+                    sample_values=table.get_sample_values(column_name),
+                )
+                for column_name, column_type in field_types
+            ]
+            _cache_columns(value, version, columns)
+
         return DataTable(
             name=variable_name,
             variable_name=variable_name,
-            num_rows=table.get_num_rows(force=False),
+            num_rows=num_rows,
             num_columns=table.get_num_columns(),
             source_type="local",
             source="memory",
@@ -55,6 +81,24 @@ def _get_data_table(value: object, variable_name: str) -> Optional[DataTable]:
         return None
 
 
+def _cache_columns(
+    value: object, version: Hashable, columns: List[DataTableColumn]
+) -> None:
+    key = id(value)
+
+    def evict(ref: weakref.ref[Any]) -> None:
+        entry = _COLUMNS_CACHE.get(key)
+        if entry is not None and entry[0] is ref:
+            del _COLUMNS_CACHE[key]
+
+    try:
+        ref = weakref.ref(value, evict)
+    except TypeError:
+        # Not weak-referenceable; don't cache
+        return
+    _COLUMNS_CACHE[key] = (ref, version, columns)
+
+
 def has_updates_to_datasource(query: str) -> bool:
     import duckdb  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
 
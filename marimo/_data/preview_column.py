@@ -1,7 +1,9 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import Any, Optional
+import json
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 from marimo import _loggers
 from marimo._data.charts import get_chart_builder
@@ -19,15 +21,31 @@ from marimo._runtime.requests import PreviewDatasetColumnRequest
 
 LOGGER = _loggers.marimo_logger()
 
+# Columns with more rows than this are charted from an evenly spaced
+# sample of their rows
+CHART_MAX_ROWS = 20_000
+
+# Previews of dataframe columns, keyed by (table name, column name); each
+# entry holds a weak reference to its dataframe and the dataframe's version
+# when the preview was computed
+_PREVIEW_CACHE_MAX_SIZE = 64
+_PreviewCacheEntry = Tuple["weakref.ref[Any]", Hashable, DataColumnPreview]
+_PREVIEW_CACHE: Dict[Tuple[str, str], _PreviewCacheEntry] = {}
+
 
 def get_column_preview_dataframe(
     item: object,
     request: PreviewDatasetColumnRequest,
+    on_partial_preview: Optional[Callable[[DataColumnPreview], None]] = None,
 ) -> DataColumnPreview | None:
     """
     Get a preview of the column in the dataset.
 
     This may return a chart and a aggregation summary of the column.
+
+    Previews are cached until the dataset changes. For large columns, the
+    chart is built from a sample of the rows, and `on_partial_preview`
+    (if provided) is called with the summary before the chart is built.
     """
     column_name = request.column_name
     table_name = request.table_name
@@ -35,7 +53,20 @@ def get_column_preview_dataframe(
         table = get_table_manager_or_none(item)
         if table is None:
             return None
-        if table.get_num_rows(force=True) == 0:
+
+        # Cheap fingerprint of the dataframe's shape and schema; doesn't
+        # count the rows of lazy frames
+        version = (
+            table.get_num_rows(force=False),
+            tuple(table.get_field_types()),
+        )
+        cache_key = (table_name, column_name)
+        cached = _PREVIEW_CACHE.get(cache_key)
+        if cached is not None and cached[0]() is item and cached[1] == version:
+            return cached[2]
+
+        num_rows = table.get_num_rows(force=True)
+        if num_rows == 0:
             return DataColumnPreview(
                 table_name=table_name,
                 column_name=column_name,
@@ -79,10 +110,23 @@ def get_column_preview_dataframe(
         chart_spec = None
         chart_code = None
 
+        sample_step = 1
+        if num_rows is not None and num_rows > CHART_MAX_ROWS:
+            sample_step = -(-num_rows // CHART_MAX_ROWS)
+
         if error is None:
+            if sample_step > 1 and on_partial_preview is not None:
+                # Charting a large column is slow; send the summary first
+                on_partial_preview(
+                    DataColumnPreview(
+                        table_name=table_name,
+                        column_name=column_name,
+                        summary=summary,
+                    )
+                )
             try:
                 chart_spec, chart_code, chart_max_rows_errors = (
-                    _get_altair_chart(request, table, summary)
+                    _get_altair_chart(request, table, summary, sample_step)
                 )
             except Exception as e:
                 error = str(e)
@@ -93,7 +137,7 @@ def get_column_preview_dataframe(
                     exc_info=e,
                 )
 
-        return DataColumnPreview(
+        preview = DataColumnPreview(
             table_name=table_name,
             column_name=column_name,
             chart_max_rows_errors=chart_max_rows_errors,
@@ -102,6 +146,8 @@ def get_column_preview_dataframe(
             summary=summary,
             error=error,
         )
+        _cache_preview(cache_key, item, version, preview)
+        return preview
     except Exception as e:
         LOGGER.warning(
             "Failed to get preview for column %s in table %s",
@@ -116,6 +162,24 @@ def get_column_preview_dataframe(
         )
 
 
+def _cache_preview(
+    key: Tuple[str, str],
+    item: object,
+    version: Hashable,
+    preview: DataColumnPreview,
+) -> None:
+    try:
+        ref = weakref.ref(item)
+    except TypeError:
+        # Not weak-referenceable; don't cache
+        return
+    _PREVIEW_CACHE.pop(key, None)
+    if len(_PREVIEW_CACHE) >= _PREVIEW_CACHE_MAX_SIZE:
+        # Evict the oldest entry
+        del _PREVIEW_CACHE[next(iter(_PREVIEW_CACHE))]
+    _PREVIEW_CACHE[key] = (ref, version, preview)
+
+
 def get_column_preview_for_sql(
     table_name: str,
     column_name: str,
@@ -162,6 +226,7 @@ def _get_altair_chart(
     request: PreviewDatasetColumnRequest,
     table: TableManager[Any],
     summary: ColumnSummary,
+    sample_step: int = 1,
 ) -> tuple[Optional[str], Optional[str], bool]:
     # We require altair to render the chart
     if not DependencyManager.altair.has() or not table.supports_altair():
@@ -194,8 +259,11 @@ def _get_altair_chart(
     )
 
     chart_max_rows_errors = False
+    sampled = False
     try:
         column_data = table.select_columns([request.column_name]).data
+        if sample_step > 1:
+            column_data, sampled = _sample_rows(column_data, sample_step)
         # Date types don't serialize well to csv,
         # so we don't transform them
         if (
@@ -219,4 +287,36 @@ def _get_altair_chart(
         chart_json = None
         chart_max_rows_errors = True
 
+    if chart_json is not None and sampled:
+        chart_json = _label_sampled_chart(chart_json, sample_step)
+
     return chart_json, code, chart_max_rows_errors
+
+
+def _label_sampled_chart(chart_json: str, sample_step: int) -> str:
+    """Note on the chart that its counts are from a sample of the rows."""
+    spec = json.loads(chart_json)
+    label = f"Sample of 1 in {sample_step:,} rows"
+    title = spec.get("title")
+    if isinstance(title, dict):
+        title["subtitle"] = label
+    elif title:
+        spec["title"] = {"text": title, "subtitle": label}
+    else:
+        spec["title"] = label
+    return json.dumps(spec)
+
+
+def _sample_rows(data: Any, step: int) -> tuple[Any, bool]:
+    """Take every `step`-th row of the data, if it is a narwhals frame.
+
+    Returns the data, and whether it was sampled.
+    """
+    if not DependencyManager.narwhals.has():
+        return data, False
+
+    import narwhals.stable.v1 as nw
+
+    if isinstance(data, (nw.DataFrame, nw.LazyFrame)):
+        return data.gather_every(step), True
+    return data, False
@@ -1,12 +1,61 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import importlib
 import importlib.metadata
 import importlib.util
+import os
 import shutil
 import sys
+import time
 from dataclasses import dataclass
 
+# How often to check whether sys.path's directories have changed (e.g.,
+# because a package was installed), in seconds
+_RECHECK_INTERVAL = 1.0
+
+
+class _ProbeCache:
+    """Results of Dependency.has, which is called on hot paths.
+
+    Results are invalidated when sys.path changes, when one of its
+    directories is modified, or explicitly with `invalidate`.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[str, bool] = {}
+        self._sys_path: list[str] = []
+        self._mtimes: tuple[int, ...] = ()
+        self._checked_at = 0.0
+
+    @staticmethod
+    def _path_mtimes() -> tuple[int, ...]:
+        mtimes: list[int] = []
+        for entry in sys.path:
+            try:
+                mtimes.append(os.stat(entry or ".").st_mtime_ns)
+            except OSError:
+                mtimes.append(-1)
+        return tuple(mtimes)
+
+    def validate(self) -> None:
+        now = time.monotonic()
+        if sys.path != self._sys_path:
+            self.invalidate()
+        elif now - self._checked_at >= _RECHECK_INTERVAL:
+            self._checked_at = now
+            if self._path_mtimes() != self._mtimes:
+                self.invalidate()
+
+    def invalidate(self) -> None:
+        self.results.clear()
+        self._sys_path = list(sys.path)
+        self._mtimes = self._path_mtimes()
+        self._checked_at = time.monotonic()
+
+
+_PROBE_CACHE = _ProbeCache()
+
 
 @dataclass
 class Dependency:
@@ -16,6 +65,16 @@ class Dependency:
 
     def has(self) -> bool:
         """Return True if the dependency is installed."""
+        _PROBE_CACHE.validate()
+        cached = _PROBE_CACHE.results.get(self.pkg)
+        # Modules can be added to sys.modules without being on sys.path
+        if cached is not None and (cached or self.pkg not in sys.modules):
+            return cached
+        has_dep = self._find()
+        _PROBE_CACHE.results[self.pkg] = has_dep
+        return has_dep
+
+    def _find(self) -> bool:
         try:
             has_dep = importlib.util.find_spec(self.pkg) is not None
             if not has_dep:
@@ -183,6 +242,15 @@ class DependencyManager:
         """
         return Dependency(pkg).imported()
 
+    @staticmethod
+    def invalidate_caches() -> None:
+        """Forget which packages are installed.
+
+        Should be called after installing or uninstalling packages.
+        """
+        importlib.invalidate_caches()
+        _PROBE_CACHE.invalidate()
+
     @staticmethod
     def which(pkg: str) -> bool:
         """
@@ -0,0 +1,40 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Specification of the resources used by a cell's execution"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from marimo._ast.cell import CellId_t
+
+
+@dataclass
+class CellAllocation:
+    """Memory allocated by a line of code while a cell ran."""
+
+    filename: str
+    lineno: int
+    # Net bytes allocated
+    size: int
+    # Net number of blocks allocated
+    count: int
+
+
+@dataclass
+class CellProfile:
+    """Resources used by a single execution of a cell."""
+
+    cell_id: CellId_t
+    # Seconds spent executing the cell
+    wall_time: float
+    # Seconds of CPU time used by the kernel thread executing the cell
+    cpu_time: float
+    # Increase of the process's peak resident set size, in bytes; None
+    # on platforms that don't report it
+    peak_rss_delta: Optional[int] = None
+    # Seconds spent in each post-execution hook (formatting outputs,
+    # broadcasting variables and datasets, ...), keyed by hook name
+    post_execution_hooks: Dict[str, float] = field(default_factory=dict)
+    # Top allocations, when tracemalloc is tracing
+    allocations: Optional[List[CellAllocation]] = None
@@ -7,8 +7,10 @@ Messages that the kernel sends to the frontend.
 from __future__ import annotations
 
 import json
+import reprlib
 import sys
 import time
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from types import ModuleType
 from typing import (
@@ -31,6 +33,7 @@ from marimo._ast.cell import CellConfig, CellId_t, RuntimeStateType
 from marimo._data.models import ColumnSummary, DataTable, DataTableSource
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.cell_profile import CellProfile
 from marimo._messaging.completion_option import CompletionOption
 from marimo._messaging.context import RUN_ID_CTX, RunId_t
 from marimo._messaging.errors import (
@@ -44,8 +47,6 @@ from marimo._messaging.types import Stream
 from marimo._output.hypertext import Html
 from marimo._plugins.core.json_encoder import WebComponentEncoder
 from marimo._plugins.core.web_component import JSONType
-from marimo._plugins.ui._core.ui_element import UIElement
-from marimo._plugins.ui._impl.tables.utils import get_table_manager_or_none
 from marimo._runtime.context import get_context
 from marimo._runtime.context.utils import get_mode
 from marimo._runtime.layout.layout import LayoutConfig
@@ -502,6 +503,25 @@ class VariableDeclaration:
     used_by: List[CellId_t]
 
 
+# Maximum length of a variable's preview
+VARIABLE_PREVIEW_MAX_LENGTH = 50
+
+# Containers are previewed from a sample of their elements, so that the
+# preview's cost doesn't depend on their size
+_CONTAINER_TYPES = (list, tuple, dict, set, frozenset, deque)
+_PREVIEW_REPR = reprlib.Repr()
+_PREVIEW_REPR.maxlevel = 2
+_PREVIEW_REPR.maxlist = 10
+_PREVIEW_REPR.maxtuple = 10
+_PREVIEW_REPR.maxdict = 5
+_PREVIEW_REPR.maxset = 10
+_PREVIEW_REPR.maxfrozenset = 10
+_PREVIEW_REPR.maxdeque = 10
+_PREVIEW_REPR.maxstring = VARIABLE_PREVIEW_MAX_LENGTH
+_PREVIEW_REPR.maxlong = VARIABLE_PREVIEW_MAX_LENGTH
+_PREVIEW_REPR.maxother = VARIABLE_PREVIEW_MAX_LENGTH
+
+
 @dataclass
 class VariableValue:
     name: str
@@ -509,8 +529,13 @@ class VariableValue:
     datatype: Optional[str]
 
     def __init__(
-        self, name: str, value: object, datatype: Optional[str] = None
+        self,
+        name: str,
+        value: object,
+        datatype: Optional[str] = None,
+        preview: bool = True,
     ) -> None:
+        """A variable's type and, if `preview`, a bounded preview of it."""
         self.name = name
 
         # Defensively try-catch attribute accesses, which could raise
@@ -526,28 +551,41 @@ class VariableValue:
         else:
             self.datatype = datatype
 
+        # Only values that weren't previewed are None, so that clients can
+        # tell them apart from values whose preview failed
+        if not preview:
+            self.value = None
+            return
+
         try:
             self.value = self._format_value(value)
         except Exception:
-            self.value = None
+            self.value = "<UNKNOWN>"
 
     def _stringify(self, value: object) -> str:
+        # UI plugins depend on this module, so they're imported lazily
+        from marimo._plugins.ui._impl.tables.utils import (
+            get_table_manager_or_none,
+        )
+
         try:
             # HACK: We pretty-print tables to avoid str(ibis_table)
             # which can be very slow when `ibis.options.interactive = True`
             table_manager = get_table_manager_or_none(value)
             if table_manager is not None:
                 return str(table_manager)
+            elif type(value) in _CONTAINER_TYPES:
+                return _PREVIEW_REPR.repr(value)[:VARIABLE_PREVIEW_MAX_LENGTH]
             else:
-                return str(value)[:50]
-
-            return str(value)[:50]
+                return str(value)[:VARIABLE_PREVIEW_MAX_LENGTH]
         except BaseException:
             # Catch-all: some libraries like Polars have bugs and raise
             # BaseExceptions, which shouldn't crash the kernel
             return "<UNKNOWN>"
 
     def _format_value(self, value: object) -> str:
+        from marimo._plugins.ui._core.ui_element import UIElement
+
         resolved = value
         if isinstance(value, UIElement):
             resolved = value.value
@@ -568,7 +606,11 @@ class Variables(Op):
 
 @dataclass
 class VariableValues(Op):
-    """List of variables and their types/values."""
+    """List of variables and their types/values.
+
+    After a cell runs, only the types of its definitions are sent; previews
+    are sent in response to a PreviewVariablesRequest.
+    """
 
     name: ClassVar[str] = "variable-values"
     variables: List[VariableValue]
@@ -597,6 +639,14 @@ class DataColumnPreview(Op):
     summary: Optional[ColumnSummary] = None
 
 
+@dataclass
+class CellProfiles(Op):
+    """Profiles of the cells run by the kernel's latest run."""
+
+    name: ClassVar[str] = "cell-profiles"
+    profiles: List[CellProfile]
+
+
 @dataclass
 class QueryParamsSet(Op):
     """Set query parameters."""
@@ -684,6 +734,8 @@ MessageOperation = Union[
     # Datasets
     Datasets,
     DataColumnPreview,
+    # Profiling
+    CellProfiles,
     # Kiosk specific
     FocusCell,
     UpdateCellCodes,
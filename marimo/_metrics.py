@@ -0,0 +1,347 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Counters and histograms exposed at the /metrics endpoint.
+
+Metrics are opt-in: they are only recorded when MARIMO_METRICS is set, and
+are rendered in the OpenMetrics text format. Recording is a dictionary
+update under a lock, so instrumenting hot paths is cheap.
+
+Metrics live in the server process. In run mode, kernels are threads of the
+server, so kernel metrics (e.g. cell execution latency) are included. In edit
+mode, kernels run in their own process: their metrics are not collected, and
+only per-process resource usage (memory, CPU) is read at scrape time.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Dict, Iterable, List, Literal, Sequence, Tuple
+
+from marimo._config.settings import GLOBAL_SETTINGS
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+MetricType = Literal["counter", "gauge", "histogram"]
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class Metric:
+    type: MetricType
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Expected labels {self.labelnames} for {self.name}, "
+                f"got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(
+        self, values: LabelValues, extra: Sequence[Tuple[str, str]] = ()
+    ) -> str:
+        pairs = list(zip(self.labelnames, values)) + list(extra)
+        if not pairs:
+            return ""
+        return (
+            "{"
+            + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+            + "}"
+        )
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        lines = [
+            f"# TYPE {self.name} {self.type}",
+            f"# HELP {self.name} {_escape(self.documentation)}",
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """A monotonically increasing value, e.g. a number of requests."""
+
+    type: MetricType = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if not METRICS.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}_total{self._format_labels(key)} "
+            f"{_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Metric):
+    """A value that can go up and down, e.g. a queue depth."""
+
+    type: MetricType = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        if not METRICS.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if not METRICS.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram(Metric):
+    """The distribution of observed values, e.g. latencies in seconds."""
+
+    type: MetricType = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: count in each bucket (non-cumulative, with a
+        # last bucket for +Inf), and the sum of observations
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not METRICS.enabled:
+            return
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._label_values(labels), []))
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = [
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            ]
+        lines: List[str] = []
+        for key, counts, total in values:
+            cumulative = 0
+            bounds = [*self.buckets, math.inf]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                labels = self._format_labels(key, [("le", le)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = self._format_labels(key)
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.enabled = GLOBAL_SETTINGS.METRICS
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def expose(self, extra: Iterable[Metric] = ()) -> str:
+        """Render the registered metrics, and `extra` metrics collected
+        at scrape time, in the OpenMetrics text format."""
+        metrics = [*self._metrics.values(), *extra]
+        return "\n".join(metric.expose() for metric in metrics) + "\n# EOF\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+METRICS = MetricsRegistry()
+
+# Sessions
+SESSIONS_CREATED = METRICS.counter(
+    "marimo_sessions_created", "Sessions created.", ["mode"]
+)
+SESSIONS_CLOSED = METRICS.counter(
+    "marimo_sessions_closed", "Sessions closed.", ["mode"]
+)
+SESSIONS_EVICTED = METRICS.counter(
+    "marimo_sessions_evicted",
+    "Idle run-mode sessions closed to stay within the kernel budget.",
+)
+CONTROL_REQUESTS = METRICS.counter(
+    "marimo_control_requests",
+    "Control requests sent to kernels.",
+    ["request"],
+)
+KERNEL_MESSAGES = METRICS.counter(
+    "marimo_kernel_messages", "Messages received from kernels.", ["op"]
+)
+KERNEL_MESSAGE_BYTES = METRICS.counter(
+    "marimo_kernel_message_bytes",
+    "Encoded size of the messages received from kernels.",
+)
+
+# Websockets
+BROADCAST_OPERATIONS = METRICS.counter(
+    "marimo_broadcast_operations",
+    "Operations broadcast by the server to the consumers of a session.",
+    ["op"],
+)
+WEBSOCKET_MESSAGES_SENT = METRICS.counter(
+    "marimo_websocket_messages_sent", "Operations sent over websockets."
+)
+WEBSOCKET_FRAMES_SENT = METRICS.counter(
+    "marimo_websocket_frames_sent",
+    "Websocket frames sent; several operations may share a batched frame.",
+)
+WEBSOCKET_BYTES_SENT = METRICS.counter(
+    "marimo_websocket_bytes_sent", "Bytes sent over websockets."
+)
+WEBSOCKET_RESYNCS = METRICS.counter(
+    "marimo_websocket_resyncs",
+    "Websocket consumers resynced with their session after falling behind.",
+)
+
+# Kernel runner
+CELL_EXECUTION_SECONDS = METRICS.histogram(
+    "marimo_cell_execution_seconds",
+    "Wall time to execute a cell, in seconds (run mode only).",
+)
+
+# Caches
+CACHE_LOOKUPS = METRICS.counter(
+    "marimo_cache_lookups",
+    "Cache lookups, by cache and result (hit, partial or miss).",
+    ["cache", "result"],
+)
+
+# Virtual files
+VIRTUAL_FILES = METRICS.gauge(
+    "marimo_virtual_files", "Virtual files in the registry.", ["storage"]
+)
+VIRTUAL_FILE_BYTES = METRICS.counter(
+    "marimo_virtual_file_bytes",
+    "Bytes written to virtual files.",
+    ["storage"],
+)
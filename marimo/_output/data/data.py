@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import base64
 import io
-from typing import Union
+from typing import IO, Callable, Union
 
 from marimo._plugins.core.media import is_data_empty
 from marimo._runtime.virtual_file import (
     EMPTY_VIRTUAL_FILE,
+    SpilledVirtualFileLifecycleItem,
     VirtualFile,
     VirtualFileLifecycleItem,
 )
@@ -161,6 +162,25 @@ def any_data(data: Union[str, bytes, io.BytesIO], ext: str) -> VirtualFile:
     raise ValueError(f"Unsupported data type: {type(data)}")
 
 
+def stream(write: Callable[[IO[bytes]], None], ext: str) -> VirtualFile:
+    """Create a virtual file by streaming data into it.
+
+    The data is written to a file on disk instead of being buffered in
+    memory, which suits large exports such as table downloads.
+
+    Args:
+        write: Function that writes the data to the given binary file,
+            possibly in chunks
+        ext: File extension
+
+    Returns:
+        A `VirtualFile` object.
+    """
+    item = SpilledVirtualFileLifecycleItem(ext=ext, write=write)
+    item.add_to_cell_lifecycle_registry()
+    return item.virtual_file
+
+
 # Format: data:mime_type;base64,data
 def from_data_uri(data: str) -> tuple[str, bytes]:
     assert isinstance(data, str)
@@ -1,62 +1,99 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import importlib
 import sys
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Sequence, cast
 
 from marimo._config.config import Theme
-from marimo._output.formatters.altair_formatters import AltairFormatter
-from marimo._output.formatters.anywidget_formatters import AnyWidgetFormatter
-from marimo._output.formatters.arviz_formatters import ArviZFormatter
-from marimo._output.formatters.bokeh_formatters import BokehFormatter
 from marimo._output.formatters.cell import CellFormatter
-from marimo._output.formatters.df_formatters import (
-    PolarsFormatter,
-    PyArrowFormatter,
-)
 from marimo._output.formatters.formatter_factory import FormatterFactory
-from marimo._output.formatters.holoviews_formatters import HoloViewsFormatter
-from marimo._output.formatters.ipython_formatters import IPythonFormatter
-from marimo._output.formatters.ipywidgets_formatters import IPyWidgetsFormatter
-from marimo._output.formatters.leafmap_formatters import LeafmapFormatter
-from marimo._output.formatters.lets_plot_formatters import LetsPlotFormatter
-from marimo._output.formatters.matplotlib_formatters import MatplotlibFormatter
-from marimo._output.formatters.pandas_formatters import PandasFormatter
-from marimo._output.formatters.panel_formatters import PanelFormatter
-from marimo._output.formatters.plotly_formatters import PlotlyFormatter
-from marimo._output.formatters.pyecharts_formatters import PyechartsFormatter
-from marimo._output.formatters.pygwalker_formatters import PygWalkerFormatter
-from marimo._output.formatters.seaborn_formatters import SeabornFormatter
 from marimo._output.formatters.structures import StructuresFormatter
-from marimo._output.formatters.sympy_formatters import SympyFormatter
-from marimo._output.formatters.tqdm_formatters import TqdmFormatter
+
+
+class _LazyFormatterFactory(FormatterFactory):
+    """A formatter factory whose module is imported on first use.
+
+    Formatter modules import parts of marimo (such as UI elements) that
+    we don't want to load until a notebook imports the package they
+    format.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._factory: FormatterFactory | None = None
+
+    @staticmethod
+    def package_name() -> None:
+        return None
+
+    @property
+    def factory(self) -> FormatterFactory:
+        if self._factory is None:
+            module = importlib.import_module(
+                f"marimo._output.formatters.{self._module}"
+            )
+            self._factory = cast(
+                FormatterFactory, getattr(module, self._name)()
+            )
+        return self._factory
+
+    def register(self) -> Callable[[], None] | None:
+        return self.factory.register()
+
+    def apply_theme(self, theme: Theme) -> None:
+        self.factory.apply_theme(theme)
+
+    def apply_theme_safe(self, theme: Theme) -> None:
+        self.factory.apply_theme_safe(theme)
+
 
 # Map from formatter factory's package name to formatter, for third-party
 # modules. These formatters will be registered if and when their associated
 # packages are imported.
 THIRD_PARTY_FACTORIES: dict[str, FormatterFactory] = {
-    AltairFormatter.package_name(): AltairFormatter(),
-    MatplotlibFormatter.package_name(): MatplotlibFormatter(),
-    PandasFormatter.package_name(): PandasFormatter(),
-    PolarsFormatter.package_name(): PolarsFormatter(),
-    PyArrowFormatter.package_name(): PyArrowFormatter(),
-    PygWalkerFormatter.package_name(): PygWalkerFormatter(),
-    PlotlyFormatter.package_name(): PlotlyFormatter(),
-    SeabornFormatter.package_name(): SeabornFormatter(),
-    LeafmapFormatter.package_name(): LeafmapFormatter(),
-    BokehFormatter.package_name(): BokehFormatter(),
-    HoloViewsFormatter.package_name(): HoloViewsFormatter(),
-    IPythonFormatter.package_name(): IPythonFormatter(),
-    IPyWidgetsFormatter.package_name(): IPyWidgetsFormatter(),
-    AnyWidgetFormatter.package_name(): AnyWidgetFormatter(),
-    ArviZFormatter.package_name(): ArviZFormatter(),
-    TqdmFormatter.package_name(): TqdmFormatter(),
-    LetsPlotFormatter.package_name(): LetsPlotFormatter(),
-    SympyFormatter.package_name(): SympyFormatter(),
-    PyechartsFormatter.package_name(): PyechartsFormatter(),
-    PanelFormatter.package_name(): PanelFormatter(),
+    "altair": _LazyFormatterFactory("altair_formatters", "AltairFormatter"),
+    "matplotlib": _LazyFormatterFactory(
+        "matplotlib_formatters", "MatplotlibFormatter"
+    ),
+    "pandas": _LazyFormatterFactory("pandas_formatters", "PandasFormatter"),
+    "polars": _LazyFormatterFactory("df_formatters", "PolarsFormatter"),
+    "pyarrow": _LazyFormatterFactory("df_formatters", "PyArrowFormatter"),
+    "pygwalker": _LazyFormatterFactory(
+        "pygwalker_formatters", "PygWalkerFormatter"
+    ),
+    "plotly": _LazyFormatterFactory("plotly_formatters", "PlotlyFormatter"),
+    "seaborn": _LazyFormatterFactory("seaborn_formatters", "SeabornFormatter"),
+    "leafmap": _LazyFormatterFactory("leafmap_formatters", "LeafmapFormatter"),
+    "bokeh": _LazyFormatterFactory("bokeh_formatters", "BokehFormatter"),
+    "holoviews": _LazyFormatterFactory(
+        "holoviews_formatters", "HoloViewsFormatter"
+    ),
+    "IPython": _LazyFormatterFactory("ipython_formatters", "IPythonFormatter"),
+    "ipywidgets": _LazyFormatterFactory(
+        "ipywidgets_formatters", "IPyWidgetsFormatter"
+    ),
+    "anywidget": _LazyFormatterFactory(
+        "anywidget_formatters", "AnyWidgetFormatter"
+    ),
+    "arviz": _LazyFormatterFactory("arviz_formatters", "ArviZFormatter"),
+    "tqdm": _LazyFormatterFactory("tqdm_formatters", "TqdmFormatter"),
+    "lets_plot": _LazyFormatterFactory(
+        "lets_plot_formatters", "LetsPlotFormatter"
+    ),
+    "sympy": _LazyFormatterFactory("sympy_formatters", "SympyFormatter"),
+    "pyecharts": _LazyFormatterFactory(
+        "pyecharts_formatters", "PyechartsFormatter"
+    ),
+    "panel": _LazyFormatterFactory("panel_formatters", "PanelFormatter"),
 }
 
+# Factories whose packages haven't been imported yet, and the theme to apply
+# to them once they are; read by the import hooks on sys.meta_path.
+_PENDING_FACTORIES: dict[str, FormatterFactory] = {}
+_THEME: dict[str, Theme] = {"theme": "light"}
+
 # Formatters for builtin types and other things that don't require a
 # third-party module import. These formatters' register methods need to be
 # fast: we don't want their registration to noticeably delay program start-up.
@@ -85,21 +122,18 @@ def register_formatters(theme: Theme = "light") -> None:
     case, the trade-off is worth it.
     """
 
+    _THEME["theme"] = theme
+
     # For modules that are already imported, register their formatters
     # immediately; their import hook wouldn't be triggered since they are
     # already imported. This is relevant when executing as a script.
-    pre_registered: set[str] = set()
+    _PENDING_FACTORIES.clear()
     for package, factory in THIRD_PARTY_FACTORIES.items():
         if package in sys.modules:
             factory.register()
             factory.apply_theme_safe(theme)
-            pre_registered.add(package)
-
-    third_party_factories = {
-        package: factory
-        for package, factory in THIRD_PARTY_FACTORIES.items()
-        if package not in pre_registered
-    }
+        else:
+            _PENDING_FACTORIES[package] = factory
 
     # We loop over all MetaPathFinders, monkey-patching them to run third-party
     # formatters whenever a supported third-party package is imported (in
@@ -116,13 +150,17 @@ def register_formatters(theme: Theme = "light") -> None:
     # our patch in turn patches the loader to run the formatter after
     # the module is exec'd.
     #
-    # Because Python's import system caches modules, our formatters'
-    # register methods will be called at most once.
+    # Finders are patched at most once, no matter how many times this
+    # function is called; the patches look up factories in
+    # _PENDING_FACTORIES, and a factory is removed from it once registered,
+    # so its register method is called at most once.
     for finder in sys.meta_path:
         # Note: "Vendored" dependencies may not have a find_spec method.
         # E.g. `six` bundled with a project.
         original_find_spec = getattr(finder, "find_spec", None)
-        if original_find_spec is None:
+        if original_find_spec is None or getattr(
+            original_find_spec, "_marimo_formatters_hook", False
+        ):
             continue
 
         # We include `original_find_spec` as a kwarg to force it to be bound
@@ -140,32 +178,36 @@ def register_formatters(theme: Theme = "light") -> None:
             if spec is None:
                 return spec
 
-            if spec.loader is not None and fullname in third_party_factories:
+            if spec.loader is not None and fullname in _PENDING_FACTORIES:
                 # We're now in the process of importing a module with
                 # an associated formatter factory. We'll hook into its
                 # loader to register the formatters.
                 original_exec_module = spec.loader.exec_module
-                factory = THIRD_PARTY_FACTORIES[fullname]
 
                 # Once again, we use kwargs instead of closing over the
-                # variables `original_exec_module` and `factory` to force
-                # binding.
+                # variable `original_exec_module` to force binding.
                 def exec_module(
                     module: Any,
                     original_exec_module: Callable[
                         ..., Any
                     ] = original_exec_module,
-                    factory: FormatterFactory = factory,
                 ) -> Any:
                     loader_return_value = original_exec_module(module)
-                    factory.register()
-                    factory.apply_theme_safe(theme)
+                    # Specs can be found without being loaded (e.g., by
+                    # importlib.util.find_spec), so the factory is only
+                    # claimed once its module is exec'd.
+                    factory = _PENDING_FACTORIES.pop(module.__name__, None)
+                    if factory is not None:
+                        factory.register()
+                        factory.apply_theme_safe(_THEME["theme"])
                     return loader_return_value
 
                 spec.loader.exec_module = exec_module
 
             return spec
 
+        find_spec._marimo_formatters_hook = True  # type: ignore[attr-defined]
+
         # Use the __get__ descriptor to bind find_spec to this finder object,
         # to make sure self/cls gets passed
         finder.find_spec = find_spec.__get__(finder)  # type: ignore[method-assign]  # noqa: E501
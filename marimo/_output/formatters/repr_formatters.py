@@ -7,6 +7,25 @@ from marimo._messaging.mimetypes import KnownMimeType
 from marimo._plugins.core.media import io_to_data_url
 from marimo._utils.methods import is_callable_method
 
+MD_MIME_TYPES: tuple[KnownMimeType, ...] = (
+    "text/markdown",
+    "text/latex",
+)
+
+# Check for the misc _repr_ methods
+# Order dictates preference
+REPR_METHODS: tuple[Tuple[str, KnownMimeType], ...] = (
+    ("_repr_html_", "text/html"),  # text/html is preferred first
+    ("_repr_mimebundle_", "application/vnd.marimo+mimebundle"),
+    ("_repr_svg_", "image/svg+xml"),
+    ("_repr_json_", "application/json"),
+    ("_repr_png_", "image/png"),
+    ("_repr_jpeg_", "image/jpeg"),
+    ("_repr_markdown_", "text/markdown"),
+    ("_repr_latex_", "text/latex"),
+    ("_repr_text_", "text/plain"),  # last
+)
+
 
 def maybe_get_repr_formatter(
     obj: Any,
@@ -14,31 +33,15 @@ def maybe_get_repr_formatter(
     """
     Get a formatter that uses the object's _repr_ methods.
     """
-    md_mime_types: list[KnownMimeType] = [
-        "text/markdown",
-        "text/latex",
-    ]
-
-    # Check for the misc _repr_ methods
-    # Order dictates preference
-    reprs: list[Tuple[str, KnownMimeType]] = [
-        ("_repr_html_", "text/html"),  # text/html is preferred first
-        ("_repr_mimebundle_", "application/vnd.marimo+mimebundle"),
-        ("_repr_svg_", "image/svg+xml"),
-        ("_repr_json_", "application/json"),
-        ("_repr_png_", "image/png"),
-        ("_repr_jpeg_", "image/jpeg"),
-        ("_repr_markdown_", "text/markdown"),
-        ("_repr_latex_", "text/latex"),
-        ("_repr_text_", "text/plain"),  # last
-    ]
-    has_possible_repr = any(is_callable_method(obj, attr) for attr, _ in reprs)
+    has_possible_repr = any(
+        is_callable_method(obj, attr) for attr, _ in REPR_METHODS
+    )
     if has_possible_repr:
         # If there is any match, we return a formatter that calls
         # all the possible _repr_ methods, since some can be implemented
         # but return None
         def f_repr(obj: Any) -> tuple[KnownMimeType, str]:
-            for attr, mime_type in reprs:
+            for attr, mime_type in REPR_METHODS:
                 if not is_callable_method(obj, attr):
                     continue
 
@@ -59,7 +62,7 @@ def maybe_get_repr_formatter(
                         contents.pop("text/plain")
                     # Convert markdown/latex to text/html if text/html is
                     # not present
-                    for md_mime_type in md_mime_types:
+                    for md_mime_type in MD_MIME_TYPES:
                         if (
                             "text/html" not in contents
                             and md_mime_type in contents
@@ -86,7 +89,7 @@ def maybe_get_repr_formatter(
                     return (mime_type, data_url or "")
 
                 # Handle markdown and latex
-                if mime_type in md_mime_types:
+                if mime_type in MD_MIME_TYPES:
                     from marimo._output.md import md
 
                     return ("text/html", md(contents or "").text)
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import traceback
+import weakref
 from dataclasses import dataclass
 from html import escape
 from typing import Any, Callable, Optional, Tuple, Type, TypeVar, cast
@@ -26,7 +27,10 @@ from typing import Any, Callable, Optional, Tuple, Type, TypeVar, cast
 from marimo import _loggers as loggers
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._output.builder import h
-from marimo._output.formatters.repr_formatters import maybe_get_repr_formatter
+from marimo._output.formatters.repr_formatters import (
+    REPR_METHODS,
+    maybe_get_repr_formatter,
+)
 from marimo._output.formatters.utils import src_or_src_doc
 from marimo._output.hypertext import Html
 from marimo._output.rich_help import mddoc
@@ -46,6 +50,66 @@ OPINIONATED_FORMATTERS: dict[Type[Any], Formatter[Any]] = {}
 LOGGER = loggers.marimo_logger()
 
 
+@dataclass(frozen=True)
+class _TypeInfo:
+    """What get_formatter can decide from an object's type alone."""
+
+    # Formatters registered for the type, or its nearest base class
+    opinionated_formatter: Optional[Formatter[Any]]
+    formatter: Optional[Formatter[Any]]
+    # Whether instances may implement the _display_, _mime_ and _repr_
+    # protocols; when False, the attribute probes are skipped
+    may_display: bool
+    may_mime: bool
+    may_repr: bool
+
+
+# Memoized per type, since outputs often contain many objects of the same
+# type (e.g., the elements of a large list); cleared whenever a formatter
+# is registered
+_TYPE_INFO: weakref.WeakKeyDictionary[Type[Any], _TypeInfo] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _may_have_attribute(t: Type[Any], attr: str) -> bool:
+    if hasattr(t, attr):
+        return True
+    # Instances may still provide the attribute dynamically, or through
+    # their own __dict__
+    return t.__dictoffset__ != 0 or hasattr(t, "__getattr__")
+
+
+def _resolve_formatter(
+    t: Type[Any], formatters: dict[Type[Any], Formatter[Any]]
+) -> Optional[Formatter[Any]]:
+    for base in t.__mro__:
+        if base in formatters:
+            return formatters[base]
+    # Virtual subclasses, e.g. of ABCs, don't appear in the MRO
+    for registered_type, f in formatters.items():
+        if issubclass(t, registered_type):
+            return f
+    return None
+
+
+def _get_type_info(t: Type[Any]) -> _TypeInfo:
+    info = _TYPE_INFO.get(t)
+    if info is None:
+        info = _TypeInfo(
+            # Opinionated formatters only apply to the exact type
+            opinionated_formatter=OPINIONATED_FORMATTERS.get(t),
+            formatter=_resolve_formatter(t, FORMATTERS),
+            may_display=_may_have_attribute(t, "_display_"),
+            may_mime=_may_have_attribute(t, "_mime_"),
+            may_repr=any(
+                _may_have_attribute(t, attr) for attr, _ in REPR_METHODS
+            ),
+        )
+        _TYPE_INFO[t] = info
+    return info
+
+
 def formatter(t: Type[Any]) -> Callable[[Formatter[T]], Formatter[T]]:
     """Register a formatter function for a type
 
@@ -63,6 +127,7 @@ def formatter(t: Type[Any]) -> Callable[[Formatter[T]], Formatter[T]]:
 
     def register_format(f: Formatter[T]) -> Formatter[T]:
         FORMATTERS[t] = f
+        _TYPE_INFO.clear()
         return f
 
     return register_format
@@ -87,6 +152,7 @@ def opinionated_formatter(
 
     def register_format(f: Formatter[T]) -> Formatter[T]:
         OPINIONATED_FORMATTERS[t] = f
+        _TYPE_INFO.clear()
         return f
 
     return register_format
@@ -123,8 +189,10 @@ def get_formatter(
 
             return plain_formatter
 
+    info = _get_type_info(type(obj))
+
     # Display protocol has the highest precedence
-    if is_callable_method(obj, "_display_"):
+    if info.may_display and is_callable_method(obj, "_display_"):
 
         def f_mime(obj: T) -> tuple[KnownMimeType, str]:
             displayable_object = obj._display_()  # type: ignore
@@ -137,21 +205,14 @@ def get_formatter(
         return f_mime
 
     # Formatters dict gets precedence
-    if include_opinionated:
-        if type(obj) in OPINIONATED_FORMATTERS:
-            return OPINIONATED_FORMATTERS[type(obj)]
-
-    if type(obj) in FORMATTERS:
-        return FORMATTERS[type(obj)]
-    elif any(isinstance(obj, t) for t in FORMATTERS.keys()):
-        # we avoid using the walrus operator (matched_type := t) above
-        # to keep compatibility with Python < 3.8
-        for t in FORMATTERS.keys():
-            if isinstance(obj, t):
-                return FORMATTERS[t]
+    if include_opinionated and info.opinionated_formatter is not None:
+        return info.opinionated_formatter
+
+    if info.formatter is not None:
+        return info.formatter
 
     # Check for the MIME protocol
-    if is_callable_method(obj, "_mime_"):
+    if info.may_mime and is_callable_method(obj, "_mime_"):
 
         def f_mime(obj: T) -> tuple[KnownMimeType, str]:
             mime, data = obj._mime_()  # type: ignore
@@ -164,6 +225,8 @@ def get_formatter(
 
         return f_mime
 
+    if not info.may_repr:
+        return None
     return maybe_get_repr_formatter(obj)
 
 
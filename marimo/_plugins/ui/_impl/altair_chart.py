@@ -17,13 +17,18 @@ from typing import (
 )
 
 import narwhals.stable.v1 as nw
-from narwhals.typing import IntoDataFrame
+from narwhals.stable.v1.typing import IntoDataFrame
 
 from marimo import _loggers
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._output.rich_help import mddoc
 from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._plugins.ui._impl.charts.altair_aggregate import (
+    PreAggregation,
+    preaggregate,
+)
 from marimo._plugins.ui._impl.charts.altair_transformer import (
+    _to_marimo_csv,
     register_transformers,
 )
 from marimo._utils import flatten
@@ -216,6 +221,69 @@ def _parse_spec(spec: altair.TopLevelMixin) -> VegaSpec:
         return spec.to_dict()  # type: ignore
 
 
+def _preaggregate_chart(
+    chart: altair.TopLevelMixin, data: Any
+) -> Optional[PreAggregation]:
+    """Evaluate the chart's data transforms in the kernel, if possible."""
+    import altair
+
+    # vegafusion already evaluates transforms outside of the browser
+    if altair.data_transformers.active.startswith("vegafusion"):
+        return None
+    if _has_geoshape(chart) or not can_narwhalify(data):
+        return None
+
+    # Skip serializing the full dataset; it is replaced by the
+    # reduced one
+    with altair.data_transformers.enable("marimo_deferred"):
+        spec: VegaSpec = chart.to_dict()  # type: ignore
+
+    result = preaggregate(spec, data)
+    if result is None:
+        return None
+    result.spec["data"] = _to_marimo_csv(result.data)
+    return result
+
+
+def _filter_preaggregated(
+    preaggregation: PreAggregation,
+    native_df: IntoDataFrame,
+    selection: ChartSelection,
+) -> IntoDataFrame:
+    """Map a selection on the reduced dataset back to the original rows."""
+    df = preaggregation.apply_row_transforms(native_df)
+    remaining: ChartSelection = {}
+    for channel, fields in selection.items():
+        # Points selected without fields index into the reduced dataset
+        if (
+            preaggregation.has_group_keys
+            and len(fields) == 2
+            and "vlPoint" in fields
+            and "_vgsid_" in fields
+        ):
+            try:
+                # Vega is 1-indexed, so subtract 1
+                indexes = [int(i) - 1 for i in fields["_vgsid_"]]
+                df = df.filter(preaggregation.groups_predicate(indexes))
+            except (ValueError, IndexError) as e:
+                raise ValueError(
+                    f"Invalid index in selection: {fields['_vgsid_']}"
+                ) from e
+            continue
+        # Bins and time units don't exist in the original data, so they
+        # are mapped back to their fields
+        predicate, channel_fields = preaggregation.map_selection(fields)
+        if predicate is not None:
+            df = df.filter(predicate)
+        remaining[channel] = cast(ChartSelectionField, channel_fields)
+
+    filtered = nw.from_native(_filter_dataframe(nw.to_native(df), remaining))
+    return cast(
+        IntoDataFrame,
+        nw.to_native(preaggregation.drop_helper_columns(filtered)),
+    )
+
+
 def _has_transforms(spec: VegaSpec) -> bool:
     """Return True if the spec has transforms."""
     return "transform" in spec and len(spec["transform"]) > 0
@@ -273,6 +341,12 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         label (str, optional): Markdown label for the element. Defaults to "".
         on_change (Optional[Callable[[ChartDataType], None]], optional): Optional
             callback to run when this element's value changes. Defaults to None.
+        preaggregate (bool, optional): If True, evaluate the chart's data
+            transforms (bin, aggregate, filter, timeUnit) in the kernel and
+            only send the reduced dataset to the browser. Useful for
+            histograms, aggregates and heatmaps of large datasets. Charts
+            that use unsupported features are sent unchanged. Selections
+            still filter the original rows. Defaults to False.
     """
 
     name: Final[str] = "marimo-vega"
@@ -285,6 +359,7 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         *,
         label: str = "",
         on_change: Optional[Callable[[ChartDataType], None]] = None,
+        preaggregate: bool = False,
     ) -> None:
         DependencyManager.altair.require(why="to use `mo.ui.altair_chart`")
 
@@ -303,7 +378,20 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         # Make full-width if no width is specified
         chart = maybe_make_full_width(chart)
 
-        vega_spec = _parse_spec(chart)
+        self.dataframe: Optional[ChartDataType] = (
+            self._get_dataframe_from_chart(chart)
+        )
+
+        self._preaggregation: Optional[PreAggregation] = (
+            _preaggregate_chart(chart, self.dataframe)
+            if preaggregate
+            else None
+        )
+        vega_spec = (
+            self._preaggregation.spec
+            if self._preaggregation is not None
+            else _parse_spec(chart)
+        )
 
         if label:
             vega_spec["title"] = label
@@ -348,11 +436,14 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
                 )
             legend_selection = False
 
-        # Selection for binned charts is not yet implemented
+        # Selection for binned charts is not yet implemented, unless the
+        # bins are pre-aggregated and selections are mapped back to rows
         has_chart_selection = chart_selection is not False
         has_legend_selection = legend_selection is not False
-        if _has_binning(vega_spec) and (
-            has_chart_selection or has_legend_selection
+        if (
+            self._preaggregation is None
+            and _has_binning(vega_spec)
+            and (has_chart_selection or has_legend_selection)
         ):
             sys.stderr.write(
                 "Binning + selection is not yet supported in "
@@ -371,10 +462,6 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             )
             chart_selection = False
 
-        self.dataframe: Optional[ChartDataType] = (
-            self._get_dataframe_from_chart(chart)
-        )
-
         self._spec = vega_spec
 
         super().__init__(
@@ -418,9 +505,9 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             import pandas as pd
 
             if url.endswith(".csv"):
-                return pd.read_csv(url)
+                return cast(ChartDataType, pd.read_csv(url))
             if url.endswith(".json"):
-                return pd.read_json(url)
+                return cast(ChartDataType, pd.read_json(url))
 
         import altair
 
@@ -447,6 +534,11 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         if not can_narwhalify(self.dataframe):
             return self.dataframe  # type: ignore
 
+        if self._preaggregation is not None:
+            return _filter_preaggregated(
+                self._preaggregation, self.dataframe, value
+            )
+
         # If we have transforms, we need to filter the dataframe
         # with those transforms, before applying the selection
         if _has_transforms(self._spec):
@@ -502,6 +594,10 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             ```
         """
         assert assert_can_narwhalify(df)
+        if self._preaggregation is not None:
+            return _filter_preaggregated(
+                self._preaggregation, df, self.selections
+            )
         return _filter_dataframe(df, self.selections)
 
     # Proxy all of altair's attributes
@@ -0,0 +1,866 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Kernel-side evaluation of Vega-Lite data transforms.
+
+Charts that reduce their data (histograms, aggregated bar charts, heatmaps)
+make the browser re-aggregate every row of the source data. When a spec
+only uses transforms that we know how to evaluate (field predicates, bin,
+aggregate and simple time units), we evaluate them here with narwhals,
+which delegates to the vectorized kernels of the underlying backend
+(polars, pandas, DuckDB, ...), and only embed the reduced dataset.
+
+Unsupported specs are left untouched: `preaggregate` returns None and the
+chart is rendered as usual.
+"""
+
+from __future__ import annotations
+
+import copy
+import datetime
+import math
+import operator
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import narwhals.stable.v1 as nw
+
+from marimo import _loggers
+from marimo._utils.narwhals_utils import can_narwhalify
+
+if TYPE_CHECKING:
+    from narwhals.stable.v1.typing import IntoDataFrame
+
+LOGGER = _loggers.marimo_logger()
+
+VegaSpec = Dict[str, Any]
+Frame = Union[nw.DataFrame[Any], nw.LazyFrame[Any]]
+
+# Name of the placeholder dataset used while the spec is being rewritten
+DEFERRED_DATA_NAME = "marimo_preaggregated"
+
+# Column holding the number of rows of each group
+COUNT_COLUMN = "__count"
+
+# Same tolerance as vega's bin transform
+_BIN_EPSILON = 1e-14
+
+# Channels whose bins are rendered as [start, end) ranges
+_BINNABLE_CHANNELS = {"x": "x2", "y": "y2"}
+
+# Vega-Lite defaults to a leap year for time units without a year
+_DEFAULT_YEAR = 2012
+
+_SUPPORTED_TIME_UNITS = (
+    "year",
+    "quarter",
+    "month",
+    "date",
+    "hours",
+    "minutes",
+    "seconds",
+)
+
+_UNSUPPORTED_ENCODING_KEYS = ("impute", "condition")
+
+
+class UnsupportedSpecError(Exception):
+    """Raised when a spec uses a feature that we can't evaluate."""
+
+
+@dataclass
+class _GroupKey:
+    # Column in the row-level frame
+    column: str
+    # Column in the reduced frame
+    output: str
+
+
+@dataclass
+class _TimeUnitKey:
+    # Original field
+    field: str
+    # Column in the reduced frame, holding the truncated datetime
+    output: str
+    # (unit, helper column) for each component of the time unit
+    components: List[Tuple[str, str]]
+
+
+@dataclass
+class _BinSelection:
+    """A selection on the start (or end) of the bins of a field."""
+
+    # Original field
+    source: str
+    # Row-level helper column, holding the start of each row's bin
+    helper: str
+    step: float
+    # Offset of the selected values from the start of the bin
+    offset: float = 0
+
+    def point_predicate(self, values: List[Any]) -> nw.Expr:
+        if not values:
+            return nw.lit(False)
+        predicates = []
+        for value in values:
+            if isinstance(value, (list, tuple)):
+                # Points on bins may be selected as [start, end] ranges
+                start = float(value[0])
+            else:
+                start = float(value) - self.offset
+            # Bin starts are floats, so compare up to half a step
+            predicates.append(
+                (nw.col(self.helper) - start).abs() < self.step / 2
+            )
+        return _reduce(predicates, lambda a, b: a | b)
+
+
+@dataclass
+class _TimeUnitSelection:
+    """A selection on the truncated datetimes of a field."""
+
+    # Original field
+    source: str
+    # (unit, row-level helper column) for each component of the time unit
+    components: List[Tuple[str, str]]
+
+    def point_predicate(self, values: List[Any]) -> nw.Expr:
+        if not values:
+            return nw.lit(False)
+        predicates = []
+        for value in values:
+            dt = _to_datetime(value)
+            predicates.append(
+                _reduce(
+                    [
+                        nw.col(helper) == _time_component(dt, unit)
+                        for unit, helper in self.components
+                    ],
+                    lambda a, b: a & b,
+                )
+            )
+        return _reduce(predicates, lambda a, b: a | b)
+
+
+@dataclass
+class PreAggregation:
+    """The result of evaluating a spec's data transforms in the kernel.
+
+    Attributes:
+        spec: The rewritten Vega-Lite spec. Its data points to
+            `DEFERRED_DATA_NAME` and must be replaced by the caller.
+        data: The reduced dataset, in the native format of the input.
+        derived_fields: Fields that only exist in the reduced dataset.
+    """
+
+    spec: VegaSpec
+    data: IntoDataFrame
+    derived_fields: set[str] = field(default_factory=set)
+
+    # Row-level pipeline, applied to the original data before grouping
+    _row_steps: List[Callable[[Frame], Frame]] = field(default_factory=list)
+    # Helper columns added by the row-level pipeline
+    _helper_columns: List[str] = field(default_factory=list)
+    # Group key values of each row in `data` (keyed by row-level column)
+    _group_rows: List[Dict[str, Any]] = field(default_factory=list)
+    # Derived fields whose selections map back to the original rows
+    _selection_fields: Dict[str, Union[_BinSelection, _TimeUnitSelection]] = (
+        field(default_factory=dict)
+    )
+
+    def apply_row_transforms(self, native_df: IntoDataFrame) -> Frame:
+        """Apply the row-level transforms (filters, bins, time units)."""
+        df: Frame = nw.from_native(native_df)
+        for step in self._row_steps:
+            df = step(df)
+        return df
+
+    def drop_helper_columns(self, df: Frame) -> Frame:
+        helpers = [c for c in self._helper_columns if c in df.columns]
+        return df.drop(helpers) if helpers else df
+
+    def map_selection(
+        self, fields: Dict[str, Any]
+    ) -> Tuple[Optional[nw.Expr], Dict[str, Any]]:
+        """Map the fields of a selection on the reduced dataset back to the
+        row-level frame.
+
+        Returns a predicate for the point selections of bins and time
+        units (None if there are none), and the remaining fields.
+        Intervals over bins and time units become intervals over their
+        original field. Other derived fields (e.g. aggregates) can't be
+        mapped back and are dropped.
+        """
+        is_point_selection = "vlPoint" in fields
+        predicates: List[nw.Expr] = []
+        remaining: Dict[str, Any] = {}
+        for name, values in fields.items():
+            selection_field = self._selection_fields.get(name)
+            if selection_field is None:
+                if name not in self.derived_fields:
+                    remaining[name] = values
+            elif is_point_selection:
+                predicates.append(selection_field.point_predicate(values))
+            else:
+                remaining[selection_field.source] = values
+        if not predicates:
+            return None, remaining
+        return _reduce(predicates, lambda a, b: a & b), remaining
+
+    @property
+    def has_group_keys(self) -> bool:
+        return bool(self._group_rows)
+
+    def groups_predicate(self, indexes: List[int]) -> nw.Expr:
+        """Predicate matching the source rows of the given reduced rows."""
+        predicate: Optional[nw.Expr] = None
+        for index in indexes:
+            if index < 0 or index >= len(self._group_rows):
+                raise IndexError(index)
+            row_predicate: nw.Expr = nw.lit(True)
+            for column, value in self._group_rows[index].items():
+                if value is None:
+                    row_predicate = row_predicate & nw.col(column).is_null()
+                else:
+                    row_predicate = row_predicate & (nw.col(column) == value)
+            predicate = (
+                row_predicate
+                if predicate is None
+                else predicate | row_predicate
+            )
+        return predicate if predicate is not None else nw.lit(False)
+
+
+def preaggregate(spec: VegaSpec, data: Any) -> Optional[PreAggregation]:
+    """Evaluate the data transforms of `spec` over `data`.
+
+    Returns None if the spec does not reduce its data, or if it uses a
+    feature that can't be evaluated in the kernel.
+    """
+    if not can_narwhalify(data):
+        return None
+    if not _is_unit_spec(spec) or not _reduces_data(spec):
+        return None
+    try:
+        return _Planner(copy.deepcopy(spec), data).run()
+    except UnsupportedSpecError as e:
+        LOGGER.debug("Not pre-aggregating chart: %s", e)
+        return None
+
+
+def _is_unit_spec(spec: VegaSpec) -> bool:
+    return "mark" in spec and not any(
+        key in spec
+        for key in ("layer", "hconcat", "vconcat", "concat", "facet", "repeat")
+    )
+
+
+def _reduces_data(spec: VegaSpec) -> bool:
+    if any("aggregate" in t for t in spec.get("transform", [])):
+        return True
+    return any(
+        isinstance(channel_def, dict) and "aggregate" in channel_def
+        for channel_def in _iter_channel_defs(spec.get("encoding", {}))
+    )
+
+
+def _iter_channel_defs(encoding: Dict[str, Any]) -> List[Any]:
+    defs: List[Any] = []
+    for channel_def in encoding.values():
+        if isinstance(channel_def, list):
+            defs.extend(channel_def)
+        else:
+            defs.append(channel_def)
+    return defs
+
+
+class _Planner:
+    def __init__(self, spec: VegaSpec, data: Any) -> None:
+        self.spec = spec
+        self.df: Frame = nw.from_native(data)
+        self.result = PreAggregation(spec=spec, data=data)
+
+    def run(self) -> PreAggregation:
+        for transform in self.spec.pop("transform", []):
+            self._apply_transform(transform)
+
+        encoding = self.spec.get("encoding", {})
+        if any(
+            isinstance(d, dict) and "aggregate" in d
+            for d in _iter_channel_defs(encoding)
+        ):
+            self._aggregate_encoding(encoding)
+        else:
+            # Only the transforms reduced the data; the encodings are
+            # evaluated by Vega-Lite over the reduced rows
+            self._collect_groups([], [])
+
+        self.spec["data"] = {"name": DEFERRED_DATA_NAME}
+        self.spec.pop("datasets", None)
+        return self.result
+
+    # Transforms
+
+    def _add_row_step(self, step: Callable[[Frame], Frame]) -> None:
+        self.result._row_steps.append(step)
+        self.df = step(self.df)
+
+    def _apply_transform(self, transform: Dict[str, Any]) -> None:
+        if "filter" in transform and len(transform) == 1:
+            predicate = _predicate_to_expr(transform["filter"])
+            self._add_row_step(lambda df: df.filter(predicate))
+        elif "bin" in transform:
+            self._bin_transform(transform)
+        elif "aggregate" in transform:
+            self._aggregate_transform(transform)
+        else:
+            raise UnsupportedSpecError(f"transform {list(transform)}")
+
+    def _bin_transform(self, transform: Dict[str, Any]) -> None:
+        field_name = _plain_field(transform.get("field"))
+        as_ = transform.get("as")
+        if isinstance(as_, str):
+            start_col, end_col = as_, f"{as_}_end"
+        elif isinstance(as_, list) and len(as_) == 2:
+            start_col, end_col = as_
+        else:
+            raise UnsupportedSpecError("bin transform without 'as'")
+        params = self._bin_params(field_name, transform["bin"], 10)
+        start_expr = _bin_start_expr(field_name, params)
+        end_expr = start_expr + params.step
+        self._add_row_step(
+            lambda df: df.with_columns(
+                start_expr.alias(start_col), end_expr.alias(end_col)
+            )
+        )
+
+    def _aggregate_transform(self, transform: Dict[str, Any]) -> None:
+        groupby = [_plain_field(f) for f in transform.get("groupby", [])]
+        aggs: List[nw.Expr] = []
+        for agg in transform["aggregate"]:
+            op = agg.get("op")
+            as_ = agg.get("as")
+            if not isinstance(as_, str):
+                raise UnsupportedSpecError("aggregate without 'as'")
+            aggs.append(_aggregate_expr(op, agg.get("field")).alias(as_))
+
+        # Aggregates can't be replayed on single rows, so selections are
+        # mapped onto the aggregated frame, like `transformed_data()`
+        def step(df: Frame) -> Frame:
+            if not groupby:
+                return df.select(*aggs)
+            return df.group_by(groupby).agg(*aggs)
+
+        self._add_row_step(step)
+
+    # Encodings
+
+    def _aggregate_encoding(self, encoding: Dict[str, Any]) -> None:
+        keys: List[_GroupKey] = []
+        time_units: List[_TimeUnitKey] = []
+        bins: List[Tuple[str, str, float]] = []
+        aggs: Dict[str, nw.Expr] = {}
+        derived: List[nw.Expr] = []
+
+        def add_key(key: _GroupKey, expr: Optional[nw.Expr] = None) -> None:
+            if any(k.column == key.column for k in keys):
+                return
+            keys.append(key)
+            if expr is not None:
+                derived.append(expr.alias(key.column))
+                self.result._helper_columns.append(key.column)
+
+        def visit(channel: str, channel_def: Any) -> Any:
+            if not isinstance(channel_def, dict):
+                return channel_def
+            if "field" not in channel_def and "aggregate" not in channel_def:
+                # Constant values and datums
+                return channel_def
+            if any(k in channel_def for k in _UNSUPPORTED_ENCODING_KEYS):
+                raise UnsupportedSpecError(f"{channel} uses a condition")
+            if isinstance(channel_def.get("sort"), dict):
+                raise UnsupportedSpecError(f"{channel} uses a sort field")
+
+            new_def = dict(channel_def)
+            if "aggregate" in channel_def:
+                op = channel_def["aggregate"]
+                field_name = channel_def.get("field")
+                output = (
+                    COUNT_COLUMN
+                    if op == "count"
+                    else f"{op}_{_plain_field(field_name)}"
+                )
+                aggs[output] = _aggregate_expr(op, field_name).alias(output)
+                # Each reduced row is its own group, so summing in the
+                # browser is an identity that keeps the aggregate
+                # semantics (stacking, axis orientation, ...)
+                new_def.update(
+                    field=output, aggregate="sum", type="quantitative"
+                )
+                new_def.setdefault("title", _aggregate_title(op, field_name))
+                return new_def
+
+            field_name = _plain_field(channel_def["field"])
+            bin_ = channel_def.get("bin")
+            time_unit = channel_def.get("timeUnit")
+            if bin_ and bin_ != "binned":
+                if channel not in _BINNABLE_CHANNELS or (
+                    _BINNABLE_CHANNELS[channel] in encoding
+                ):
+                    raise UnsupportedSpecError(f"binned {channel}")
+                params = self._bin_params(field_name, bin_, 10)
+                helper = f"__marimo_bin_{field_name}"
+                output = f"bin_maxbins_{params.maxbins}_{field_name}"
+                add_key(
+                    _GroupKey(column=helper, output=output),
+                    _bin_start_expr(field_name, params),
+                )
+                bins.append((output, f"{output}_end", params.step))
+                self.result._selection_fields[output] = _BinSelection(
+                    source=field_name, helper=helper, step=params.step
+                )
+                self.result._selection_fields[f"{output}_end"] = _BinSelection(
+                    source=field_name,
+                    helper=helper,
+                    step=params.step,
+                    offset=params.step,
+                )
+                new_def.update(
+                    field=output,
+                    bin={"binned": True, "step": params.step},
+                )
+                new_def.setdefault("title", f"{field_name} (binned)")
+                encoding[_BINNABLE_CHANNELS[channel]] = {
+                    "field": f"{output}_end"
+                }
+                return new_def
+            if time_unit:
+                units = _parse_time_unit(time_unit)
+                components = []
+                for unit in units:
+                    helper = f"__marimo_{unit}_{field_name}"
+                    add_key(
+                        _GroupKey(column=helper, output=helper),
+                        _time_component_expr(field_name, unit),
+                    )
+                    components.append((unit, helper))
+                # The truncated datetimes replace the original field, and
+                # Vega-Lite re-applies the (idempotent) time unit
+                time_units.append(
+                    _TimeUnitKey(
+                        field=field_name,
+                        output=field_name,
+                        components=components,
+                    )
+                )
+                derived_name = f"{''.join(units)}_{field_name}"
+                self.result.derived_fields.add(derived_name)
+                selection_field = _TimeUnitSelection(
+                    source=field_name, components=components
+                )
+                self.result._selection_fields[field_name] = selection_field
+                self.result._selection_fields[derived_name] = selection_field
+                return new_def
+
+            add_key(_GroupKey(column=field_name, output=field_name))
+            return new_def
+
+        for channel in list(encoding):
+            channel_def = encoding[channel]
+            if isinstance(channel_def, list):
+                encoding[channel] = [visit(channel, d) for d in channel_def]
+            else:
+                encoding[channel] = visit(channel, channel_def)
+
+        outputs = (
+            [k.output for k in keys]
+            + list(aggs)
+            + [t.output for t in time_units]
+        )
+        if len(set(outputs)) != len(outputs):
+            raise UnsupportedSpecError("ambiguous field names")
+
+        if derived:
+            self._add_row_step(lambda df: df.with_columns(*derived))
+
+        self._collect_groups(keys, list(aggs.values()))
+
+        reduced = self.df
+        assert isinstance(reduced, nw.DataFrame)
+        for output, end, step in bins:
+            reduced = reduced.with_columns((nw.col(output) + step).alias(end))
+            self.result.derived_fields.update((output, end))
+        for time_unit in time_units:
+            reduced = _assemble_time_unit(reduced, time_unit)
+            reduced = reduced.drop([c for _, c in time_unit.components])
+            self.result.derived_fields.add(time_unit.output)
+        self.result.derived_fields.update(aggs)
+        self.result.data = reduced.to_native()
+
+    def _collect_groups(
+        self, keys: List[_GroupKey], aggs: List[nw.Expr]
+    ) -> None:
+        df = self.df
+        if keys or aggs:
+            if keys:
+                columns = [k.column for k in keys]
+                # Sort, so the reduced rows have a stable order
+                df = (
+                    df.group_by(columns)
+                    .agg(*aggs)
+                    .sort(columns, nulls_last=True)
+                )
+            else:
+                df = df.select(*aggs)
+            df = df.rename(
+                {k.column: k.output for k in keys if k.column != k.output}
+            )
+        if isinstance(df, nw.LazyFrame):
+            df = df.collect()
+        self.df = df
+        self.result.data = df.to_native()
+        if keys:
+            self.result._group_rows = [
+                {k.column: row[k.output] for k in keys}
+                for row in df.iter_rows(named=True)
+            ]
+
+    # Binning
+
+    def _bin_params(
+        self, field_name: str, bin_: Any, default_maxbins: int
+    ) -> _BinParams:
+        if bin_ is True:
+            bin_ = {}
+        if not isinstance(bin_, dict):
+            raise UnsupportedSpecError(f"bin {bin_}")
+        unsupported = set(bin_) - {
+            "maxbins",
+            "step",
+            "steps",
+            "minstep",
+            "divide",
+            "base",
+            "nice",
+        }
+        if unsupported:
+            raise UnsupportedSpecError(f"bin options {unsupported}")
+
+        df = self.df
+        extent = df.select(
+            nw.col(field_name).min().alias("min"),
+            nw.col(field_name).max().alias("max"),
+        )
+        if isinstance(extent, nw.LazyFrame):
+            extent = extent.collect()
+        lo, hi = extent.rows()[0]
+        if lo is None or hi is None:
+            lo, hi = 0, 0
+        if isinstance(lo, (datetime.date, datetime.timedelta)):
+            raise UnsupportedSpecError("binning of temporal fields")
+        return _bin(
+            extent=(float(lo), float(hi)),
+            maxbins=bin_.get("maxbins", default_maxbins),
+            step=bin_.get("step"),
+            steps=bin_.get("steps"),
+            minstep=bin_.get("minstep", 0),
+            divide=bin_.get("divide", [5, 2]),
+            base=bin_.get("base", 10),
+            nice=bin_.get("nice", True),
+        )
+
+
+@dataclass
+class _BinParams:
+    start: float
+    stop: float
+    step: float
+    maxbins: int
+
+
+def _bin(
+    *,
+    extent: Tuple[float, float],
+    maxbins: int,
+    step: Optional[float],
+    steps: Optional[List[float]],
+    minstep: float,
+    divide: List[float],
+    base: float,
+    nice: bool,
+) -> _BinParams:
+    """Port of vega-statistics' `bin`, so bins match Vega-Lite's."""
+    lo, hi = extent
+    span = (hi - lo) or abs(lo) or 1
+    logb = math.log(base)
+
+    if step is None:
+        if steps:
+            target = span / maxbins
+            i = 0
+            while i < len(steps) and steps[i] < target:
+                i += 1
+            step = steps[max(0, i - 1)]
+        else:
+            level = math.ceil(math.log(maxbins) / logb)
+            step = max(
+                minstep,
+                math.pow(base, round(math.log(span) / logb) - level),
+            )
+            while math.ceil(span / step) > maxbins:
+                step *= base
+            for d in divide:
+                v = step / d
+                if v >= minstep and span / v <= maxbins:
+                    step = v
+
+    v = math.log(step)
+    precision = 0 if v >= 0 else int(-v / logb) + 1
+    eps = math.pow(base, -precision - 1)
+    if nice:
+        v = math.floor(lo / step + eps) * step
+        lo = v - step if lo < v else v
+        hi = math.ceil(hi / step) * step
+
+    return _BinParams(
+        start=lo,
+        stop=lo + step if hi == lo else hi,
+        step=step,
+        maxbins=maxbins,
+    )
+
+
+def _bin_start_expr(field_name: str, params: _BinParams) -> nw.Expr:
+    clipped = nw.col(field_name).clip(params.start, params.stop - params.step)
+    index = ((clipped - params.start) / params.step + _BIN_EPSILON) // 1
+    return index * params.step + params.start
+
+
+# Aggregates
+
+_AGGREGATE_OPS: Dict[str, Callable[[nw.Expr], Any]] = {
+    "sum": lambda e: e.sum(),
+    "mean": lambda e: e.mean(),
+    "average": lambda e: e.mean(),
+    "median": lambda e: e.median(),
+    "min": lambda e: e.min(),
+    "max": lambda e: e.max(),
+    "valid": lambda e: e.count(),
+    "distinct": lambda e: e.n_unique(),
+    "stdev": lambda e: e.std(),
+    "variance": lambda e: e.var(),
+}
+
+
+def _aggregate_expr(op: Any, field_name: Any) -> nw.Expr:
+    if op == "count":
+        return nw.len()
+    if not isinstance(op, str) or op not in _AGGREGATE_OPS:
+        raise UnsupportedSpecError(f"aggregate {op}")
+    return cast(nw.Expr, _AGGREGATE_OPS[op](nw.col(_plain_field(field_name))))
+
+
+def _aggregate_title(op: str, field_name: Optional[str]) -> str:
+    if op == "count":
+        return "Count of Records"
+    return f"{op.title()} of {field_name}"
+
+
+# Filters
+
+
+def _predicate_to_expr(predicate: Any) -> nw.Expr:
+    if isinstance(predicate, dict):
+        if "and" in predicate:
+            exprs = [_predicate_to_expr(p) for p in predicate["and"]]
+            return _reduce(exprs, lambda a, b: a & b)
+        if "or" in predicate:
+            exprs = [_predicate_to_expr(p) for p in predicate["or"]]
+            return _reduce(exprs, lambda a, b: a | b)
+        if "not" in predicate:
+            return ~_predicate_to_expr(predicate["not"])
+        if "field" in predicate and "timeUnit" not in predicate:
+            return _field_predicate_to_expr(predicate)
+    # Expression strings, selection params, ...
+    raise UnsupportedSpecError(f"filter {predicate}")
+
+
+# Operators of field predicates; narwhals types some of them as returning
+# Any, so their results are cast
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "equal": operator.eq,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+
+
+def _field_predicate_to_expr(predicate: Dict[str, Any]) -> nw.Expr:
+    col = nw.col(_plain_field(predicate["field"]))
+    ops = set(predicate) - {"field"}
+    if len(ops) != 1:
+        raise UnsupportedSpecError(f"filter {predicate}")
+    op = ops.pop()
+    value = predicate[op]
+    if _is_param_or_datetime(value):
+        raise UnsupportedSpecError(f"filter {predicate}")
+    if op in _COMPARISONS:
+        return cast(nw.Expr, _COMPARISONS[op](col, value))
+    if op == "oneOf":
+        return col.is_in(value)
+    if op == "valid":
+        return ~col.is_null() if value else col.is_null()
+    if op == "range" and len(value) == 2:
+        lo, hi = value
+        expr: nw.Expr = nw.lit(True)
+        if lo is not None:
+            expr = expr & (col >= lo)
+        if hi is not None:
+            expr = expr & (col <= hi)
+        return expr
+    raise UnsupportedSpecError(f"filter {predicate}")
+
+
+def _is_param_or_datetime(value: Any) -> bool:
+    if isinstance(value, dict):
+        return True
+    if isinstance(value, list):
+        return any(isinstance(v, dict) for v in value)
+    return False
+
+
+def _reduce(
+    exprs: List[nw.Expr], op: Callable[[nw.Expr, nw.Expr], nw.Expr]
+) -> nw.Expr:
+    result = exprs[0]
+    for expr in exprs[1:]:
+        result = op(result, expr)
+    return result
+
+
+# Time units
+
+
+def _parse_time_unit(time_unit: Any) -> List[str]:
+    if isinstance(time_unit, dict):
+        if set(time_unit) != {"unit"}:
+            raise UnsupportedSpecError(f"timeUnit {time_unit}")
+        time_unit = time_unit["unit"]
+    if not isinstance(time_unit, str) or time_unit.startswith("utc"):
+        raise UnsupportedSpecError(f"timeUnit {time_unit}")
+
+    units: List[str] = []
+    rest = time_unit
+    while rest:
+        for unit in _SUPPORTED_TIME_UNITS:
+            # "day" and "dayofyear" are not supported, so "date"
+            # is unambiguous
+            if rest.startswith(unit):
+                units.append(unit)
+                rest = rest[len(unit) :]
+                break
+        else:
+            raise UnsupportedSpecError(f"timeUnit {time_unit}")
+    return units
+
+
+def _time_component_expr(field_name: str, unit: str) -> nw.Expr:
+    dt = nw.col(field_name).dt
+    if unit == "year":
+        return dt.year()
+    if unit == "quarter":
+        return (dt.month() - 1) // 3
+    if unit == "month":
+        return dt.month()
+    if unit == "date":
+        return dt.day()
+    if unit == "hours":
+        return dt.hour()
+    if unit == "minutes":
+        return dt.minute()
+    if unit == "seconds":
+        return dt.second()
+    raise UnsupportedSpecError(f"timeUnit {unit}")
+
+
+def _time_component(dt: datetime.datetime, unit: str) -> int:
+    if unit == "year":
+        return dt.year
+    if unit == "quarter":
+        return (dt.month - 1) // 3
+    if unit == "month":
+        return dt.month
+    if unit == "date":
+        return dt.day
+    if unit == "hours":
+        return dt.hour
+    if unit == "minutes":
+        return dt.minute
+    if unit == "seconds":
+        return dt.second
+    raise UnsupportedSpecError(f"timeUnit {unit}")
+
+
+def _to_datetime(value: Any) -> datetime.datetime:
+    """Parse a datetime selected in the browser."""
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    # Milliseconds since epoch. Time units are in local time, like the
+    # naive datetimes of the reduced dataset.
+    return datetime.datetime.fromtimestamp(float(value) / 1000)
+
+
+def _assemble_time_unit(
+    df: nw.DataFrame[Any], key: _TimeUnitKey
+) -> nw.DataFrame[Any]:
+    """Build the truncated datetimes from their components.
+
+    This runs on the reduced frame, so a Python loop is cheap.
+    """
+    columns = {unit: df[helper].to_list() for unit, helper in key.components}
+    values: List[Optional[datetime.datetime]] = []
+    for i in range(len(df)):
+        parts = {unit: columns[unit][i] for unit in columns}
+        if any(v is None for v in parts.values()):
+            values.append(None)
+            continue
+        month = parts.get("month")
+        if month is None and "quarter" in parts:
+            month = int(parts["quarter"]) * 3 + 1
+        values.append(
+            datetime.datetime(
+                int(parts.get("year", _DEFAULT_YEAR)),
+                int(month or 1),
+                int(parts.get("date", 1)),
+                int(parts.get("hours", 0)),
+                int(parts.get("minutes", 0)),
+                int(parts.get("seconds", 0)),
+            )
+        )
+    series = nw.new_series(
+        key.output,
+        values,
+        nw.Datetime(),
+        native_namespace=nw.get_native_namespace(df),
+    )
+    return df.with_columns(series)
+
+
+def _plain_field(field_name: Any) -> str:
+    if not isinstance(field_name, str):
+        raise UnsupportedSpecError(f"field {field_name}")
+    # Nested or escaped field accessors
+    if any(c in field_name for c in ".[]\\"):
+        raise UnsupportedSpecError(f"field {field_name}")
+    return field_name
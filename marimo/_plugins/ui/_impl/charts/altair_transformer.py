@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, Dict, Literal, TypedDict, Union
+from typing import Any, Callable, Dict, Literal, TypedDict, Union
 
 import narwhals.stable.v1 as nw
-from narwhals.typing import IntoDataFrame
+from narwhals.stable.v1.typing import IntoDataFrame
 
 import marimo._output.data.data as mo_data
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._output.utils import build_data_url
+from marimo._plugins.ui._impl.charts.altair_aggregate import (
+    DEFERRED_DATA_NAME,
+)
 from marimo._plugins.ui._impl.tables.utils import (
     get_table_manager,
     get_table_manager_or_none,
@@ -59,6 +62,17 @@ def _to_marimo_csv(data: Data, **kwargs: Any) -> _ToCsvReturnUrlDict:
     return {"url": virtual_file.url, "format": {"type": "csv"}}
 
 
+def _to_marimo_deferred(data: Data, **kwargs: Any) -> Dict[str, str]:
+    """
+    Data transformer that does not serialize the data.
+
+    Used when the data is replaced after the spec is generated,
+    e.g. by a pre-aggregated dataset.
+    """
+    del data, kwargs
+    return {"name": DEFERRED_DATA_NAME}
+
+
 def _to_marimo_inline_csv(data: Data, **kwargs: Any) -> _ToCsvReturnUrlDict:
     """
     Custom implementation of altair.utils.data.to_csv that
@@ -132,7 +146,12 @@ def register_transformers() -> None:
 
     # Default to CSV. Due to the columnar nature of CSV, it is more efficient
     # than JSON for large datasets (~80% smaller file size).
-    alt.data_transformers.register("marimo", _to_marimo_csv)
-    alt.data_transformers.register("marimo_inline_csv", _to_marimo_inline_csv)
-    alt.data_transformers.register("marimo_json", _to_marimo_json)
-    alt.data_transformers.register("marimo_csv", _to_marimo_csv)
+    transformers: Dict[str, Callable[..., Any]] = {
+        "marimo": _to_marimo_csv,
+        "marimo_inline_csv": _to_marimo_inline_csv,
+        "marimo_json": _to_marimo_json,
+        "marimo_csv": _to_marimo_csv,
+        "marimo_deferred": _to_marimo_deferred,
+    }
+    for name, transformer in transformers.items():
+        alt.data_transformers.register(name, transformer)
@@ -16,7 +16,6 @@ from marimo._output.rich_help import mddoc
 from marimo._plugins.core.web_component import JSONType
 from marimo._plugins.ui._core.ui_element import UIElement
 from marimo._plugins.ui._impl.chat.utils import from_chat_message_dict
-from marimo._runtime.context.kernel_context import KernelRuntimeContext
 from marimo._runtime.context.types import ContextNotInitializedError
 from marimo._runtime.functions import EmptyArgs, Function
 from marimo._runtime.requests import SetUIElementValueRequest
@@ -215,6 +214,11 @@ class chat(UIElement[Dict[str, Any], List[ChatMessage]]):
             if self._on_change is not None:
                 self._on_change(self._value)
         else:
+            # The kernel context depends on the UI plugins
+            from marimo._runtime.context.kernel_context import (
+                KernelRuntimeContext,
+            )
+
             if isinstance(ctx, KernelRuntimeContext):
                 ctx._kernel.enqueue_control_request(
                     SetUIElementValueRequest(
@@ -81,7 +81,8 @@ class GetDataFrameError(Exception):
 class dataframe(UIElement[Dict[str, Any], DataFrameType]):
     """Run transformations on a DataFrame or series.
 
-    Currently only Pandas or Polars DataFrames are supported.
+    Currently only Pandas or Polars DataFrames are supported. Polars
+    LazyFrames stay lazy, and are only collected for the displayed rows.
 
     Examples:
         ```python
@@ -1,9 +1,10 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import Any, Generic, List, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar, cast
 
 from marimo._dependencies.dependencies import DependencyManager
+from marimo._metrics import CACHE_LOOKUPS
 from marimo._plugins.ui._impl.dataframes.transforms.handlers import (
     IbisTransformHandler,
     PandasTransformHandler,
@@ -52,9 +53,51 @@ def _apply_transforms(
 ) -> T:
     if not transforms.transforms:
         return df
-    for transform in transforms.transforms:
-        df = _handle(df, handler, transform)
-    return df
+    results = _apply_transforms_incrementally(
+        df, handler, transforms.transforms
+    )
+    result = results[-1]
+    assert result is not None
+    return result
+
+
+def _apply_transforms_incrementally(
+    df: T, handler: TransformHandler[T], transforms: List[Transform]
+) -> List[Optional[T]]:
+    """
+    Applies the transforms, returning the dataframe after each one.
+
+    Consecutive transforms that the handler supports lazily are fused
+    into a single query, so the backend can optimize them together;
+    their intermediate results are not materialized and are None.
+    """
+    results: List[Optional[T]] = []
+    # Lazy inputs stay lazy, and are collected by the caller
+    keep_lazy = handler.is_lazy(df)
+    lazy_df: Optional[T] = None
+    for transform in transforms:
+        if handler.supports_lazy(transform):
+            if lazy_df is None:
+                lazy_df = handler.as_lazy(df)
+            lazy_df = _handle(lazy_df, handler, transform)
+            results.append(None)
+            continue
+
+        if lazy_df is not None:
+            df = handler.collect(lazy_df)
+            results[-1] = df
+            lazy_df = None
+        # Transforms that are not lazy need the materialized data
+        df = _handle(handler.collect(df), handler, transform)
+        results.append(df)
+
+    if keep_lazy and results:
+        results[-1] = handler.as_lazy(
+            lazy_df if lazy_df is not None else cast(T, results[-1])
+        )
+    elif lazy_df is not None:
+        results[-1] = handler.collect(lazy_df)
+    return results
 
 
 def get_handler_for_dataframe(
@@ -73,7 +116,7 @@ def get_handler_for_dataframe(
     if DependencyManager.polars.imported():
         import polars as pl
 
-        if isinstance(df, pl.DataFrame):
+        if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
             return PolarsTransformHandler()
 
     if DependencyManager.ibis.imported():
@@ -85,7 +128,7 @@ def get_handler_for_dataframe(
     if DependencyManager.narwhals.imported():
         import narwhals as nw
 
-        if isinstance(df, nw.DataFrame):
+        if isinstance(df, (nw.DataFrame, nw.LazyFrame)):
             return get_handler_for_dataframe(df.to_native())
 
     raise ValueError(
@@ -94,69 +137,106 @@ def get_handler_for_dataframe(
     )
 
 
+# Memory budget for the intermediate dataframes kept by TransformsContainer
+DEFAULT_CACHE_BUDGET_BYTES = 256 * 1024 * 1024
+
+
 class TransformsContainer(Generic[T]):
     """
-    Keeps internal state of the last transformation applied to the dataframe.
-    So that we can incrementally apply transformations.
+    Keeps the dataframe after each applied transformation, keyed by the
+    prefix of transformations that produced it.
+
+    When the transformations change, we resume from the dataframe of the
+    longest unchanged prefix, e.g. editing the k-th transformation only
+    replays the transformations from k onwards.
+
+    Intermediate dataframes are evicted, earliest first, when they exceed
+    `max_cache_bytes`. The latest result is always kept.
     """
 
-    def __init__(self, df: T, handler: TransformHandler[T]) -> None:
+    def __init__(
+        self,
+        df: T,
+        handler: TransformHandler[T],
+        max_cache_bytes: int = DEFAULT_CACHE_BUDGET_BYTES,
+    ) -> None:
         self._original_df = df
-        # The dataframe for the given transform.
-        self._snapshot_df = df
         self._handler = handler
+        self._max_cache_bytes = max_cache_bytes
         self._transforms: List[Transform] = []
+        # The dataframe after applying self._transforms[: i + 1],
+        # or None if it was not materialized or was evicted.
+        self._snapshots: List[Optional[T]] = []
+        self._snapshot_sizes: List[int] = []
 
     def apply(self, transform: Transformations) -> T:
         """
         Applies the given transformations to the dataframe.
         """
-        # If the new transformations are a superset of the existing ones,
-        # then we can just apply the new ones to the snapshot dataframe.
-        if self._is_superset(transform):
-            transforms_to_apply = self._get_next_transformations(transform)
-            self._snapshot_df = _apply_transforms(
-                self._snapshot_df, self._handler, transforms_to_apply
+        transforms = transform.transforms
+        prefix_length = self._common_prefix_length(transform)
+
+        # Forget the snapshots of the transformations that changed
+        del self._transforms[prefix_length:]
+        del self._snapshots[prefix_length:]
+        del self._snapshot_sizes[prefix_length:]
+
+        # Resume from the longest prefix that is still cached
+        start = prefix_length
+        while start > 0 and self._snapshots[start - 1] is None:
+            start -= 1
+        df = self._original_df if start == 0 else self._snapshots[start - 1]
+        assert df is not None
+        if start == len(transforms):
+            CACHE_LOOKUPS.inc(cache="dataframe_transforms", result="hit")
+            return df
+        CACHE_LOOKUPS.inc(
+            cache="dataframe_transforms",
+            result="partial" if start > 0 else "miss",
+        )
+
+        results: List[Optional[T]] = []
+        if start < prefix_length:
+            # The unchanged prefix was fused into a single query, so it has
+            # no snapshot. Materialize it at the edited step, so that
+            # further edits of this step resume from there.
+            results = _apply_transforms_incrementally(
+                df, self._handler, transforms[start:prefix_length]
             )
-            self._transforms = transform.transforms
-            return self._snapshot_df
-
-        # If the new transformations are not a superset of the existing ones,
-        # then we need to start from the original dataframe.
-        else:
-            self._snapshot_df = _apply_transforms(
-                self._original_df, self._handler, transform
-            )
-            self._transforms = transform.transforms
-            return self._snapshot_df
-
-    def _is_superset(self, transforms: Transformations) -> bool:
+            df = cast(T, results[-1])
+        changed: List[Optional[T]] = _apply_transforms_incrementally(
+            df, self._handler, transforms[prefix_length:]
+        )
+        results += changed
+        self._transforms = list(transforms)
+        self._snapshots[start:] = results
+        self._snapshot_sizes[start:] = [
+            0 if result is None else self._handler.estimate_size(result)
+            for result in results
+        ]
+        self._evict()
+
+        result = self._snapshots[-1]
+        assert result is not None
+        return result
+
+    def _common_prefix_length(self, transforms: Transformations) -> int:
         """
-        Checks if the new transformations are a superset of the existing ones.
+        Number of leading transformations shared with the cached ones.
         """
-        if not self._transforms:
-            return False
-
-        # If the new transformations are smaller than the existing ones,
-        # then it's not a superset.
-        if len(self._transforms) > len(transforms.transforms):
-            return False
-
-        for i, transform in enumerate(self._transforms):
-            if transform != transforms.transforms[i]:
-                return False
-
-        return True
-
-    def _get_next_transformations(
-        self, transforms: Transformations
-    ) -> Transformations:
-        """
-        Gets the next transformations to apply.
-        """
-        if self._is_superset(transforms):
-            return Transformations(
-                transforms.transforms[len(self._transforms) :]
-            )
-        else:
-            return transforms
+        length = 0
+        for cached, transform in zip(self._transforms, transforms.transforms):
+            if cached != transform:
+                break
+            length += 1
+        return length
+
+    def _evict(self) -> None:
+        total = sum(self._snapshot_sizes[:-1])
+        for i in range(len(self._snapshots) - 1):
+            if total <= self._max_cache_bytes:
+                return
+            if self._snapshots[i] is not None:
+                total -= self._snapshot_sizes[i]
+                self._snapshots[i] = None
+                self._snapshot_sizes[i] = 0
@@ -23,6 +23,7 @@ from marimo._plugins.ui._impl.dataframes.transforms.types import (
     SortColumnTransform,
     Transform,
     TransformHandler,
+    TransformType,
 )
 from marimo._utils.assert_never import assert_never
 
@@ -32,6 +33,10 @@ if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
 
+# Number of rows of string columns measured to estimate the size of a
+# pandas dataframe
+_SIZE_SAMPLE_ROWS = 1000
+
 
 class PandasTransformHandler(TransformHandler["pd.DataFrame"]):
     @staticmethod
@@ -208,6 +213,24 @@ class PandasTransformHandler(TransformHandler["pd.DataFrame"]):
             pd.DataFrame(df.pop(cast(str, column_id)).values.tolist())
         )
 
+    @staticmethod
+    def estimate_size(df: "pd.DataFrame") -> int:
+        size = int(df.memory_usage(index=True, deep=False).sum())
+        # A shallow count only includes the pointers of string (object)
+        # columns; measuring their contents is O(n) in Python, so they are
+        # extrapolated from an evenly spaced sample of the rows
+        columns = df.select_dtypes(include=["object", "string"])
+        num_rows = len(columns)
+        if num_rows == 0 or columns.shape[1] == 0:
+            return size
+        step = -(-num_rows // _SIZE_SAMPLE_ROWS)
+        sample = columns.iloc[::step]
+        contents = int(
+            sample.memory_usage(index=False, deep=True).sum()
+            - sample.memory_usage(index=False, deep=False).sum()
+        )
+        return size + contents * num_rows // len(sample)
+
     @staticmethod
     def as_python_code(
         df_name: str, columns: List[str], transforms: List[Transform]
@@ -264,7 +287,7 @@ class PolarsTransformHandler(TransformHandler["pl.DataFrame"]):
         # Iterate over all conditions and build the filter expression
         for condition in transform.where:
             column = col(str(condition.column_id))
-            dtype = df.schema[str(condition.column_id)]
+            dtype = df.collect_schema()[str(condition.column_id)]
             value = condition.value
 
             # If columns type is a Datetime, we need to convert the value to a datetime
@@ -342,7 +365,7 @@ class PolarsTransformHandler(TransformHandler["pl.DataFrame"]):
         group_by_column_id_set = set(transform.column_ids)
         agg_columns = [
             column_id
-            for column_id in df.columns
+            for column_id in df.collect_schema().names()
             if column_id not in group_by_column_id_set
         ]
         for column_id in agg_columns:
@@ -439,6 +462,39 @@ class PolarsTransformHandler(TransformHandler["pl.DataFrame"]):
         df = df.drop(cast(str, column_id))
         return df.hstack(pl.DataFrame(column.to_list()))
 
+    @staticmethod
+    def supports_lazy(transform: Transform) -> bool:
+        return transform.type in _POLARS_LAZY_TRANSFORMS
+
+    @staticmethod
+    def is_lazy(df: "pl.DataFrame") -> bool:
+        import polars as pl
+
+        return isinstance(df, pl.LazyFrame)
+
+    @staticmethod
+    def as_lazy(df: "pl.DataFrame") -> "pl.DataFrame":
+        # The lazy frame is only passed to the transforms
+        # in `_POLARS_LAZY_TRANSFORMS`, which support both
+        return cast("pl.DataFrame", df.lazy())
+
+    @staticmethod
+    def collect(df: "pl.DataFrame") -> "pl.DataFrame":
+        import polars as pl
+
+        if isinstance(df, pl.LazyFrame):
+            return df.collect()
+        return df
+
+    @staticmethod
+    def estimate_size(df: "pl.DataFrame") -> int:
+        import polars as pl
+
+        # A LazyFrame only holds its query plan
+        if isinstance(df, pl.LazyFrame):
+            return 0
+        return int(df.estimated_size())
+
     @staticmethod
     def as_python_code(
         df_name: str, columns: List[str], transforms: List[Transform]
@@ -448,6 +504,18 @@ class PolarsTransformHandler(TransformHandler["pl.DataFrame"]):
         )
 
 
+# Transforms whose polars implementation also works on a LazyFrame
+_POLARS_LAZY_TRANSFORMS = {
+    TransformType.COLUMN_CONVERSION,
+    TransformType.RENAME_COLUMN,
+    TransformType.SORT_COLUMN,
+    TransformType.FILTER_ROWS,
+    TransformType.GROUP_BY,
+    TransformType.SELECT_COLUMNS,
+    TransformType.EXPLODE_COLUMNS,
+}
+
+
 class IbisTransformHandler(TransformHandler["ibis.Table"]):
     @staticmethod
     def handle_column_conversion(
@@ -238,6 +238,40 @@ class TransformHandler(abc.ABC, Generic[T]):
     def handle_expand_dict(df: T, transform: ExpandDictTransform) -> T:
         raise NotImplementedError
 
+    @staticmethod
+    def supports_lazy(transform: Transform) -> bool:
+        """Whether the transform can be applied to the frame from `as_lazy`.
+
+        Consecutive lazy transforms are fused into a single query, which
+        is only collected once.
+        """
+        del transform
+        return False
+
+    @staticmethod
+    def is_lazy(df: T) -> bool:
+        """Whether the dataframe is a lazy query that was never collected.
+
+        Lazy inputs produce lazy results, so they are only collected
+        for the rows that are displayed.
+        """
+        del df
+        return False
+
+    @staticmethod
+    def as_lazy(df: T) -> T:
+        return df
+
+    @staticmethod
+    def collect(df: T) -> T:
+        return df
+
+    @staticmethod
+    def estimate_size(df: T) -> int:
+        """Estimated size in bytes of the data held by the dataframe."""
+        del df
+        return 0
+
     @staticmethod
     def as_python_code(
         df_name: str, columns: List[str], transforms: List[Transform]
@@ -13,6 +13,7 @@ from typing import (
     Optional,
     Sequence,
     Union,
+    get_args,
 )
 
 from narwhals.typing import IntoDataFrame
@@ -34,6 +35,7 @@ from marimo._plugins.ui._impl.dataframes.transforms.types import (
 )
 from marimo._plugins.ui._impl.tables.table_manager import (
     ColumnName,
+    DownloadFormat,
     TableManager,
 )
 from marimo._plugins.ui._impl.tables.utils import get_table_manager
@@ -47,7 +49,7 @@ LOGGER = _loggers.marimo_logger()
 
 @dataclass
 class DownloadAsArgs:
-    format: Literal["csv", "json"]
+    format: DownloadFormat
 
 
 @dataclass
@@ -452,17 +454,18 @@ class table(UIElement[List[str], Union[List[JSONType], IntoDataFrame]]):
         """Download the table data in the specified format.
 
         Downloads selected rows if there are any, otherwise downloads all rows.
-        Raw data is downloaded without any formatting applied.
+        Raw data is downloaded without any formatting applied. The file is
+        streamed to disk in chunks rather than encoded in memory.
 
         Args:
             args (DownloadAsArgs): Arguments specifying the download format.
-                format must be one of 'csv' or 'json'.
+                format must be one of 'csv', 'json', 'parquet' or 'arrow'.
 
         Returns:
             str: URL to download the data file.
 
         Raises:
-            ValueError: If format is not 'csv' or 'json'.
+            ValueError: If format is not 'csv', 'json', 'parquet' or 'arrow'.
         """
         manager = (
             self._selected_manager
@@ -471,12 +474,13 @@ class table(UIElement[List[str], Union[List[JSONType], IntoDataFrame]]):
         )
 
         ext = args.format
-        if ext == "csv":
-            return mo_data.csv(manager.to_csv()).url
-        elif ext == "json":
-            return mo_data.json(manager.to_json()).url
-        else:
-            raise ValueError("format must be one of 'csv' or 'json'.")
+        if ext not in get_args(DownloadFormat):
+            raise ValueError(
+                "format must be one of 'csv', 'json', 'parquet' or 'arrow'."
+            )
+        return mo_data.stream(
+            lambda file: manager.export_to(file, ext), ext=ext
+        ).url
 
     def _get_column_summaries(self, args: EmptyArgs) -> ColumnSummaries:
         """Get statistical summaries for each column in the table.
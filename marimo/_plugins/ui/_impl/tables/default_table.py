@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from typing import (
+    IO,
     Any,
     Dict,
     List,
@@ -29,6 +30,7 @@ from marimo._plugins.ui._impl.tables.polars_table import (
 )
 from marimo._plugins.ui._impl.tables.table_manager import (
     ColumnName,
+    DownloadFormat,
     FieldType,
     FieldTypes,
     TableManager,
@@ -105,6 +107,16 @@ class DefaultTableManager(TableManager[JsonTableData]):
             ).to_json()
         return self._as_table_manager().to_json()
 
+    def export_to(self, file: IO[bytes], file_format: DownloadFormat) -> None:
+        if file_format == "csv" or file_format == "json":
+            return super().export_to(file, file_format)
+        if isinstance(self.data, dict) and not self.is_column_oriented:
+            return DefaultTableManager(
+                self._normalize_data(self.data)
+            ).export_to(file, file_format)
+        # Binary formats need a dataframe library
+        return self._as_table_manager().export_to(file, file_format)
+
     def select_rows(self, indices: List[int]) -> DefaultTableManager:
         if isinstance(self.data, dict):
             # Column major data
@@ -1,7 +1,8 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
-from typing import Any, Optional, Tuple
+import re
+from typing import Any, Dict, Optional, Tuple
 
 from marimo._data.models import (
     ColumnSummary,
@@ -25,6 +26,12 @@ from marimo._plugins.ui._impl.tables.table_manager import (
 )
 from marimo._utils.memoize import memoize_last_value
 
+# Queries that can't be matched with a plain ILIKE pattern
+_REGEX_OR_WILDCARD = re.compile(r"[\\^$.|?*+()\[\]{}%_]")
+
+# Number of derived views (e.g. one per search query) kept per table
+_MAX_VIEWS = 16
+
 
 class IbisTableManagerFactory(TableManagerFactory):
     @staticmethod
@@ -38,6 +45,36 @@ class IbisTableManagerFactory(TableManagerFactory):
         class IbisTableManager(TableManager[ibis.Table]):
             type = "ibis"
 
+            def __init__(self, data: ibis.Table) -> None:
+                super().__init__(data)
+                # Views derived from this one (search, sort) and the
+                # aggregates computed on it, so that repeated requests
+                # reuse the same expressions instead of rebuilding and
+                # re-executing them.
+                self._views: Dict[Tuple[Any, ...], IbisTableManager] = {}
+                self._summaries: Dict[str, ColumnSummary] = {}
+
+            def _view(
+                self, key: Tuple[Any, ...], data: ibis.Table
+            ) -> IbisTableManager:
+                view = self._cached_view(key)
+                if view is None:
+                    view = self._views[key] = IbisTableManager(data)
+                    # Keep the most recently used views only, since every
+                    # search query typed creates one
+                    while len(self._views) > _MAX_VIEWS:
+                        del self._views[next(iter(self._views))]
+                return view
+
+            def _cached_view(
+                self, key: Tuple[Any, ...]
+            ) -> Optional[IbisTableManager]:
+                view = self._views.pop(key, None)
+                if view is not None:
+                    # Mark as most recently used
+                    self._views[key] = view
+                return view
+
             def to_csv(
                 self, format_mapping: Optional[FormatMapping] = None
             ) -> bytes:
@@ -90,53 +127,73 @@ class IbisTableManagerFactory(TableManagerFactory):
 
             def search(self, query: str) -> TableManager[Any]:
                 query = query.lower()
+                key = ("search", query)
+                cached = self._cached_view(key)
+                if cached is not None:
+                    return cached
+
+                # Plain queries compile to ILIKE, which backends evaluate
+                # without a regex engine. Otherwise, string columns are
+                # matched as a regex and other columns literally.
+                use_like = not _REGEX_OR_WILDCARD.search(query)
+                pattern = f"%{query}%"
+
+                def matches(col: Any) -> Any:
+                    if use_like:
+                        return col.ilike(pattern)
+                    return col.lower().rlike(query)
+
+                def matches_literal(col: Any) -> Any:
+                    if use_like:
+                        return col.ilike(pattern)
+                    return col.lower().contains(query)
+
                 predicates = []
                 for column in self.data.columns:
                     col = self.data[column]
-                    if col.type().is_string():
-                        predicates.append(col.lower().rlike(query))
-                    elif col.type().is_numeric():
-                        predicates.append(
-                            col.cast("string").lower().contains(query)
-                        )
-                    elif col.type().is_boolean():
-                        predicates.append(
-                            col.cast("string").lower().contains(query)
-                        )
-                    elif col.type().is_timestamp():
-                        predicates.append(
-                            col.cast("string").lower().contains(query)
-                        )
-                    elif col.type().is_date():
-                        predicates.append(
-                            col.cast("string").lower().contains(query)
-                        )
-                    elif col.type().is_time():
-                        predicates.append(
-                            col.cast("string").lower().contains(query)
-                        )
+                    dtype = col.type()
+                    if dtype.is_string():
+                        predicates.append(matches(col))
+                    elif (
+                        dtype.is_numeric()
+                        or dtype.is_boolean()
+                        or dtype.is_timestamp()
+                        or dtype.is_date()
+                        or dtype.is_time()
+                    ):
+                        predicates.append(matches_literal(col.cast("string")))
 
                 if predicates:
                     filtered = self.data.filter(ibis.or_(*predicates))
                 else:
                     filtered = self.data.filter(ibis.literal(False))
 
-                return IbisTableManager(filtered)
+                return self._view(key, filtered)
 
             def get_summary(self, column: str) -> ColumnSummary:
-                col = self.data[column]
-                total = self.data.count().execute()
-                nulls = col.isnull().sum().execute()
-
-                summary = ColumnSummary(total=total, nulls=nulls)
+                if column in self._summaries:
+                    return self._summaries[column]
 
+                # Compute all statistics in a single aggregation query
+                col = self.data[column]
+                metrics = {
+                    "total": self.data.count(),
+                    "nulls": col.isnull().sum(),
+                }
                 if col.type().is_numeric():
-                    summary.min = col.min().execute()
-                    summary.max = col.max().execute()
-                    summary.mean = col.mean().execute()
-                    summary.median = col.median().execute()
-                    summary.std = col.std().execute()
+                    metrics.update(
+                        min=col.min(),
+                        max=col.max(),
+                        mean=col.mean(),
+                        median=col.median(),
+                        std=col.std(),
+                    )
+                row = self.data.aggregate(**metrics).to_pyarrow().to_pylist()
+                summary = ColumnSummary(**row[0])
+                # Sum over an empty table is NULL
+                summary.nulls = summary.nulls or 0
 
+                self._summaries[column] = summary
                 return summary
 
             @memoize_last_value
@@ -174,7 +231,7 @@ class IbisTableManagerFactory(TableManagerFactory):
                 sorted_data = self.data.order_by(
                     ibis.desc(by) if descending else ibis.asc(by)
                 )
-                return IbisTableManager(sorted_data)
+                return self._view(("sort", by, descending), sorted_data)
 
             def get_field_type(
                 self, column_name: str
@@ -1,20 +1,23 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import io
 import json
 from functools import cached_property
-from typing import Any, Optional, Tuple, Union, cast
+from typing import IO, Any, Optional, Tuple, Union, cast
 
 import narwhals.stable.v1 as nw
 from narwhals.stable.v1.typing import IntoFrameT
 
 from marimo._data.models import ColumnSummary, ExternalDataType
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._impl.tables.format import (
     FormatMapping,
     format_value,
 )
 from marimo._plugins.ui._impl.tables.table_manager import (
     ColumnName,
+    DownloadFormat,
     FieldType,
     TableManager,
 )
@@ -27,6 +30,12 @@ from marimo._utils.narwhals_utils import (
     unwrap_py_scalar,
 )
 
+# Temporary column used to address rows by position in lazy frames
+_ROW_INDEX = "__marimo_row_index__"
+
+# Number of rows encoded at a time when exporting to text formats
+EXPORT_CHUNK_SIZE = 50_000
+
 
 class NarwhalsTableManager(
     TableManager[Union[nw.DataFrame[IntoFrameT], nw.LazyFrame[IntoFrameT]]]
@@ -65,6 +74,61 @@ class NarwhalsTableManager(
         csv_reader = csv.DictReader(csv_str.splitlines())
         return json.dumps([row for row in csv_reader]).encode("utf-8")
 
+    def export_to(self, file: IO[bytes], file_format: DownloadFormat) -> None:
+        frame = self.as_frame()
+        if nw.get_level(frame) == "interchange":
+            # Interchange-level frames don't support slicing or writing,
+            # so we convert to PyArrow in this case
+            frame = nw.from_native(frame.to_arrow(), eager_only=True)
+
+        if file_format == "csv" or file_format == "json":
+            self._export_text_in_chunks(frame, file, file_format)
+        elif file_format == "parquet":
+            # Any binary file works, not only BytesIO
+            frame.write_parquet(cast(io.BytesIO, file))
+        elif file_format == "arrow":
+            DependencyManager.pyarrow.require(why="to download as Arrow")
+            import pyarrow as pa  # type: ignore
+
+            table = frame.to_arrow()
+            with pa.ipc.new_file(file, table.schema) as writer:
+                writer.write_table(table, max_chunksize=EXPORT_CHUNK_SIZE)
+        else:
+            super().export_to(file, file_format)
+
+    def _export_text_in_chunks(
+        self,
+        frame: nw.DataFrame[Any],
+        file: IO[bytes],
+        file_format: DownloadFormat,
+    ) -> None:
+        # Encode a slice of rows at a time, so only one chunk of the
+        # encoded file is in memory. Slices of the frame are views.
+        num_rows = frame.shape[0]
+        if file_format == "json":
+            file.write(b"[")
+        has_records = False
+        for i, offset in enumerate(
+            range(0, max(num_rows, 1), EXPORT_CHUNK_SIZE)
+        ):
+            chunk = self.with_new_data(
+                frame[offset : offset + EXPORT_CHUNK_SIZE]
+            )
+            if file_format == "csv":
+                data = chunk.to_csv()
+                # Only keep the header of the first chunk
+                file.write(data if i == 0 else data.split(b"\n", 1)[-1])
+                continue
+            # Splice the records of each chunk into a single array
+            records = chunk.to_json().strip()[1:-1].strip()
+            if records:
+                if has_records:
+                    file.write(b",")
+                file.write(records)
+                has_records = True
+        if file_format == "json":
+            file.write(b"]")
+
     def apply_formatting(
         self, format_mapping: Optional[FormatMapping]
     ) -> NarwhalsTableManager[Any]:
@@ -87,6 +151,13 @@ class NarwhalsTableManager(
         return True
 
     def select_rows(self, indices: list[int]) -> TableManager[Any]:
+        if isinstance(self.data, nw.LazyFrame):
+            # Keep the selection lazy, it is only collected when used
+            return self.with_new_data(
+                self.data.with_row_index(_ROW_INDEX)
+                .filter(nw.col(_ROW_INDEX).is_in(indices))
+                .drop(_ROW_INDEX)
+            )
         df = self.as_frame()
         return self.with_new_data(df[indices])
 
@@ -104,7 +175,7 @@ class NarwhalsTableManager(
 
     @cached_property
     def nw_schema(self) -> nw.Schema:
-        return cast(nw.Schema, self.data.schema)
+        return cast(nw.Schema, self.data.collect_schema())
 
     def get_field_type(
         self, column_name: str
@@ -131,6 +202,17 @@ class NarwhalsTableManager(
             raise ValueError("Count must be a positive integer")
         if offset < 0:
             raise ValueError("Offset must be a non-negative integer")
+        if isinstance(self.data, nw.LazyFrame):
+            if offset == 0:
+                return self.with_new_data(self.data.head(count))
+            return self.with_new_data(
+                self.data.with_row_index(_ROW_INDEX)
+                .filter(
+                    (nw.col(_ROW_INDEX) >= offset)
+                    & (nw.col(_ROW_INDEX) < offset + count)
+                )
+                .drop(_ROW_INDEX)
+            )
         return self.with_new_data(self.data[offset : offset + count])
 
     def search(self, query: str) -> TableManager[Any]:
@@ -177,6 +259,8 @@ class NarwhalsTableManager(
         # If column is not in the dataframe, return an empty summary
         if column not in self.nw_schema:
             return ColumnSummary()
+        if isinstance(self.data, nw.LazyFrame):
+            return self._get_lazy_summary(column)
         col = self.data[column]
         total = len(col)
         if is_narwhals_string_type(col.dtype):
@@ -263,9 +347,76 @@ class NarwhalsTableManager(
             p95=col.quantile(0.95, interpolation="nearest"),
         )
 
+    def _get_lazy_summary(self, column: str) -> ColumnSummary:
+        # Build the summary as a single aggregation query, so only
+        # one row of statistics is collected instead of the column.
+        dtype = self.nw_schema[column]
+        col = nw.col(column)
+        exprs: dict[str, Any] = {"total": nw.len(), "nulls": col.null_count()}
+
+        def add_quantiles() -> None:
+            for key, quantile in (
+                ("median", 0.5),
+                ("p5", 0.05),
+                ("p25", 0.25),
+                ("p75", 0.75),
+                ("p95", 0.95),
+            ):
+                exprs[key] = col.quantile(quantile, interpolation="nearest")
+
+        unit = ""
+        if is_narwhals_string_type(dtype):
+            exprs["unique"] = col.n_unique()
+        elif dtype == nw.Boolean:
+            exprs["true"] = col.sum()
+        elif dtype == nw.Date:
+            # Quantile not supported on date type
+            exprs.update(min=col.min(), max=col.max(), mean=col.mean())
+        elif is_narwhals_temporal_type(dtype):
+            exprs.update(min=col.min(), max=col.max(), mean=col.mean())
+            add_quantiles()
+        elif dtype == nw.Duration and isinstance(dtype, nw.Duration):
+            unit_map = {
+                "ms": (col.dt.total_milliseconds, "ms"),
+                "ns": (col.dt.total_nanoseconds, "ns"),
+                "us": (col.dt.total_microseconds, "μs"),
+                "s": (col.dt.total_seconds, "s"),
+            }
+            method, unit = unit_map[dtype.time_unit]
+            res = method()
+            exprs.update(min=res.min(), max=res.max(), mean=res.mean())
+        elif dtype in (nw.List, nw.Struct, nw.Object, nw.Array, nw.Unknown):
+            pass
+        else:
+            if is_narwhals_integer_type(dtype):
+                exprs["unique"] = col.n_unique()
+            exprs.update(
+                min=col.min(), max=col.max(), mean=col.mean(), std=col.std()
+            )
+            add_quantiles()
+
+        data = self.data
+        assert isinstance(data, nw.LazyFrame)
+        stats = data.select(**exprs).collect().rows(named=True)[0]
+        if dtype == nw.Boolean:
+            stats["false"] = stats["total"] - stats["true"]
+        if unit:
+            for key in ("min", "max", "mean"):
+                stats[key] = str(stats[key]) + unit
+        return ColumnSummary(**stats)
+
+    @cached_property
+    def _lazy_num_rows(self) -> int:
+        # Count the rows without materializing them
+        data = self.data
+        assert isinstance(data, nw.LazyFrame)
+        return cast(int, data.select(nw.len()).collect().item())
+
     def get_num_rows(self, force: bool = True) -> Optional[int]:
-        # If force is true, collect the data and get the number of rows
+        # If force is true, count the rows, even if the data is lazy
         if force:
+            if isinstance(self.data, nw.LazyFrame):
+                return self._lazy_num_rows
             return self.as_frame().shape[0]
 
         # When lazy, we don't know the number of rows
@@ -286,12 +437,25 @@ class NarwhalsTableManager(
         return self.nw_schema.names()
 
     def get_unique_column_values(self, column: str) -> list[str | int | float]:
+        if isinstance(self.data, nw.LazyFrame):
+            return (
+                self.data.select(nw.col(column).unique())
+                .collect()[column]
+                .to_list()
+            )
         return self.data[column].unique().to_list()
 
     def get_sample_values(self, column: str) -> list[Any]:
         # Sample 3 values from the column
         SAMPLE_SIZE = 3
         try:
+            if isinstance(self.data, nw.LazyFrame):
+                return (
+                    self.data.select(column)
+                    .head(SAMPLE_SIZE)
+                    .collect()[column]
+                    .to_list()
+                )
             return self.data[column].head(SAMPLE_SIZE).to_list()
         except Exception:
             # May be metadata-only frame
@@ -51,7 +51,9 @@ class PolarsTableManagerFactory(TableManagerFactory):
 
             @cached_property
             def schema(self) -> dict[str, pl.DataType]:
-                return self._original_data.schema
+                # collect_schema() resolves a LazyFrame's schema
+                # without running the query
+                return dict(self._original_data.collect_schema())
 
             # We override narwhals's to_csv to handle polars
             # nested data types.
@@ -130,7 +132,18 @@ class PolarsTableManagerFactory(TableManagerFactory):
 
             @staticmethod
             def is_type(value: Any) -> bool:
-                return isinstance(value, pl.DataFrame)
+                return isinstance(value, (pl.DataFrame, pl.LazyFrame))
+
+            def take(self, count: int, offset: int) -> PolarsTableManager:
+                if count < 0:
+                    raise ValueError("Count must be a positive integer")
+                if offset < 0:
+                    raise ValueError("Offset must be a non-negative integer")
+                # slice is pushed down into the query plan of a LazyFrame,
+                # so only the requested page is collected
+                return PolarsTableManager(
+                    self._original_data.slice(offset, count)
+                )
 
             def search(self, query: str) -> PolarsTableManager:
                 query = query.lower()
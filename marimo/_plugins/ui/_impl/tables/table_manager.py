@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import abc
 from typing import (
+    IO,
     Any,
     Generic,
+    Literal,
     Optional,
     Tuple,
     TypeVar,
@@ -20,6 +22,7 @@ T = TypeVar("T")
 ColumnName = str
 FieldType = DataType
 FieldTypes = list[Tuple[ColumnName, Tuple[FieldType, ExternalDataType]]]
+DownloadFormat = Literal["csv", "json", "parquet", "arrow"]
 
 
 class TableManager(abc.ABC, Generic[T]):
@@ -87,6 +90,21 @@ class TableManager(abc.ABC, Generic[T]):
     def to_json(self) -> bytes:
         raise NotImplementedError
 
+    def export_to(self, file: IO[bytes], file_format: DownloadFormat) -> None:
+        """
+        Write the data in the given download format to a binary file.
+
+        By default, the whole file is encoded in memory with `to_csv` or
+        `to_json`. Managers of dataframes override this to write in chunks
+        and to support the binary formats.
+        """
+        if file_format == "csv":
+            file.write(self.to_csv())
+        elif file_format == "json":
+            file.write(self.to_json())
+        else:
+            raise ValueError(f"Downloading as {file_format} is not supported.")
+
     @abc.abstractmethod
     def select_rows(self, indices: list[int]) -> TableManager[Any]:
         raise NotImplementedError
@@ -6,7 +6,6 @@ from typing import Callable, Final, Optional
 from marimo._output.formatting import as_html
 from marimo._output.md import md
 from marimo._output.rich_help import mddoc
-from marimo._plugins.stateless.lazy import lazy as lazy_ui
 from marimo._plugins.ui._core.ui_element import UIElement
 
 
@@ -68,6 +67,9 @@ class tabs(UIElement[str, str]):
         label: str = "",
         on_change: Optional[Callable[[str], None]] = None,
     ) -> None:
+        # mo.lazy is itself a UI element, so it's imported lazily
+        from marimo._plugins.stateless.lazy import lazy as lazy_ui
+
         def render_content(tab: object) -> str:
             if lazy:
                 return lazy_ui(tab).text
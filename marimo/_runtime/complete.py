@@ -1,10 +1,14 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import ast
+import copy
 import html
+import os
 import threading
 import time
 from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import jedi  # type: ignore # noqa: F401
@@ -25,6 +29,8 @@ from marimo._utils.rst_to_html import convert_rst_to_html
 if TYPE_CHECKING:
     import threading
 
+    from marimo._ast.cell import CellId_t, CellImpl
+
 LOGGER = loggers.marimo_logger()
 
 
@@ -308,10 +314,167 @@ def _drain_queue(
     return request
 
 
+def _stub_cell_code(code: str, defs: set[str]) -> str:
+    """Reduce a cell's code to a stub of the names it defines.
+
+    Only imports, assignments to the cell's definitions, and the signatures
+    of its functions and classes are kept, hoisted out of any control flow.
+    Everything else, like function bodies, loops or the cell's output,
+    doesn't contribute to the namespace, but can be expensive for Jedi to
+    analyze.
+    """
+    try:
+        module = ast.parse(code)
+    except SyntaxError:
+        return code
+    body = _stub_statements(module.body, defs)
+    return ast.unparse(ast.Module(body=body, type_ignores=[]))
+
+
+def _stub_statements(stmts: list[ast.stmt], defs: set[str]) -> list[ast.stmt]:
+    stubs: list[ast.stmt] = []
+    for stmt in stmts:
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            if any(
+                (alias.asname or alias.name).split(".")[0] in defs
+                for alias in stmt.names
+            ):
+                stubs.append(stmt)
+        elif isinstance(
+            stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            if stmt.name in defs:
+                stubs.append(_stub_definition(stmt))
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            targets: list[ast.expr] = (
+                stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            )
+            if _assigned_names(targets) & defs:
+                stubs.append(stmt)
+        else:
+            # Definitions in control flow, e.g. an import in a try block
+            blocks = [
+                getattr(stmt, "body", None),
+                *(
+                    handler.body
+                    for handler in ast.iter_child_nodes(stmt)
+                    if isinstance(handler, ast.ExceptHandler)
+                ),
+                getattr(stmt, "orelse", None),
+                getattr(stmt, "finalbody", None),
+            ]
+            for block in blocks:
+                if isinstance(block, list):
+                    stubs.extend(_stub_statements(block, defs))
+    return stubs
+
+
+def _stub_definition(
+    node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef,
+) -> ast.stmt:
+    """A copy of a function or class definition with its body stubbed out.
+
+    Functions keep their signature and docstring; classes keep their
+    docstring, attributes, and stubs of their methods and nested classes.
+    """
+    body: list[ast.stmt] = []
+    docstring = ast.get_docstring(node, clean=False)
+    if docstring is not None:
+        body.append(ast.Expr(ast.Constant(docstring)))
+    if isinstance(node, ast.ClassDef):
+        for stmt in node.body:
+            if isinstance(
+                stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            ):
+                body.append(_stub_definition(stmt))
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                body.append(stmt)
+    if not body:
+        body.append(ast.Expr(ast.Constant(...)))
+    stub = copy.copy(node)
+    stub.body = body
+    return stub
+
+
+def _assigned_names(targets: list[ast.expr]) -> set[str]:
+    names: set[str] = set()
+    for target in targets:
+        if isinstance(target, ast.Name):
+            names.add(target.id)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            names |= _assigned_names(target.elts)
+        elif isinstance(target, ast.Starred):
+            names |= _assigned_names([target.value])
+    return names
+
+
+class CompletionIndex:
+    """Long-lived state for static completions, shared across requests.
+
+    Holds a stub of each cell's code, rebuilt only when the cell's code
+    changes, and the concatenated stubs of the cells other than the one
+    being completed. Cells that don't define any names are left out.
+
+    Scripts are created with a stable path and project, so that parso can
+    incrementally reparse the source between requests.
+    """
+
+    def __init__(self) -> None:
+        self._stubs: dict[CellId_t, tuple[str, str]] = {}
+        self._source_key: tuple[Any, ...] | None = None
+        self._source = ""
+        self._project: jedi.Project | None = None
+        self._project_cwd: str | None = None
+        self._path = Path(f"__marimo_completions_{id(self)}__.py")
+
+    def _stub(self, cell_id: CellId_t, cell: CellImpl) -> str:
+        cached = self._stubs.get(cell_id)
+        if cached is not None and cached[0] == cell.code:
+            return cached[1]
+        stub = _stub_cell_code(cell.code, set(cell.defs))
+        self._stubs[cell_id] = (cell.code, stub)
+        return stub
+
+    def source(self, graph: dataflow.DirectedGraph, cell_id: CellId_t) -> str:
+        """Source of the cells other than `cell_id`, in topological order."""
+        with graph.lock:
+            key = (
+                cell_id,
+                tuple((cid, cell.code) for cid, cell in graph.cells.items()),
+            )
+            if key == self._source_key:
+                return self._source
+
+            cell_ids = [
+                cid
+                for cid in dataflow.topological_sort(
+                    graph, set(graph.cells.keys()) - set([cell_id])
+                )
+                if graph.cells[cid].defs
+            ]
+            stubs = [self._stub(cid, graph.cells[cid]) for cid in cell_ids]
+
+        # Forget cells that were deleted
+        for cid in set(self._stubs) - set(graph.cells):
+            del self._stubs[cid]
+        self._source_key = key
+        self._source = "\n".join(stubs)
+        return self._source
+
+    def script(self, code: str) -> jedi.Script:
+        cwd = os.getcwd()
+        if self._project is None or self._project_cwd != cwd:
+            self._project = jedi.get_default_project(cwd)
+            self._project_cwd = cwd
+        return jedi.Script(
+            code, path=Path(cwd) / self._path, project=self._project
+        )
+
+
 def _get_completions_with_script(
-    codes: list[str], document: str
+    index: CompletionIndex, source: str, document: str
 ) -> tuple[jedi.Script, list[jedi.api.classes.Completion]]:
-    script = jedi.Script("\n".join(codes + [document]))
+    script = index.script(source + "\n" + document if source else document)
     completions = script.complete()
     return script, completions
 
@@ -337,7 +500,8 @@ def _get_completions_with_interpreter(
 
 
 def _get_completions(
-    codes: list[str],
+    index: CompletionIndex,
+    source: str,
     document: str,
     glbls: dict[str, Any],
     glbls_lock: threading.RLock,
@@ -348,10 +512,14 @@ def _get_completions(
             document, glbls, glbls_lock
         )
         if not completions:
-            script, completions = _get_completions_with_script(codes, document)
+            script, completions = _get_completions_with_script(
+                index, source, document
+            )
         return script, completions
     else:
-        script, completions = _get_completions_with_script(codes, document)
+        script, completions = _get_completions_with_script(
+            index, source, document
+        )
         if not completions:
             script, completions = _get_completions_with_interpreter(
                 document, glbls, glbls_lock
@@ -368,6 +536,7 @@ def complete(
     docstrings_limit: int = 80,
     timeout: float | None = None,
     prefer_interpreter_completion: bool = False,
+    index: CompletionIndex | None = None,
 ) -> None:
     """Gets code completions for a request.
 
@@ -391,23 +560,20 @@ def complete(
             and docstrings
         timeout: Timeout after which we'll stop fetching type hints/docstrings
         prefer_interpreter_completion: Whether to prefer interpreter completion
+        index: Completion index to reuse across requests
     """
     if not request.document.strip():
         _write_no_completions(stream, request.id)
         return
 
-    with graph.lock:
-        codes = [
-            graph.cells[cid].code
-            for cid in dataflow.topological_sort(
-                graph,
-                set(graph.cells.keys()) - set([request.cell_id]),
-            )
-        ]
+    if index is None:
+        index = CompletionIndex()
+    source = index.source(graph, request.cell_id)
 
     try:
         script, completions = _get_completions(
-            codes,
+            index,
+            source,
             request.document,
             glbls,
             glbls_lock,
@@ -512,6 +678,7 @@ def completion_worker(
     - `stream`: stream used to communicate completion results
     """
 
+    index = CompletionIndex()
     while True:
         request = _drain_queue(completion_queue)
         complete(
@@ -520,4 +687,5 @@ def completion_worker(
             glbls=glbls,
             glbls_lock=glbls_lock,
             stream=stream,
+            index=index,
         )
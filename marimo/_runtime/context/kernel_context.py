@@ -131,6 +131,7 @@ def create_kernel_context(
     mode: SessionMode,
     app: InternalApp | None = None,
     parent: KernelRuntimeContext | None = None,
+    spill_directory: str | None = None,
 ) -> KernelRuntimeContext:
     from marimo._plugins.ui._core.registry import UIElementRegistry
     from marimo._runtime.state import StateRegistry
@@ -144,7 +145,9 @@ def create_kernel_context(
         state_registry=StateRegistry(),
         function_registry=FunctionRegistry(),
         cell_lifecycle_registry=CellLifecycleRegistry(),
-        virtual_file_registry=VirtualFileRegistry(),
+        virtual_file_registry=VirtualFileRegistry(
+            spill_directory=spill_directory
+        ),
         virtual_files_supported=virtual_files_supported,
         stream=stream,
         stdout=stdout,
@@ -163,6 +166,7 @@ def initialize_kernel_context(
     stderr: Stderr | None,
     virtual_files_supported: bool,
     mode: SessionMode,
+    spill_directory: str | None = None,
 ) -> None:
     """Initializes thread-local/session-specific context.
 
@@ -176,5 +180,6 @@ def initialize_kernel_context(
             stderr=stderr,
             virtual_files_supported=virtual_files_supported,
             mode=mode,
+            spill_directory=spill_directory,
         )
     )
@@ -7,13 +7,18 @@ from copy import copy
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
+    Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
 )
 
+from marimo._dependencies.dependencies import DependencyManager
+
 T = TypeVar("T")
 Ref = Union[weakref.ReferenceType[T], Callable[[], T]]
 
@@ -170,3 +175,94 @@ def shallow_copy(base: T) -> T:
     if isinstance(base, _Copy):
         return cast(T, shadow_wrap(ShallowCopy, copy(unwrap_copy(base))))
     return cast(T, shadow_wrap(ShallowCopy, copy(base)))
+
+
+# Read-only views can't be used to mutate the viewed object, so they are
+# reused across runs while they are alive; keyed by id() of the viewed
+# object. Both are held weakly, since a view keeps its base alive.
+_READ_ONLY_VIEWS: Dict[
+    int, Tuple[weakref.ReferenceType[Any], weakref.ReferenceType[Any]]
+] = {}
+
+
+def cheap_copy(base: T) -> Optional[T]:
+    """
+    Returns a stand-in for `base` that is safe to hand to a cell in strict
+    execution mode without deep copying `base`, or None if there is none.
+
+    - numpy arrays are replaced by read-only views;
+    - pyarrow objects and polars LazyFrames are immutable, and are shared;
+    - polars DataFrames and Series are cloned, which doesn't copy data;
+    - pandas objects are shallow copied when pandas' copy-on-write is
+      enabled, so their data is only copied on first mutation.
+    """
+    if DependencyManager.numpy.imported():
+        import numpy as np
+
+        # Subclasses may not support views, so only exact arrays qualify
+        if type(base) is np.ndarray:
+            array = cast(Any, base)
+            if not array.dtype.hasobject:
+                return cast(T, _read_only_view(array))
+
+    if DependencyManager.pyarrow.imported():
+        import pyarrow as pa  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+
+        if isinstance(
+            base,
+            (pa.Array, pa.ChunkedArray, pa.RecordBatch, pa.Table, pa.Scalar),
+        ):
+            return cast(T, base)
+
+    if DependencyManager.polars.imported():
+        import polars as pl
+
+        if isinstance(base, pl.LazyFrame):
+            return cast(T, base)
+        if isinstance(base, (pl.DataFrame, pl.Series)):
+            return cast(T, base.clone())
+
+    if DependencyManager.pandas.imported():
+        import pandas as pd
+
+        if isinstance(
+            base, (pd.DataFrame, pd.Series)
+        ) and _pandas_copy_on_write(pd):
+            return cast(T, base.copy(deep=False))
+
+    return None
+
+
+def _read_only_view(base: Any) -> Any:
+    key = id(base)
+    cached = _READ_ONLY_VIEWS.get(key)
+    if cached is not None:
+        cached_view = cached[1]()
+        # Views track in-place mutations of the base, but not reshapes. The
+        # identity check comes last, since it narrows `base` to the type of
+        # the dereferenced weakref
+        if (
+            cached_view is not None
+            and cached_view.shape == base.shape
+            and cached_view.dtype == base.dtype
+            and cached[0]() is base
+        ):
+            return cached_view
+
+    view = base.view()
+    view.flags.writeable = False
+
+    def evict(ref: weakref.ReferenceType[Any]) -> None:
+        entry = _READ_ONLY_VIEWS.get(key)
+        if entry is not None and entry[0] is ref:
+            del _READ_ONLY_VIEWS[key]
+
+    _READ_ONLY_VIEWS[key] = (weakref.ref(base, evict), weakref.ref(view))
+    return view
+
+
+def _pandas_copy_on_write(pd: Any) -> bool:
+    # Copy-on-write is always enabled from pandas 3.0
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
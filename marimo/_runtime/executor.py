@@ -12,6 +12,7 @@ from marimo._runtime.copy import (
     CloneError,
     ShallowCopy,
     ZeroCopy,
+    cheap_copy,
     shallow_copy,
 )
 from marimo._runtime.exceptions import (
@@ -224,6 +225,8 @@ class StrictExecutor(Executor):
                     lcls[ref] = glbls[ref]
                 elif isinstance(glbls[ref], ShallowCopy):
                     lcls[ref] = shallow_copy(glbls[ref])
+                elif (copied := cheap_copy(glbls[ref])) is not None:
+                    lcls[ref] = copied
                 else:
                     try:
                         lcls[ref] = deepcopy(glbls[ref])
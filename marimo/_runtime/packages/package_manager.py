@@ -60,7 +60,10 @@ class PackageManager(abc.ABC):
         Returns True if installation succeeded, else False.
         """
         self._attempted_packages.add(package)
-        return await self._install(append_version(package, version))
+        installed = await self._install(append_version(package, version))
+        if installed:
+            DependencyManager.invalidate_caches()
+        return installed
 
     @abc.abstractmethod
     async def uninstall(self, package: str) -> bool:
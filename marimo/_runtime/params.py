@@ -25,7 +25,13 @@ from marimo._runtime.state import State, StateRegistry
 class QueryParams(State[SerializedQueryParams]):
     """Query parameters for a marimo app."""
 
-    IGNORED_KEYS = {"access_token", "refresh_token", "session_id"}
+    IGNORED_KEYS = {
+        "access_token",
+        "refresh_token",
+        "session_id",
+        "batch_frames",
+        "last_seq",
+    }
 
     def __init__(
         self,
@@ -172,6 +172,12 @@ class PreviewDatasetColumnRequest:
     column_name: str
 
 
+@dataclass
+class PreviewVariablesRequest:
+    # Names of the variables to preview
+    variable_names: List[str]
+
+
 ControlRequest = Union[
     ExecuteMultipleRequest,
     ExecuteScratchpadRequest,
@@ -186,4 +192,5 @@ ControlRequest = Union[
     StopRequest,
     InstallMissingPackagesRequest,
     PreviewDatasetColumnRequest,
+    PreviewVariablesRequest,
 ]
@@ -21,6 +21,7 @@ from marimo._messaging.errors import (
     UnknownError,
 )
 from marimo._messaging.tracebacks import write_traceback
+from marimo._metrics import CELL_EXECUTION_SECONDS
 from marimo._runtime import dataflow
 from marimo._runtime.control_flow import MarimoInterrupt, MarimoStopError
 from marimo._runtime.exceptions import (
@@ -33,6 +34,7 @@ from marimo._runtime.executor import (
     execute_cell_async,
 )
 from marimo._runtime.marimo_pdb import MarimoPdb
+from marimo._runtime.runner.profiler import CellProfiler
 from marimo._utils.variables import unmangle_local
 
 LOGGER = marimo_logger()
@@ -40,6 +42,7 @@ LOGGER = marimo_logger()
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from marimo._messaging.cell_profile import CellProfile
     from marimo._runtime.context.types import ExecutionContext
     from marimo._runtime.runner.hooks_on_finish import OnFinishHookType
     from marimo._runtime.runner.hooks_post_execution import (
@@ -112,6 +115,9 @@ class Runner:
             on_finish_hooks or []
         )
 
+        # resources used by each cell run, in order of execution
+        self.cell_profiles: list[CellProfile] = []
+
         # runtime globals
         self.glbls = glbls
         self.execution_mode: OnCellChangeType = execution_mode
@@ -553,15 +559,19 @@ class Runner:
             for pre_hook in self.pre_execution_hooks:
                 pre_hook(cell, self)
             LOGGER.debug("Running cell %s", cell_id)
+            profiler = CellProfiler(cell_id)
             if self.execution_context is not None:
                 with self.execution_context(cell_id) as exc_ctx:
                     run_result = await self.run(cell_id)
                     run_result.accumulated_output = exc_ctx.output
             else:
                 run_result = await self.run(cell_id)
+            profile = profiler.executed()
+            CELL_EXECUTION_SECONDS.observe(profile.wall_time)
             LOGGER.debug("Running post_execution hooks")
             for post_hook in self.post_execution_hooks:
-                post_hook(cell, self, run_result)
+                profiler.time_hook(post_hook, cell, self, run_result)
+            self.cell_profiles.append(profile)
 
         LOGGER.debug("Running on_finish hooks")
         for finish_hook in self.on_finish_hooks:
@@ -12,9 +12,10 @@ from marimo._messaging.errors import (
     MarimoInterruptionError,
     MarimoStrictExecutionError,
 )
-from marimo._messaging.ops import CellOp
+from marimo._messaging.ops import CellOp, CellProfiles
 from marimo._runtime.control_flow import MarimoStopError
 from marimo._runtime.runner import cell_runner
+from marimo._runtime.scratch import SCRATCH_CELL_ID
 from marimo._tracer import kernel_tracer
 
 LOGGER = _loggers.marimo_logger()
@@ -90,7 +91,20 @@ def _send_cancellation_errors(runner: cell_runner.Runner) -> None:
             )
 
 
+@kernel_tracer.start_as_current_span("broadcast_cell_profiles")
+def _broadcast_cell_profiles(runner: cell_runner.Runner) -> None:
+    # The scratchpad isn't part of the notebook
+    profiles = [
+        profile
+        for profile in runner.cell_profiles
+        if profile.cell_id != SCRATCH_CELL_ID
+    ]
+    if profiles:
+        CellProfiles(profiles=profiles).broadcast()
+
+
 ON_FINISH_HOOKS: list[OnFinishHookType] = [
     _send_interrupt_errors,
     _send_cancellation_errors,
+    _broadcast_cell_profiles,
 ]
@@ -89,12 +89,16 @@ def _broadcast_variables(
     run_result: cell_runner.RunResult,
 ) -> None:
     del run_result
+    # Previews can be expensive to compute (e.g., for large dataframes), so
+    # only types are broadcast here; the frontend requests previews when
+    # they are displayed
     values = [
         VariableValue(
             name=variable,
             value=(
                 runner.glbls[variable] if variable in runner.glbls else None
             ),
+            preview=False,
         )
         for variable in cell.defs
     ]
@@ -0,0 +1,119 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Per-cell resource usage, recorded by the runner for every execution.
+
+Wall time, CPU time and the growth of the process's peak memory are cheap to
+measure and are always recorded. Top allocations are only recorded when
+tracemalloc is tracing (e.g. when PYTHONTRACEMALLOC is set), since taking
+snapshots is expensive.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+from marimo._messaging.cell_profile import CellAllocation, CellProfile
+
+if TYPE_CHECKING:
+    from marimo._ast.cell import CellId_t
+
+# Number of allocation sites to report per cell
+TOP_ALLOCATIONS = 10
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _hook_name(hook: Callable[..., Any]) -> str:
+    return getattr(hook, "__name__", type(hook).__name__).lstrip("_")
+
+
+class CellProfiler:
+    """Measures the resources used by one execution of a cell.
+
+    Create the profiler right before the cell runs, and call `executed()`
+    right after; post-execution hooks can then be timed with `time_hook`.
+    """
+
+    def __init__(self, cell_id: CellId_t) -> None:
+        self.cell_id = cell_id
+        self._snapshot: Optional[tracemalloc.Snapshot] = (
+            tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        )
+        self._peak_rss = _peak_rss_bytes()
+        self._cpu_start = time.thread_time()
+        self._wall_start = time.perf_counter()
+        self.profile: Optional[CellProfile] = None
+
+    def executed(self) -> CellProfile:
+        wall_time = time.perf_counter() - self._wall_start
+        cpu_time = time.thread_time() - self._cpu_start
+
+        peak_rss = _peak_rss_bytes()
+        peak_rss_delta = (
+            peak_rss - self._peak_rss
+            if peak_rss is not None and self._peak_rss is not None
+            else None
+        )
+
+        allocations: Optional[List[CellAllocation]] = None
+        if self._snapshot is not None and tracemalloc.is_tracing():
+            allocations = _top_allocations(self._snapshot)
+            self._snapshot = None
+
+        self.profile = CellProfile(
+            cell_id=self.cell_id,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            peak_rss_delta=peak_rss_delta,
+            allocations=allocations,
+        )
+        return self.profile
+
+    def time_hook(self, hook: Callable[..., Any], *args: Any) -> None:
+        """Run a post-execution hook, recording the time it takes."""
+        start = time.perf_counter()
+        try:
+            hook(*args)
+        finally:
+            if self.profile is not None:
+                name = _hook_name(hook)
+                hooks = self.profile.post_execution_hooks
+                hooks[name] = (
+                    hooks.get(name, 0.0) + time.perf_counter() - start
+                )
+
+
+def _top_allocations(before: tracemalloc.Snapshot) -> List[CellAllocation]:
+    exclude = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    )
+    after = tracemalloc.take_snapshot().filter_traces(exclude)
+    stats = after.compare_to(before.filter_traces(exclude), "lineno")
+    allocations: List[CellAllocation] = []
+    for stat in stats:
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        allocations.append(
+            CellAllocation(
+                filename=frame.filename,
+                lineno=frame.lineno,
+                size=stat.size_diff,
+                count=stat.count_diff,
+            )
+        )
+        if len(allocations) == TOP_ALLOCATIONS:
+            break
+    return allocations
@@ -103,6 +103,7 @@ from marimo._runtime.requests import (
     FunctionCallRequest,
     InstallMissingPackagesRequest,
     PreviewDatasetColumnRequest,
+    PreviewVariablesRequest,
     RenameRequest,
     SetCellConfigRequest,
     SetUIElementValueRequest,
@@ -145,6 +146,9 @@ if TYPE_CHECKING:
 
 LOGGER = _loggers.marimo_logger()
 
+# Seconds to spend computing previews for a PreviewVariablesRequest
+VARIABLE_PREVIEW_TIME_BUDGET = 1.0
+
 
 @mddoc
 def defs() -> tuple[str, ...]:
@@ -1983,7 +1987,11 @@ class Kernel:
                 )
             elif source_type == "local":
                 dataset = self.globals[table_name]
-                column_preview = get_column_preview_dataframe(dataset, request)
+                column_preview = get_column_preview_dataframe(
+                    dataset,
+                    request,
+                    on_partial_preview=lambda preview: preview.broadcast(),
+                )
             else:
                 assert_never(source_type)
 
@@ -2009,6 +2017,34 @@ class Kernel:
             ).broadcast()
         return
 
+    @kernel_tracer.start_as_current_span("preview_variables")
+    async def preview_variables(
+        self, request: PreviewVariablesRequest
+    ) -> None:
+        """Broadcast previews of variables, for the variables panel.
+
+        Previews are computed until a time budget is exhausted; variables
+        that weren't previewed in time are sent without a preview.
+
+        Args:
+            request (PreviewVariablesRequest): The preview request containing:
+                - variable_names: Names of the variables to preview
+        """
+        deadline = time.monotonic() + VARIABLE_PREVIEW_TIME_BUDGET
+        values: list[VariableValue] = []
+        for name in request.variable_names:
+            if name not in self.globals:
+                continue
+            values.append(
+                VariableValue(
+                    name=name,
+                    value=self.globals[name],
+                    preview=time.monotonic() < deadline,
+                )
+            )
+        if values:
+            VariableValues(variables=values).broadcast()
+
     async def handle_message(self, request: ControlRequest) -> None:
         """Handle a message from the client.
 
@@ -2056,6 +2092,8 @@ class Kernel:
                 CompletedRun().broadcast()
             elif isinstance(request, PreviewDatasetColumnRequest):
                 await self.preview_dataset_column(request)
+            elif isinstance(request, PreviewVariablesRequest):
+                await self.preview_variables(request)
             elif isinstance(request, StopRequest):
                 return None
             else:
@@ -2079,6 +2117,7 @@ def launch_kernel(
     interrupt_queue: QueueType[bool] | None = None,
     profile_path: Optional[str] = None,
     log_level: int | None = None,
+    spill_directory: Optional[str] = None,
 ) -> None:
     if log_level is not None:
         _loggers.set_level(log_level)
@@ -2172,6 +2211,7 @@ def launch_kernel(
         stderr=stderr,
         virtual_files_supported=virtual_files_supported,
         mode=SessionMode.EDIT if is_edit_mode else SessionMode.RUN,
+        spill_directory=spill_directory,
     )
 
     if is_edit_mode:
@@ -3,15 +3,19 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import io
 import mimetypes
+import os
 import random
 import string
 import sys
+import tempfile
 import threading
-from typing import TYPE_CHECKING, Optional, cast
+from typing import IO, TYPE_CHECKING, Callable, Optional, cast
 
 from marimo import _loggers
 from marimo._messaging.mimetypes import KnownMimeType
+from marimo._metrics import VIRTUAL_FILE_BYTES, VIRTUAL_FILES
 from marimo._output.utils import build_data_url
 from marimo._runtime.cell_lifecycle_item import CellLifecycleItem
 from marimo._runtime.context import ContextNotInitializedError
@@ -159,12 +163,109 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
         return False
 
 
+class SpilledVirtualFileLifecycleItem(VirtualFileLifecycleItem):
+    """A virtual file whose contents are streamed to a spill file on disk.
+
+    Unlike `VirtualFileLifecycleItem`, the contents are never held in memory
+    as a whole: `write` is called with a binary file and can write to it in
+    chunks. The server streams the spill file back to the client.
+    """
+
+    def __init__(self, ext: str, write: Callable[[IO[bytes]], None]) -> None:
+        super().__init__(ext=ext, buffer=b"")
+        self.write = write
+
+    def create(self, context: "RuntimeContext" | None) -> None:
+        spill_directory = (
+            context.virtual_file_registry.spill_directory
+            if context is not None and context.virtual_files_supported
+            else None
+        )
+        if context is None or spill_directory is None:
+            # Without a server to stream from, fall back to an in-memory
+            # virtual file (or a data URL)
+            buffer = io.BytesIO()
+            self.write(buffer)
+            self.buffer = buffer.getvalue()
+            super().create(context)
+            return
+
+        registry = context.virtual_file_registry
+        filename = random_filename(self.ext)
+        while registry.has(filename):
+            filename = random_filename(self.ext)
+
+        path = os.path.join(spill_directory, filename)
+        try:
+            with open(path, "wb") as f:
+                self.write(f)
+        except BaseException:
+            _remove_spill_file(path)
+            raise
+        self._virtual_file = VirtualFile(
+            filename,
+            b"",
+            url=f"./@file/{os.path.getsize(path)}-{filename}",
+        )
+        registry.add_spill_file(self._virtual_file, path)
+
+
+def create_spill_directory() -> str:
+    """Create a directory for the spill files of a kernel.
+
+    The directory has an unpredictable name and is only accessible by the
+    current user. It is created by the server, which owns it and serves its
+    files, and passed to the kernel, which writes them.
+    """
+    return tempfile.mkdtemp(prefix="marimo_virtual_files_")
+
+
+def resolve_spill_file(directory: str, filename: str) -> Optional[str]:
+    """Path of the spill file `filename` in `directory`, if there is one."""
+    if not _is_virtual_filename(filename):
+        return None
+    path = os.path.join(directory, filename)
+    return path if os.path.isfile(path) else None
+
+
+def _is_virtual_filename(filename: str) -> bool:
+    # Virtual filenames are flat, reject anything that could escape
+    # the spill directory
+    return os.path.basename(filename) == filename and filename not in (
+        "",
+        ".",
+        "..",
+    )
+
+
+def _remove_spill_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 @dataclasses.dataclass
 class VirtualFileRegistryItem:
-    # contents of the file
-    shm: shared_memory.SharedMemory
+    # contents of the file, if held in memory
+    shm: Optional[shared_memory.SharedMemory]
     # number of HTML objects that are referencing this virtual file
     refcount: int
+    # path of the spill file, if the contents were streamed to disk
+    path: Optional[str] = None
+
+    @property
+    def storage(self) -> str:
+        return "disk" if self.path is not None else "memory"
+
+    def release(self) -> None:
+        if self.path is not None:
+            _remove_spill_file(self.path)
+        if self.shm is not None:
+            if sys.platform == "win32":
+                self.shm.close()
+            # destroy the shared memory
+            self.shm.unlink()
 
 
 @dataclasses.dataclass
@@ -182,6 +283,8 @@ class VirtualFileRegistry:
     registry: dict[str, VirtualFileRegistryItem] = dataclasses.field(
         default_factory=dict
     )
+    # directory for spill files, if the server provides one
+    spill_directory: Optional[str] = None
     shutting_down = False
 
     def __del__(self) -> None:
@@ -252,15 +355,23 @@ class VirtualFileRegistry:
         # We have to keep a reference to the shared memory to prevent it from
         # being destroyed on Windows
         self.registry[key] = VirtualFileRegistryItem(shm=shm, refcount=0)
+        VIRTUAL_FILES.inc(storage="memory")
+        VIRTUAL_FILE_BYTES.inc(len(buffer), storage="memory")
+
+    def add_spill_file(self, virtual_file: VirtualFile, path: str) -> None:
+        """Register a virtual file whose contents are in a spill file"""
+        self.registry[virtual_file.filename] = VirtualFileRegistryItem(
+            shm=None, refcount=0, path=path
+        )
+        VIRTUAL_FILES.inc(storage="disk")
+        VIRTUAL_FILE_BYTES.inc(os.path.getsize(path), storage="disk")
 
     def remove(self, virtual_file: VirtualFile) -> None:
         key = virtual_file.filename
         if key in self.registry:
-            if sys.platform == "win32":
-                self.registry[key].shm.close()
-            # destroy the shared memory
-            self.registry[key].shm.unlink()
-            del self.registry[key]
+            item = self.registry.pop(key)
+            item.release()
+            VIRTUAL_FILES.dec(storage=item.storage)
 
     def shutdown(self) -> None:
         # Try to make this method re-entrant since it's called in the
@@ -272,9 +383,8 @@ class VirtualFileRegistry:
         try:
             self.shutting_down = True
             for _, item in self.registry.items():
-                if sys.platform == "win32":
-                    item.shm.close()
-                item.shm.unlink()
+                item.release()
+                VIRTUAL_FILES.dec(storage=item.storage)
             self.registry.clear()
         finally:
             self.shutting_down = False
@@ -288,6 +398,12 @@ def read_virtual_file(filename: str, byte_length: int) -> bytes:
     if not shared_memory:
         raise RuntimeError("Shared memory is not supported on this platform")
 
+    if not _is_virtual_filename(filename):
+        raise HTTPException(
+            HTTPStatus.NOT_FOUND,
+            detail="File not found",
+        )
+
     key = filename
     shm = None
     try:
@@ -1,21 +1,26 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import json
 import mimetypes
 import os
 import re
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 from starlette.authentication import requires
 from starlette.exceptions import HTTPException
 from starlette.responses import FileResponse, HTMLResponse, Response
-from starlette.staticfiles import StaticFiles
 
 from marimo import _loggers
 from marimo._config.manager import get_default_config_manager
-from marimo._runtime.virtual_file import EMPTY_VIRTUAL_FILE, read_virtual_file
+from marimo._runtime.virtual_file import (
+    EMPTY_VIRTUAL_FILE,
+    read_virtual_file,
+)
 from marimo._server.api.deps import AppState
+from marimo._server.api.static import AssetFiles
+from marimo._server.model import SessionMode
 from marimo._server.router import APIRouter
 from marimo._server.templates.templates import (
     home_page_template,
@@ -44,7 +49,7 @@ config = (
 try:
     router.mount(
         "/assets",
-        app=StaticFiles(
+        app=AssetFiles(
             directory=os.path.join(root, "assets"),
             follow_symlink=config.get("follow_symlink", False),
         ),
@@ -55,20 +60,66 @@ except RuntimeError:
 
 FILE_QUERY_PARAM_KEY = "file"
 
+# index.html, as (mtime, contents)
+_index_html: Optional[tuple[int, str]] = None
+# Rendered pages in run mode, keyed by everything they are rendered from
+_rendered_pages: dict[tuple[Any, ...], str] = {}
+MAX_RENDERED_PAGES = 128
+
+
+def _read_index_html() -> str:
+    global _index_html
+    index_html = os.path.join(root, "index.html")
+    mtime = os.stat(index_html).st_mtime_ns
+    if _index_html is None or _index_html[0] != mtime:
+        with open(index_html, "r") as f:
+            _index_html = (mtime, f.read())
+    return _index_html[1]
+
+
+def _rendered_page_key(
+    app_state: AppState, file_key: Optional[str]
+) -> Optional[tuple[Any, ...]]:
+    """Key for caching the rendered page, or None if it can't be cached.
+
+    Pages are only cached in run mode, where notebooks are not edited
+    through the server. The mtimes of the notebook and of index.html are
+    part of the key, so a page is re-rendered when either changes on disk.
+    """
+    if app_state.mode != SessionMode.RUN:
+        return None
+    try:
+        index_mtime = os.stat(os.path.join(root, "index.html")).st_mtime_ns
+        mtime = os.stat(file_key).st_mtime_ns if file_key else None
+    except OSError:
+        return None
+    config_manager = app_state.config_manager
+    return (
+        index_mtime,
+        file_key,
+        mtime,
+        app_state.base_url,
+        str(app_state.skew_protection_token),
+        json.dumps(config_manager.get_user_config(), sort_keys=True),
+        json.dumps(config_manager.get_config_overrides(), sort_keys=True),
+    )
+
 
 @router.get("/")
 @requires("read", redirect="auth:login_page")
 async def index(request: Request) -> HTMLResponse:
     app_state = AppState(request)
-    index_html = os.path.join(root, "index.html")
 
     file_key = (
         app_state.query_params(FILE_QUERY_PARAM_KEY)
         or app_state.session_manager.file_router.get_unique_file_key()
     )
 
-    with open(index_html, "r") as f:  # noqa: ASYNC101 ASYNC230
-        html = f.read()
+    cache_key = _rendered_page_key(app_state, file_key)
+    if cache_key is not None and cache_key in _rendered_pages:
+        return HTMLResponse(_rendered_pages[cache_key])
+
+    html = _read_index_html()
 
     if not file_key:
         # We don't know which file to use, so we need to render a homepage
@@ -111,6 +162,10 @@ async def index(request: Request) -> HTMLResponse:
             """,
         )
 
+    if cache_key is not None:
+        if len(_rendered_pages) >= MAX_RENDERED_PAGES:
+            _rendered_pages.clear()
+        _rendered_pages[cache_key] = html
     return HTMLResponse(html)
 
 
@@ -169,8 +224,18 @@ def virtual_file(
             detail="Invalid byte length in virtual file request",
         )
 
-    buffer_contents = read_virtual_file(filename, int(byte_length))
     mimetype, _ = mimetypes.guess_type(filename)
+    # Large files are spilled to disk; stream them instead of
+    # reading them into memory
+    spill_file = AppState(request).session_manager.resolve_spill_file(filename)
+    if spill_file is not None:
+        return FileResponse(
+            spill_file,
+            media_type=mimetype,
+            headers={"Cache-Control": "max-age=86400"},
+        )
+
+    buffer_contents = read_virtual_file(filename, int(byte_length))
     return Response(
         content=buffer_contents,
         media_type=mimetype,
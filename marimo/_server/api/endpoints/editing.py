@@ -10,6 +10,7 @@ from marimo._runtime.requests import (
     CodeCompletionRequest,
     DeleteCellRequest,
     InstallMissingPackagesRequest,
+    PreviewVariablesRequest,
     SetCellConfigRequest,
 )
 from marimo._server.api.deps import AppState
@@ -207,3 +208,29 @@ async def install_missing_packages(request: Request) -> BaseResponse:
         from_consumer_id=ConsumerId(app_state.require_current_session_id()),
     )
     return SuccessResponse()
+
+
+@router.post("/preview_variables")
+@requires("edit")
+async def preview_variables(request: Request) -> BaseResponse:
+    """
+    requestBody:
+        content:
+            application/json:
+                schema:
+                    $ref: "#/components/schemas/PreviewVariablesRequest"
+    responses:
+        200:
+            description: Preview variables in the variables panel
+            content:
+                application/json:
+                    schema:
+                        $ref: "#/components/schemas/SuccessResponse"
+    """
+    app_state = AppState(request)
+    body = await parse_request(request, cls=PreviewVariablesRequest)
+    app_state.require_current_session().put_control_request(
+        body,
+        from_consumer_id=ConsumerId(app_state.require_current_session_id()),
+    )
+    return SuccessResponse()
@@ -21,6 +21,7 @@ from marimo._server.file_router import MarimoFileKey
 from marimo._server.ids import ConsumerId
 from marimo._server.models.models import (
     BaseResponse,
+    CellProfilesResponse,
     InstantiateRequest,
     RunRequest,
     RunScratchpadRequest,
@@ -206,6 +207,31 @@ async def run_scratchpad(
     return SuccessResponse()
 
 
+@router.get("/cell_profiles")
+@requires("edit")
+async def cell_profiles(
+    *,
+    request: Request,
+) -> CellProfilesResponse:
+    """
+    responses:
+        200:
+            description: Get the resources used by each cell's last run
+            content:
+                application/json:
+                    schema:
+                        $ref: "#/components/schemas/CellProfilesResponse"
+    """
+    app_state = AppState(request)
+    session_view = app_state.require_current_session().session_view
+    profiles = sorted(
+        session_view.cell_profiles.values(),
+        key=lambda profile: profile.wall_time,
+        reverse=True,
+    )
+    return CellProfilesResponse(profiles=profiles)
+
+
 @router.post("/restart_session")
 @requires("edit")
 async def restart_session(
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from multiprocessing import Process
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from starlette.authentication import requires
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 
 from marimo import __version__, _loggers
+from marimo._metrics import CONTENT_TYPE, METRICS, Gauge, Metric
 from marimo._server.api.deps import AppState
+from marimo._server.api.status import HTTPException, HTTPStatus
 from marimo._server.router import APIRouter
 from marimo._utils.health import (
     get_node_version,
@@ -231,3 +233,105 @@ async def connections(request: Request) -> JSONResponse:
     return JSONResponse(
         {"active": app_state.session_manager.get_active_connection_count()}
     )
+
+
+@router.get("/metrics")
+@requires("read")
+async def metrics(request: Request) -> Response:
+    """
+    responses:
+        200:
+            description: Get server metrics in the OpenMetrics text format. Only available when MARIMO_METRICS is set.
+            content:
+                application/openmetrics-text:
+                    schema:
+                        type: string
+        404:
+            description: Metrics are not enabled
+    """  # noqa: E501
+    if not METRICS.enabled:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail="Metrics are not enabled; set MARIMO_METRICS=1",
+        )
+    return Response(
+        METRICS.expose(_collect_metrics(AppState(request))),
+        media_type=CONTENT_TYPE,
+    )
+
+
+def _collect_metrics(app_state: AppState) -> List[Metric]:
+    """Gauges that are read from the server state at scrape time."""
+    import psutil
+
+    sessions = Gauge(
+        "marimo_sessions",
+        "Sessions, by connection state.",
+        ["state"],
+    )
+    queue_depth = Gauge(
+        "marimo_session_queue_depth",
+        "Messages waiting in a session's queues.",
+        ["session", "queue"],
+    )
+    kernel_memory = Gauge(
+        "marimo_kernel_memory_bytes",
+        "Resident memory of kernel processes.",
+        ["session"],
+    )
+    kernel_cpu = Gauge(
+        "marimo_kernel_cpu_seconds",
+        "CPU time used by kernel processes.",
+        ["session"],
+    )
+    for session_id, session in app_state.session_manager.sessions.items():
+        sessions.inc(state=session.connection_state().name.lower())
+        queue_manager = session.kernel_manager.queue_manager
+        for name, queue in (
+            ("control", queue_manager.control_queue),
+            ("set_ui_element", queue_manager.set_ui_element_queue),
+            ("stream", queue_manager.stream_queue),
+        ):
+            if queue is None:
+                continue
+            try:
+                queue_depth.set(queue.qsize(), session=session_id, queue=name)
+            except NotImplementedError:
+                # qsize() is not implemented for multiprocessing queues
+                # on macOS
+                pass
+        kernel_task = session.kernel_manager.kernel_task
+        if isinstance(kernel_task, Process) and kernel_task.pid is not None:
+            try:
+                kernel_process = psutil.Process(kernel_task.pid)
+                kernel_memory.set(
+                    kernel_process.memory_info().rss, session=session_id
+                )
+                kernel_cpu_times = kernel_process.cpu_times()
+                kernel_cpu.set(
+                    kernel_cpu_times.user + kernel_cpu_times.system,
+                    session=session_id,
+                )
+            except psutil.NoSuchProcess:
+                pass
+
+    process = psutil.Process()
+    cpu_times = process.cpu_times()
+    server_memory = Gauge(
+        "marimo_server_memory_bytes", "Resident memory of the server process."
+    )
+    server_memory.set(process.memory_info().rss)
+    server_cpu = Gauge(
+        "marimo_server_cpu_seconds",
+        "CPU time used by the server process.",
+    )
+    server_cpu.set(cpu_times.user + cpu_times.system)
+
+    return [
+        sessions,
+        queue_depth,
+        kernel_memory,
+        kernel_cpu,
+        server_memory,
+        server_cpu,
+    ]
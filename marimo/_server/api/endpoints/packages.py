@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Optional
 from starlette.authentication import requires
 
 from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.packages.package_manager import PackageManager
 from marimo._runtime.packages.package_managers import create_package_manager
 from marimo._runtime.packages.utils import split_packages
@@ -99,6 +100,8 @@ async def remove_package(request: Request) -> PackageOperationResponse:
         )
 
     success = await package_manager.uninstall(body.package)
+    if success:
+        DependencyManager.invalidate_caches()
 
     # Update the script metadata
     filename = _get_filename(request)
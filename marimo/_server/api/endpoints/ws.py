@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import partial
@@ -26,10 +25,16 @@ from marimo._messaging.ops import (
     serialize,
 )
 from marimo._messaging.types import KernelMessage, NoopStream
-from marimo._plugins.core.json_encoder import WebComponentEncoder
+from marimo._metrics import (
+    WEBSOCKET_BYTES_SENT,
+    WEBSOCKET_FRAMES_SENT,
+    WEBSOCKET_MESSAGES_SENT,
+    WEBSOCKET_RESYNCS,
+)
 from marimo._plugins.core.web_component import JSONType
 from marimo._runtime.params import QueryParams
 from marimo._server.api.deps import AppState
+from marimo._server.exceptions import TooManySessionsException
 from marimo._server.file_router import MarimoFileKey
 from marimo._server.ids import ConsumerId
 from marimo._server.model import (
@@ -38,6 +43,11 @@ from marimo._server.model import (
     SessionMode,
 )
 from marimo._server.router import APIRouter
+from marimo._server.session.frames import (
+    encode_kernel_message,
+    encode_operation,
+    sequence_frame,
+)
 from marimo._server.sessions import Session, SessionManager
 
 if TYPE_CHECKING:
@@ -50,12 +60,20 @@ router = APIRouter()
 SESSION_QUERY_PARAM_KEY = "session_id"
 FILE_QUERY_PARAM_KEY = "file"
 KIOSK_QUERY_PARAM_KEY = "kiosk"
+BATCH_QUERY_PARAM_KEY = "batch_frames"
+# Sequence number of the last frame the client received, when reconnecting
+LAST_SEQ_QUERY_PARAM_KEY = "last_seq"
+# Operations are coalesced into a batched frame until it exceeds this size
+MAX_BATCH_BYTES = 256 * 1024
+# Frames queued for a consumer before it is considered too slow to keep up
+MAX_PENDING_FRAMES = 1024
 
 
 class WebSocketCodes(IntEnum):
     ALREADY_CONNECTED = 1003
     NORMAL_CLOSE = 1000
     FORBIDDEN = 1008
+    TRY_AGAIN_LATER = 1013
 
 
 @router.websocket("/ws")
@@ -87,6 +105,8 @@ async def websocket_endpoint(
         return
 
     kiosk = app_state.query_params(KIOSK_QUERY_PARAM_KEY) == "true"
+    batch = app_state.query_params(BATCH_QUERY_PARAM_KEY) == "true"
+    last_seq = app_state.query_params(LAST_SEQ_QUERY_PARAM_KEY)
 
     rtc_enabled: bool = (
         app_state.config_manager.get_config()
@@ -102,6 +122,12 @@ async def websocket_endpoint(
         mode=app_state.mode,
         file_key=file_key,
         kiosk=kiosk,
+        batch=batch,
+        last_seq=(
+            int(last_seq)
+            if last_seq is not None and last_seq.isdigit()
+            else None
+        ),
     ).start()
 
 
@@ -271,6 +297,8 @@ class WebsocketHandler(SessionConsumer):
         mode: SessionMode,
         file_key: MarimoFileKey,
         kiosk: bool,
+        batch: bool = False,
+        last_seq: Optional[int] = None,
     ):
         self.websocket = websocket
         self.manager = manager
@@ -280,11 +308,15 @@ class WebsocketHandler(SessionConsumer):
         self.mode = mode
         self.status: ConnectionState
         self.kiosk = kiosk
+        # Whether the client accepts batched frames
+        self.batch = batch
+        self.last_seq = last_seq
         self.cancel_close_handle: Optional[asyncio.TimerHandle] = None
         self.heartbeat_task: Optional[asyncio.Task[None]] = None
-        # Messages from the kernel are put in this queue
+        # Encoded messages from the kernel are put in this queue
         # to be sent to the frontend
-        self.message_queue: asyncio.Queue[KernelMessage]
+        self.message_queue: asyncio.Queue[tuple[str, str]]
+        self._resyncing = False
 
         super().__init__(consumer_id=ConsumerId(session_id))
 
@@ -337,25 +369,20 @@ class WebsocketHandler(SessionConsumer):
             last_executed_code = {}
             last_execution_time = {}
 
-        self.message_queue.put_nowait(
-            (
-                KernelReady.name,
-                serialize(
-                    KernelReady(
-                        codes=codes,
-                        names=names,
-                        configs=configs,
-                        layout=file_manager.read_layout_config(),
-                        cell_ids=cell_ids,
-                        resumed=resumed,
-                        ui_values=ui_values,
-                        last_executed_code=last_executed_code,
-                        last_execution_time=last_execution_time,
-                        app_config=app.config,
-                        kiosk=kiosk,
-                        capabilities=KernelCapabilities(),
-                    )
-                ),
+        self.write_operation(
+            KernelReady(
+                codes=codes,
+                names=names,
+                configs=configs,
+                layout=file_manager.read_layout_config(),
+                cell_ids=cell_ids,
+                resumed=resumed,
+                ui_values=ui_values,
+                last_executed_code=last_executed_code,
+                last_execution_time=last_execution_time,
+                app_config=app.config,
+                kiosk=kiosk,
+                capabilities=KernelCapabilities(),
             )
         )
 
@@ -375,6 +402,17 @@ class WebsocketHandler(SessionConsumer):
         # Write reconnected message
         self.write_operation(Reconnected())
 
+        # If the client told us what it last received, resend only the frames
+        # it missed, unless they are no longer logged
+        if not replay and self.last_seq is not None:
+            missed = session.frame_log.since(self.last_seq)
+            if missed is None:
+                replay = True
+            else:
+                LOGGER.debug("Resending %s missed frames", len(missed))
+                for op, frame in missed:
+                    self._enqueue(op, frame)
+
         # If not replaying, just send a toast
         if not replay:
             self.write_operation(
@@ -385,6 +423,20 @@ class WebsocketHandler(SessionConsumer):
             )
             return
 
+        self._replay_session_view(
+            session,
+            banner=Banner(
+                title="Reconnected",
+                description="You have reconnected to an existing session.",
+                action="restart",
+            ),
+        )
+
+    def _replay_session_view(
+        self, session: Session, banner: Optional[Banner] = None
+    ) -> None:
+        """Send the session's current view to the client, as if the
+        kernel had been resumed."""
         operations = session.get_current_state().operations
         # Replay the current session view
         LOGGER.debug(
@@ -399,17 +451,15 @@ class WebsocketHandler(SessionConsumer):
             last_execution_time=session.get_current_state().last_execution_time,
             kiosk=self.kiosk,
         )
-        self.write_operation(
-            Banner(
-                title="Reconnected",
-                description="You have reconnected to an existing session.",
-                action="restart",
-            )
-        )
+        if banner is not None:
+            self.write_operation(banner)
 
         for op in operations:
-            LOGGER.debug("Replaying operation %s", serialize(op))
+            LOGGER.debug("Replaying operation %s", op.name)
             self.write_operation(op)
+        if self.batch:
+            # The client's state now matches the latest logged frame
+            self._enqueue("batch", sequence_frame(session.frame_log.last_seq))
 
     def _connect_kiosk(self, session: Session) -> None:
         """Connect to a kiosk session.
@@ -604,6 +654,12 @@ class WebsocketHandler(SessionConsumer):
                 file_key=self.file_key,
             )
             self.status = ConnectionState.CONNECTING
+            if new_session.kernel_deferred:
+                # Serve the cached initial render; the kernel is started
+                # when the viewer first interacts with the app.
+                self._replay_session_view(new_session)
+                self.status = ConnectionState.OPEN
+                return new_session
             # Let the frontend know it can instantiate the app.
             self._write_kernel_ready(
                 new_session,
@@ -616,43 +672,31 @@ class WebsocketHandler(SessionConsumer):
             self.status = ConnectionState.OPEN
             return new_session
 
-        get_session()
+        try:
+            get_session()
+        except TooManySessionsException as e:
+            LOGGER.warning("Refusing connection: %s", e)
+            await self.websocket.close(
+                WebSocketCodes.TRY_AGAIN_LATER, "MARIMO_TOO_MANY_SESSIONS"
+            )
+            return
 
         async def listen_for_messages() -> None:
             while True:
-                (op, data) = await self.message_queue.get()
-
-                if op in KIOSK_ONLY_OPERATIONS and not self.kiosk:
-                    LOGGER.debug(
-                        "Ignoring operation %s, not in kiosk mode",
-                        op,
-                    )
-                    continue
-                if op in KIOSK_EXCLUDED_OPERATIONS and self.kiosk:
-                    LOGGER.debug(
-                        "Ignoring operation %s, in kiosk mode",
-                        op,
-                    )
-                    continue
-
-                try:
-                    text = json.dumps(
-                        {
-                            "op": op,
-                            "data": data,
-                        },
-                        cls=WebComponentEncoder,
-                    )
-                except TypeError as e:
-                    # This is a deserialization error
-                    LOGGER.error(
-                        "Failed to send message to frontend: %s", str(e)
-                    )
-                    LOGGER.error("Message: %s", data)
+                frames = await self._next_frames()
+                if not frames:
                     continue
+                text = (
+                    frames[0]
+                    if len(frames) == 1
+                    else '{"op": "batch", "data": [' + ", ".join(frames) + "]}"
+                )
 
                 try:
                     await self.websocket.send_text(text)
+                    WEBSOCKET_MESSAGES_SENT.inc(len(frames))
+                    WEBSOCKET_FRAMES_SENT.inc()
+                    WEBSOCKET_BYTES_SENT.inc(len(text))
                 except WebSocketDisconnect as e:
                     self._on_disconnect(
                         e,
@@ -700,12 +744,74 @@ class WebsocketHandler(SessionConsumer):
         self,
     ) -> Callable[[KernelMessage], None]:
         def listener(response: KernelMessage) -> None:
-            self.message_queue.put_nowait(response)
+            self._enqueue(response[0], encode_kernel_message(response))
 
         return listener
 
     def write_operation(self, op: MessageOperation) -> None:
-        self.message_queue.put_nowait((op.name, serialize(op)))
+        self._enqueue(op.name, encode_operation(op))
+
+    async def _next_frames(self) -> list[str]:
+        """Wait for the next frames to send.
+
+        If the client accepts batched frames, the operations that queued up
+        while the previous frame was being sent are coalesced.
+        """
+        items = [await self.message_queue.get()]
+        if self.batch:
+            size = len(items[0][1])
+            while not self.message_queue.empty() and size < MAX_BATCH_BYTES:
+                items.append(self.message_queue.get_nowait())
+                size += len(items[-1][1])
+        return self._filter_frames(items)
+
+    def _filter_frames(self, items: list[tuple[str, str]]) -> list[str]:
+        """Frames of the queued operations this consumer should receive."""
+        frames: list[str] = []
+        for op, frame in items:
+            if op in KIOSK_ONLY_OPERATIONS and not self.kiosk:
+                LOGGER.debug("Ignoring operation %s, not in kiosk mode", op)
+                continue
+            if op in KIOSK_EXCLUDED_OPERATIONS and self.kiosk:
+                LOGGER.debug("Ignoring operation %s, in kiosk mode", op)
+                continue
+            frames.append(frame)
+        return frames
+
+    def _enqueue(self, op: str, frame: Optional[str]) -> None:
+        if frame is None:
+            return
+        if (
+            self.message_queue.qsize() >= MAX_PENDING_FRAMES
+            and not self._resyncing
+        ):
+            self._resync()
+            return
+        self.message_queue.put_nowait((op, frame))
+
+    def _resync(self) -> None:
+        """Replace the backlog of a consumer that can't keep up with the
+        session's current view.
+
+        The session view already reflects every message in the backlog, so
+        the frontend ends up in the same state without the session holding
+        on to an unbounded queue or slowing down its other consumers.
+        """
+        LOGGER.debug(
+            "Consumer %s fell behind; resyncing with the session view",
+            self.consumer_id,
+        )
+        WEBSOCKET_RESYNCS.inc()
+        while not self.message_queue.empty():
+            self.message_queue.get_nowait()
+        session = self.manager.get_session(self.session_id)
+        if session is None:
+            return
+        self._resyncing = True
+        try:
+            self._replay_session_view(session)
+        finally:
+            self._resyncing = False
 
     def on_stop(self) -> None:
         # Cancel the heartbeat task, reader
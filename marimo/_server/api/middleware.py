@@ -2,12 +2,22 @@
 from __future__ import annotations
 
 import asyncio
-from http.client import HTTPResponse, HTTPSConnection
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.client import (
+    HTTPConnection as HTTPClientConnection,
+    HTTPResponse,
+    HTTPSConnection,
+    RemoteDisconnected,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterable,
     Callable,
+    Iterator,
     Optional,
     Union,
 )
@@ -41,7 +51,7 @@ from marimo._tracer import server_tracer
 
 if TYPE_CHECKING:
     from starlette.requests import HTTPConnection
-    from starlette.types import ASGIApp, Receive, Scope, Send
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 LOGGER = _loggers.marimo_logger()
 
@@ -172,34 +182,150 @@ class _URLRequest:
         self.data = data
 
 
+# Headers that apply to a single connection, and are not forwarded
+HOP_BY_HOP_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+# Errors from reusing a keep-alive connection the upstream already closed
+_STALE_CONNECTION_ERRORS = (
+    BrokenPipeError,
+    ConnectionResetError,
+    RemoteDisconnected,
+)
+
+
+class _ConnectionPool:
+    """Keep-alive connections to a single upstream.
+
+    Blocking `http.client` calls run in a thread pool of `max_connections`
+    threads, which bounds the number of requests in flight to the upstream.
+    Idle connections are reused for up to `keepalive_expiry` seconds, to stay
+    under the keep-alive timeout of the upstream.
+
+    Closing the pool doesn't interrupt requests in flight: their connections
+    are closed once they're done, instead of being reused.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        is_https: bool,
+        max_connections: int = 16,
+        timeout: float = 60.0,
+        keepalive_expiry: float = 4.0,
+    ) -> None:
+        self.host = host
+        self.is_https = is_https
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="marimo-proxy"
+        )
+        # (connection, time it was released)
+        self._idle: deque[tuple[HTTPClientConnection, float]] = deque()
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def acquire(self) -> tuple[HTTPClientConnection, bool]:
+        """Get an idle connection, or a new one.
+
+        Returns the connection and whether it was reused.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn, released_at = self._idle.pop()
+                if now - released_at < self.keepalive_expiry:
+                    return conn, True
+                conn.close()
+        conn_class = HTTPSConnection if self.is_https else HTTPClientConnection
+        return conn_class(self.host, timeout=self.timeout), False
+
+    def release(self, conn: HTTPClientConnection) -> None:
+        """Return a connection whose response was read to the end."""
+        with self._lock:
+            if not self.closed and len(self._idle) < self.max_connections:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed = True
+            while self._idle:
+                self._idle.pop()[0].close()
+        self.executor.shutdown(wait=False)
+
+
 class _AsyncHTTPResponse:
-    def __init__(self, response: HTTPResponse):
+    def __init__(
+        self,
+        response: HTTPResponse,
+        conn: Optional[HTTPClientConnection] = None,
+        pool: Optional[_ConnectionPool] = None,
+    ):
         self.raw_response = response
         self.status_code = response.status
         self.headers = {k.lower(): v for k, v in response.getheaders()}
+        self._conn = conn
+        self._pool = pool
 
     async def aiter_raw(self) -> AsyncIterable[bytes]:
+        loop = asyncio.get_running_loop()
+        pool = self._pool
         try:
             while True:
-                chunk = self.raw_response.read(8192)
+                # The pool may have been closed while the response streams
+                executor = (
+                    pool.executor
+                    if pool is not None and not pool.closed
+                    else None
+                )
+                chunk = await loop.run_in_executor(
+                    executor, self.raw_response.read, 65536
+                )
                 if not chunk:
                     break
                 yield chunk
-        except Exception:
-            raise
         finally:
             await self.aclose()
 
     async def aclose(self) -> None:
+        conn, self._conn = self._conn, None
+        # Only a connection whose response was read to the end can be reused
+        reusable = (
+            self.raw_response.isclosed() and not self.raw_response.will_close
+        )
         self.raw_response.close()
+        if conn is None:
+            return
+        if reusable and self._pool is not None:
+            self._pool.release(conn)
+        else:
+            conn.close()
 
 
 class _AsyncHTTPClient:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, pool: Optional[_ConnectionPool] = None):
         self.base_url = base_url.rstrip("/")
         parsed = urlparse(base_url)
         self.host = parsed.netloc
         self.is_https = parsed.scheme == "https"
+        self.pool = (
+            pool
+            if pool is not None
+            else _ConnectionPool(self.host, self.is_https)
+        )
 
     def build_request(
         self, method: str, url: Any, headers: dict[str, str], content: Any
@@ -209,7 +335,18 @@ class _AsyncHTTPClient:
         if hasattr(url, "query") and url.query:
             full_url += f"?{url.query.decode('utf-8')}"
 
-        headers = dict(headers)
+        # A streamed body is only sent if the request declares one
+        if isinstance(content, AsyncIterable) and not any(
+            k.lower() in ("content-length", "transfer-encoding")
+            for k in headers
+        ):
+            content = None
+
+        headers = {
+            k: v
+            for k, v in headers.items()
+            if k.lower() not in HOP_BY_HOP_HEADERS
+        }
         headers["host"] = self.host
 
         request = _URLRequest(
@@ -226,66 +363,80 @@ class _AsyncHTTPClient:
         self, request: _URLRequest, stream: bool = False
     ) -> _AsyncHTTPResponse:
         del stream
-        loop = asyncio.get_event_loop()
-
-        async def collect_body() -> bytes:
-            if hasattr(request, "data"):
-                if request.data is None:
-                    return b""
-                if isinstance(request.data, AsyncIterable):
-                    chunks: list[bytes] = []
-                    try:
-                        async for chunk in request.data:
-                            if isinstance(chunk, str):
-                                chunks.append(chunk.encode())
-                            else:
-                                chunks.append(chunk)
-                        return b"".join(chunks)
-                    except Exception:
+        loop = asyncio.get_running_loop()
+        body = _sync_body(request, loop)
+        # Streamed bodies can't be sent again on a fresh connection
+        replayable = body is None or isinstance(body, bytes)
+
+        parsed_url = urlparse(request.full_url)
+        path_and_query = parsed_url.path
+        if parsed_url.query:
+            path_and_query += f"?{parsed_url.query}"
+        method = request.method if request.method is not None else "GET"
+
+        def _send() -> tuple[HTTPClientConnection, HTTPResponse]:
+            while True:
+                conn, reused = self.pool.acquire()
+                try:
+                    conn.request(
+                        method=method,
+                        url=path_and_query,  # Only path and query
+                        body=body,
+                        headers=request.headers,
+                    )
+                    return conn, conn.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    # The upstream closed an idle connection: try the next
+                    # one, or a new one once the idle ones run out
+                    if not (reused and replayable):
                         raise
-                if isinstance(request.data, str):
-                    return request.data.encode()
-                if isinstance(request.data, bytes):
-                    return request.data
-                if hasattr(request.data, "read"):
-                    return request.data.read()  # type: ignore
-                raise ValueError(
-                    f"Unsupported request data type: {type(request.data)}"
-                )
-            return b""
-
-        try:
-            body = await collect_body()
-        except Exception:
-            raise
-
-        def _send() -> HTTPResponse:
-            from http.client import HTTPConnection
-
-            parsed_url = urlparse(request.full_url)
-            path_and_query = parsed_url.path
-            if parsed_url.query:
-                path_and_query += f"?{parsed_url.query}"
-
-            conn_class = HTTPSConnection if self.is_https else HTTPConnection
-            conn = conn_class(self.host)
-
-            method = request.method if request.method is not None else "GET"
-
+                except Exception:
+                    conn.close()
+                    raise
+
+        conn, response = await loop.run_in_executor(self.pool.executor, _send)
+        return _AsyncHTTPResponse(response, conn, self.pool)
+
+
+def _sync_body(request: _URLRequest, loop: asyncio.AbstractEventLoop) -> Any:
+    """Adapt the request body to one `http.client` can send.
+
+    Async iterables are streamed (chunked, unless the request has a
+    Content-Length): chunks are pulled from the event loop by the worker
+    thread that sends the request.
+    """
+    data = getattr(request, "data", None)
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, bytes):
+        return data
+    if hasattr(data, "read"):
+        return data
+    if not isinstance(data, AsyncIterable):
+        raise ValueError(f"Unsupported request data type: {type(data)}")
+
+    iterator = data.__aiter__()
+
+    async def next_chunk() -> Any:
+        return await iterator.__anext__()
+
+    def chunks() -> Iterator[bytes]:
+        while True:
             try:
-                conn.request(
-                    method=method,
-                    url=path_and_query,  # Only path and query
-                    body=body,
-                    headers=request.headers,
-                )
-                resp = conn.getresponse()
-                return resp  # type: ignore[no-any-return]
-            except Exception:
-                raise
+                chunk = asyncio.run_coroutine_threadsafe(
+                    next_chunk(), loop
+                ).result()
+            except StopAsyncIteration:
+                return
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if chunk:
+                yield chunk
 
-        response = await loop.run_in_executor(None, _send)
-        return _AsyncHTTPResponse(response)
+    return chunks()
 
 
 class ProxyMiddleware:
@@ -295,11 +446,50 @@ class ProxyMiddleware:
         proxy_path: str,
         target_url: Union[str, Callable[[str], str]],
         path_rewrite: Callable[[str], str] | None = None,
+        max_connections: int = 16,
+        timeout: float = 60.0,
+        max_pools: int = 8,
     ) -> None:
         self.app = app
         self.path = proxy_path.rstrip("/")
         self.target_url = target_url
         self.path_rewrite = path_rewrite
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_pools = max_pools
+        # Connection pools, by (is https, host:port), least recently used
+        # first. Dynamic targets, like the per-figure ports of matplotlib
+        # servers, would otherwise keep the threads and sockets of a pool
+        # per target alive for the lifetime of the server.
+        self._pools: OrderedDict[tuple[bool, str], _ConnectionPool] = (
+            OrderedDict()
+        )
+
+    def _get_pool(self, target_url: str) -> _ConnectionPool:
+        parsed = urlparse(target_url)
+        key = (parsed.scheme == "https", parsed.netloc)
+        pool = self._pools.get(key)
+        if pool is not None:
+            self._pools.move_to_end(key)
+            return pool
+
+        pool = _ConnectionPool(
+            parsed.netloc,
+            is_https=parsed.scheme == "https",
+            max_connections=self.max_connections,
+            timeout=self.timeout,
+        )
+        self._pools[key] = pool
+        while len(self._pools) > self.max_pools:
+            _, evicted = self._pools.popitem(last=False)
+            evicted.close()
+        return pool
+
+    def close(self) -> None:
+        """Close the connection pools."""
+        while self._pools:
+            _, pool = self._pools.popitem()
+            pool.close()
 
     def _get_target_url(self, path: str) -> str:
         """Get target URL either from rewrite function or default MPL logic."""
@@ -311,6 +501,18 @@ class ProxyMiddleware:
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
     ) -> None:
+        if scope["type"] == "lifespan":
+
+            async def send_and_close(message: Message) -> None:
+                if message["type"] in (
+                    "lifespan.shutdown.complete",
+                    "lifespan.shutdown.failed",
+                ):
+                    self.close()
+                await send(message)
+
+            return await self.app(scope, receive, send_and_close)
+
         if scope["type"] == "websocket":
             if not scope["path"].startswith(self.path):
                 return await self.app(scope, receive, send)
@@ -346,7 +548,9 @@ class ProxyMiddleware:
         target_query = request.url.query.encode("utf-8")
 
         # Create client if needed (for dynamic target URLs)
-        client = _AsyncHTTPClient(base_url=target_base)
+        client = _AsyncHTTPClient(
+            base_url=target_base, pool=self._get_pool(target_base)
+        )
 
         # Construct the URL object with path and query
         url = type("URL", (), {"path": target_path, "query": target_query})()
@@ -375,7 +579,7 @@ class ProxyMiddleware:
         websocket = WebSocket(scope, receive=receive, send=send)
         original_params = websocket.query_params
         if original_params:
-            ws_url = f"{ws_url}?{'&'.join(f'{k}={v}' for k,v in original_params.items())}"
+            ws_url = f"{ws_url}?{'&'.join(f'{k}={v}' for k, v in original_params.items())}"
         await websocket.accept()
 
         async with connect(ws_url) as ws_client:
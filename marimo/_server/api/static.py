@@ -0,0 +1,169 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import gzip
+import re
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+if TYPE_CHECKING:
+    import os
+
+    from starlette.types import Scope
+
+# Bundler output is named with an 8 character content hash before the
+# extension, e.g. index-Bx3Kf9aQ.js. Hashes containing a "-", or made of
+# lowercase letters only, aren't told apart from words in unhashed names
+# (e.g. vega-embed-module.js or chart-renderer.js), and are missed; that
+# only costs those files their long-lived caching.
+HASHED_FILE = re.compile(
+    r"-(?=[A-Za-z0-9_]*[A-Z0-9_])[A-Za-z0-9_]{8}\.[A-Za-z0-9]+$"
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".js",
+    ".mjs",
+    ".css",
+    ".html",
+    ".json",
+    ".svg",
+    ".map",
+    ".txt",
+    ".wasm",
+)
+# Smaller files aren't worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+# Precompressed siblings, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class AssetFiles(StaticFiles):
+    """Static files for the bundled frontend.
+
+    Files named with a content hash are served with an immutable
+    Cache-Control header. Compressible files are served compressed when the
+    client accepts it: from a precompressed `.br` or `.gz` sibling written at
+    packaging time if there is one, otherwise gzipped on first request and
+    kept in memory. Reading and compressing happen in a worker thread, off
+    the event loop.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # (path, encoding) -> (mtime, compressed contents)
+        self._compressed: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+
+    def file_response(
+        self,
+        full_path: os.PathLike[str] | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = str(full_path)
+        request_headers = Headers(scope=scope)
+
+        headers: Dict[str, str] = {}
+        if HASHED_FILE.search(path):
+            headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        compressible = path.endswith(COMPRESSIBLE_EXTENSIONS)
+        if compressible:
+            headers["Vary"] = "Accept-Encoding"
+
+        response_class = FileResponse
+        if compressible and stat_result.st_size >= MIN_COMPRESS_SIZE:
+            response_class = _CompressibleFileResponse
+        response = response_class(
+            path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if not isinstance(response, _CompressibleFileResponse):
+            return response
+
+        stat_result = response.stat_result
+        assert stat_result is not None
+        accepted = _accepted_encodings(Headers(scope=scope))
+        for encoding, _ in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            content = await run_in_threadpool(
+                self._compressed_contents,
+                str(response.path),
+                encoding,
+                stat_result,
+            )
+            if content is None:
+                continue
+            # Keep the validators of the uncompressed file, so conditional
+            # requests work the same regardless of encoding
+            compressed_headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key in ("cache-control", "vary", "etag", "last-modified")
+            }
+            compressed_headers["Content-Encoding"] = encoding
+            return Response(
+                content,
+                status_code=response.status_code,
+                headers=compressed_headers,
+                media_type=response.media_type,
+            )
+        return response
+
+    def _compressed_contents(
+        self, path: str, encoding: str, stat_result: os.stat_result
+    ) -> Optional[bytes]:
+        # Runs in a worker thread
+        key = (path, encoding)
+        mtime = stat_result.st_mtime_ns
+        cached = self._compressed.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        content = _read_sibling(path, encoding)
+        if content is None and encoding == "gzip":
+            # mtime=0 keeps the output deterministic
+            with open(path, "rb") as f:
+                content = gzip.compress(f.read(), mtime=0)
+        if content is None:
+            return None
+
+        self._compressed[key] = (mtime, content)
+        return content
+
+
+class _CompressibleFileResponse(FileResponse):
+    """A file response that may be replaced by a compressed one."""
+
+
+def _accepted_encodings(headers: Headers) -> set[str]:
+    accepted: set[str] = set()
+    for value in headers.get("accept-encoding", "").split(","):
+        encoding, _, params = value.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+def _read_sibling(path: str, encoding: str) -> Optional[bytes]:
+    suffix = dict(ENCODINGS)[encoding]
+    try:
+        with open(path + suffix, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
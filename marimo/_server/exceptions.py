@@ -2,3 +2,8 @@
 class InvalidSessionException(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class TooManySessionsException(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
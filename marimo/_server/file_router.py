@@ -5,11 +5,23 @@ import abc
 import os
 import pathlib
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Generator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from marimo import _loggers
 from marimo._config.config import WidthType
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._server.api.status import HTTPException, HTTPStatus
 from marimo._server.file_manager import AppFileManager
 from marimo._server.files.os_file_system import natural_sort_file
@@ -25,6 +37,17 @@ LOGGER = _loggers.marimo_logger()
 # Some unique identifier for a file
 MarimoFileKey = str
 
+# Directories that aren't searched for apps (nor are hidden directories)
+SKIP_DIRS = {
+    "venv",
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+    "eggs",
+}
+# How deep below the root directory apps are searched for
+MAX_DEPTH = 5
+
 
 class AppFileRouter(abc.ABC):
     """
@@ -121,6 +144,12 @@ class AppFileRouter(abc.ABC):
         """
         pass
 
+    # Not abstract, since most routers don't hold any resources
+    def close(self) -> None:  # noqa: B027
+        """
+        Release any resources held by the router.
+        """
+
 
 class NewFileAppFileRouter(AppFileRouter):
     def get_unique_file_key(self) -> Optional[MarimoFileKey]:
@@ -168,12 +197,184 @@ class ListOfFilesAppFileRouter(AppFileRouter):
         return None
 
 
+class MarimoAppIndex:
+    """Index of which files in a directory are marimo apps.
+
+    Entries are keyed on the file's (mtime, size), so a rescan only reads
+    the files that changed since they were last checked. When watchdog is
+    installed, the directory is watched for changes, and `generation` is
+    bumped on each one; callers can also rescan when asked to.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        # path -> (mtime_ns, size, is marimo app)
+        self._entries: Dict[str, Tuple[int, int, bool]] = {}
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._observer: Any = None
+        self._handler: Any = None
+        # directory -> watch scheduled on the observer
+        self._watches: Dict[str, Any] = {}
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    def is_marimo_app(self, path: str, stat: os.stat_result) -> bool:
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+        result = _is_marimo_app(path)
+        with self._lock:
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
+
+    def retain(self, paths: Set[str], extensions: Tuple[str, ...]) -> None:
+        """Forget the files with the given extensions that are no longer in
+        the directory."""
+        with self._lock:
+            for path in set(self._entries) - paths:
+                if path.endswith(extensions):
+                    del self._entries[path]
+
+    def is_relevant(self, path: str) -> bool:
+        """Whether a change to the path can change the apps found in the
+        directory: changes in hidden or skipped directories can't."""
+        try:
+            relative = os.path.relpath(path, self.directory)
+        except ValueError:
+            # e.g. on a different drive
+            return False
+        parts = pathlib.PurePath(relative).parts
+        return not any(
+            part.startswith(".") or part in SKIP_DIRS for part in parts
+        )
+
+    def invalidate(self, *paths: str) -> None:
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+            self.generation += 1
+
+    def watch(self) -> None:
+        """Watch the directory for changes, if watchdog is installed.
+
+        Each directory that is searched for apps gets its own watch, instead
+        of the whole tree being watched recursively: on Linux, each watched
+        directory takes up an inotify watch, and directories like .git,
+        .venv or node_modules can contain a great many of them.
+        """
+        if self._observer is not None or not DependencyManager.watchdog.has():
+            return
+
+        import watchdog.events  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+        import watchdog.observers  # type: ignore[import-not-found,import-untyped,unused-ignore] # noqa: E501
+
+        index = self
+
+        class Handler(watchdog.events.FileSystemEventHandler):  # type: ignore # noqa: E501
+            def on_any_event(self, event: Any) -> None:
+                if event.event_type in ("opened", "closed", "closed_no_write"):
+                    return
+                src_path = os.fsdecode(event.src_path)
+                dest_path = os.fsdecode(getattr(event, "dest_path", "") or "")
+                paths = [path for path in (src_path, dest_path) if path]
+                # e.g. churn in .git, .venv or node_modules
+                if not any(index.is_relevant(path) for path in paths):
+                    return
+                if event.is_directory:
+                    if event.event_type in ("deleted", "moved"):
+                        index._unwatch_tree(src_path)
+                    if event.event_type == "created":
+                        index._watch_tree(src_path)
+                    elif event.event_type == "moved":
+                        index._watch_tree(dest_path)
+                index.invalidate(*paths)
+
+        try:
+            self._observer = watchdog.observers.Observer()
+            self._handler = Handler()
+            # Scheduled before starting, so that no events are handled
+            # while the tree is walked
+            self._watch_tree(self.directory)
+            self._observer.daemon = True
+            self._observer.start()
+        except Exception as e:
+            LOGGER.debug("Failed to watch directory %s: %s", self.directory, e)
+            self._observer = None
+            self._watches.clear()
+
+    def _watch_tree(self, directory: str) -> None:
+        """Watch the directory and the directories under it that are
+        searched for apps."""
+        if not self.is_relevant(directory):
+            return
+        depth = len(
+            pathlib.PurePath(os.path.relpath(directory, self.directory)).parts
+        )
+        if depth > MAX_DEPTH:
+            return
+        try:
+            self._watches[directory] = self._observer.schedule(
+                self._handler, directory, recursive=False
+            )
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            LOGGER.debug("Failed to watch directory %s: %s", directory, e)
+            return
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in SKIP_DIRS:
+                continue
+            if entry.is_dir():
+                self._watch_tree(entry.path)
+
+    def _unwatch_tree(self, directory: str) -> None:
+        """Stop watching the directory and the directories under it."""
+        prefix = os.path.join(directory, "")
+        for path in [
+            path
+            for path in self._watches
+            if path == directory or path.startswith(prefix)
+        ]:
+            watch = self._watches.pop(path)
+            try:
+                self._observer.unschedule(watch)
+            except Exception as e:
+                LOGGER.debug("Failed to stop watching %s: %s", path, e)
+
+    def close(self) -> None:
+        """Stop watching the directory."""
+        observer, self._observer = self._observer, None
+        if observer is None:
+            return
+        try:
+            observer.stop()
+            observer.join(timeout=1)
+        except Exception as e:
+            LOGGER.debug("Failed to stop watching %s: %s", self.directory, e)
+        self._watches.clear()
+
+
 class LazyListOfFilesAppFileRouter(AppFileRouter):
-    def __init__(self, directory: str, include_markdown: bool) -> None:
+    def __init__(
+        self,
+        directory: str,
+        include_markdown: bool,
+        index: Optional[MarimoAppIndex] = None,
+    ) -> None:
         # pass through Path to canonicalize, strips trailing slashes
         self._directory = str(pathlib.Path(directory))
         self.include_markdown = include_markdown
         self._lazy_files: Optional[List[FileInfo]] = None
+        self._index = (
+            index
+            if index is not None and index.directory == self._directory
+            else MarimoAppIndex(self._directory)
+        )
+        # Index generation the files were loaded at
+        self._generation = -1
 
     @property
     def directory(self) -> str:
@@ -185,17 +386,25 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
         # Only create a new instance if the include_markdown flag is different
         if include_markdown != self.include_markdown:
             return LazyListOfFilesAppFileRouter(
-                self.directory, include_markdown
+                self.directory, include_markdown, index=self._index
             )
         return self
 
     def mark_stale(self) -> None:
+        # Even when watching, events arrive asynchronously, so a listing
+        # right after a change could miss it; rescanning is cheap since
+        # unchanged files aren't read again
         self._lazy_files = None
 
+    def close(self) -> None:
+        self._index.close()
+
     @property
     def files(self) -> List[FileInfo]:
-        if self._lazy_files is None:
+        generation = self._index.generation
+        if self._lazy_files is None or self._generation != generation:
             self._lazy_files = self._load_files()
+            self._generation = generation
         return self._lazy_files
 
     def _load_files(self) -> List[FileInfo]:
@@ -204,9 +413,11 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
         start_time = time.time()
         MAX_EXECUTION_TIME = 5  # 5 seconds timeout
 
-        def recurse(
-            directory: str, depth: int = 0
-        ) -> Optional[List[FileInfo]]:
+        # Walk the directory first, then check the candidate files in
+        # parallel: checking a file that isn't indexed means reading it
+        candidates: List[Tuple[str, os.stat_result]] = []
+
+        def recurse(directory: str, depth: int = 0) -> Optional[_Folder]:
             if depth > MAX_DEPTH:
                 return None
 
@@ -222,73 +433,53 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
                 LOGGER.debug("OSError scanning directory: %s", str(e))
                 return None
 
-            files: List[FileInfo] = []
-            folders: List[FileInfo] = []
-
+            folder = _Folder()
             for entry in entries:
                 # Skip hidden files and directories
                 if entry.name.startswith("."):
                     continue
 
                 if entry.is_dir():
-                    if entry.name in skip_dirs or depth == MAX_DEPTH:
+                    if entry.name in SKIP_DIRS or depth == MAX_DEPTH:
                         continue
                     children = recurse(entry.path, depth + 1)
-                    if children:
-                        folders.append(
-                            FileInfo(
-                                id=entry.path,
-                                path=entry.path,
-                                name=entry.name,
-                                is_directory=True,
-                                is_marimo_file=False,
-                                children=children,
-                            )
-                        )
+                    if children is not None:
+                        folder.folders.append((entry, children))
                 elif entry.name.endswith(tuple(allowed_extensions)):
-                    if self._is_marimo_app(entry.path):
-                        files.append(
-                            FileInfo(
-                                id=entry.path,
-                                path=entry.path,
-                                name=entry.name,
-                                is_directory=False,
-                                is_marimo_file=True,
-                                last_modified=entry.stat().st_mtime,
-                            )
-                        )
-
-            # Sort folders then files, based on natural sort (alpha, then num)
-            return sorted(folders, key=natural_sort_file) + sorted(
-                files, key=natural_sort_file
-            )
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        # e.g. broken symlinks
+                        continue
+                    candidates.append((entry.path, stat))
+                    folder.files.append((entry, stat))
+            return folder
 
-        MAX_DEPTH = 5
-        skip_dirs = {
-            "venv",
-            "__pycache__",
-            "node_modules",
-            "site-packages",
-            "eggs",
-        }
         allowed_extensions = (
             (".py", ".md") if self.include_markdown else (".py",)
         )
 
-        return recurse(self.directory) or []
+        self._index.watch()
+        root = recurse(self.directory)
+        if root is None:
+            return []
+
+        with ThreadPoolExecutor() as executor:
+            apps = {
+                path
+                for path, is_app in zip(
+                    (path for path, _ in candidates),
+                    executor.map(
+                        lambda c: self._index.is_marimo_app(*c), candidates
+                    ),
+                )
+                if is_app
+            }
+        self._index.retain(
+            {path for path, _ in candidates}, allowed_extensions
+        )
 
-    def _is_marimo_app(self, full_path: str) -> bool:
-        try:
-            path = MarimoPath(full_path)
-            contents = path.read_text()
-            if path.is_markdown():
-                return "marimo-version:" in contents
-            if path.is_python():
-                return "marimo.App" in contents and "import marimo" in contents
-            return False
-        except Exception as e:
-            LOGGER.debug("Error reading file %s: %s", full_path, e)
-            return False
+        return root.to_file_infos(apps)
 
     def get_unique_file_key(self) -> str | None:
         return None
@@ -297,6 +488,60 @@ class LazyListOfFilesAppFileRouter(AppFileRouter):
         return None
 
 
+class _Folder:
+    """A scanned directory, before its files are checked."""
+
+    def __init__(self) -> None:
+        self.folders: List[Tuple[os.DirEntry[str], _Folder]] = []
+        self.files: List[Tuple[os.DirEntry[str], os.stat_result]] = []
+
+    def to_file_infos(self, apps: Set[str]) -> List[FileInfo]:
+        folders: List[FileInfo] = []
+        for entry, folder in self.folders:
+            children = folder.to_file_infos(apps)
+            if children:
+                folders.append(
+                    FileInfo(
+                        id=entry.path,
+                        path=entry.path,
+                        name=entry.name,
+                        is_directory=True,
+                        is_marimo_file=False,
+                        children=children,
+                    )
+                )
+        files = [
+            FileInfo(
+                id=entry.path,
+                path=entry.path,
+                name=entry.name,
+                is_directory=False,
+                is_marimo_file=True,
+                last_modified=stat.st_mtime,
+            )
+            for entry, stat in self.files
+            if entry.path in apps
+        ]
+        # Sort folders then files, based on natural sort (alpha, then num)
+        return sorted(folders, key=natural_sort_file) + sorted(
+            files, key=natural_sort_file
+        )
+
+
+def _is_marimo_app(full_path: str) -> bool:
+    try:
+        path = MarimoPath(full_path)
+        contents = path.read_text()
+        if path.is_markdown():
+            return "marimo-version:" in contents
+        if path.is_python():
+            return "marimo.App" in contents and "import marimo" in contents
+        return False
+    except Exception as e:
+        LOGGER.debug("Error reading file %s: %s", full_path, e)
+        return False
+
+
 @contextmanager
 def timeout(seconds: int, message: str) -> Generator[None, None, None]:
     def timeout_handler(signum: int, frame: Optional[FrameType]) -> None:
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from marimo._ast.cell import CellConfig, CellId_t
 from marimo._config.config import MarimoConfig
+from marimo._messaging.cell_profile import CellProfile
 from marimo._runtime.requests import (
     ExecuteMultipleRequest,
     ExecuteScratchpadRequest,
@@ -64,6 +65,12 @@ class ReadCodeResponse:
     contents: str
 
 
+@dataclass
+class CellProfilesResponse:
+    # Profiles of the last run of each cell, slowest first
+    profiles: List[CellProfile]
+
+
 @dataclass
 class RenameFileRequest:
     filename: str
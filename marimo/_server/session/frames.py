@@ -0,0 +1,156 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Encoding of kernel messages and operations into websocket frames.
+
+A session hands the same message object to each of its consumers in turn,
+so the most recently encoded message is memoized (per thread): a message is
+encoded to JSON once, no matter how many consumers are connected.
+
+Sessions also keep a bounded log of the frames sent to their consumers,
+numbered with a sequence number, so that a client that reconnects can be
+sent only the frames it missed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from marimo import _loggers
+from marimo._messaging.ops import serialize
+from marimo._plugins.core.json_encoder import WebComponentEncoder
+
+if TYPE_CHECKING:
+    from marimo._messaging.ops import MessageOperation
+    from marimo._messaging.types import KernelMessage
+
+LOGGER = _loggers.marimo_logger()
+
+
+class _LastFrame(threading.local):
+    def __init__(self) -> None:
+        # A reference to the message is kept so that its id can't be reused
+        self.message: object = None
+        self.frame: Optional[str] = None
+
+
+_last_frame = _LastFrame()
+
+
+def _encode(
+    message: object,
+    unpack: Callable[[], Tuple[str, Any]],
+    seq: Optional[int] = None,
+) -> Optional[str]:
+    if message is _last_frame.message:
+        return _last_frame.frame
+
+    op, data = unpack()
+    payload: dict[str, Any] = {"op": op, "data": data}
+    if seq is not None:
+        payload["seq"] = seq
+    try:
+        frame: Optional[str] = json.dumps(payload, cls=WebComponentEncoder)
+    except TypeError as e:
+        # This is a deserialization error
+        LOGGER.error("Failed to send message to frontend: %s", str(e))
+        LOGGER.error("Message: %s", data)
+        frame = None
+
+    _last_frame.message = message
+    _last_frame.frame = frame
+    return frame
+
+
+def encode_kernel_message(message: KernelMessage) -> Optional[str]:
+    """Encode a message from the kernel as a frame.
+
+    Returns None if the message can't be encoded.
+    """
+    return _encode(message, lambda: message)
+
+
+def encode_operation(operation: MessageOperation) -> Optional[str]:
+    """Encode an operation written by the server as a frame.
+
+    Returns None if the operation can't be encoded.
+    """
+    return _encode(operation, lambda: (operation.name, serialize(operation)))
+
+
+def sequence_frame(seq: int) -> str:
+    """An empty batch that tells the client which sequence number its
+    state corresponds to."""
+    return json.dumps({"op": "batch", "data": [], "seq": seq})
+
+
+class FrameLog:
+    """Bounded log of the frames written to the consumers of a session.
+
+    Each frame is numbered with a sequence number, included in the frame as
+    `seq`. Since consumers are handed the same message objects as the log,
+    the frames they send are the numbered ones from the log.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._frames: deque[Tuple[int, str, str]] = deque()
+        self._size = 0
+        self._seq = 0
+        # Kernel messages and server operations are logged from different
+        # threads in run mode
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent frame."""
+        return self._seq
+
+    def append_kernel_message(self, message: KernelMessage) -> Optional[str]:
+        """Number, encode and log a message from the kernel."""
+        with self._lock:
+            return self._append(
+                message[0], _encode(message, lambda: message, self._seq + 1)
+            )
+
+    def append_operation(self, operation: MessageOperation) -> Optional[str]:
+        """Number, encode and log an operation written by the server."""
+        with self._lock:
+            return self._append(
+                operation.name,
+                _encode(
+                    operation,
+                    lambda: (operation.name, serialize(operation)),
+                    self._seq + 1,
+                ),
+            )
+
+    def _append(self, op: str, frame: Optional[str]) -> Optional[str]:
+        if frame is None:
+            return None
+        self._seq += 1
+        self._frames.append((self._seq, op, frame))
+        self._size += len(frame)
+        while self._size > self.max_bytes:
+            _, _, dropped = self._frames.popleft()
+            self._size -= len(dropped)
+        return frame
+
+    def since(self, seq: int) -> Optional[List[Tuple[str, str]]]:
+        """The (op, frame) pairs logged after `seq`.
+
+        Returns None if the log no longer reaches back to `seq`, or if `seq`
+        is not one this log has handed out.
+        """
+        with self._lock:
+            if seq > self._seq or seq < 0:
+                return None
+            first_seq = self._frames[0][0] if self._frames else self._seq + 1
+            if seq < first_seq - 1:
+                return None
+            return [
+                (op, frame)
+                for frame_seq, op, frame in self._frames
+                if frame_seq > seq
+            ]
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from marimo._ast.cell import CellId_t
 from marimo._data.models import DataTable
 from marimo._messaging.cell_output import CellChannel, CellOutput
 from marimo._messaging.ops import (
     CellOp,
+    CellProfiles,
     Datasets,
     Interrupted,
     MessageOperation,
@@ -27,6 +28,9 @@ from marimo._runtime.requests import (
 )
 from marimo._utils.parse_dataclass import parse_raw
 
+if TYPE_CHECKING:
+    from marimo._messaging.cell_profile import CellProfile
+
 
 class SessionView:
     """
@@ -52,6 +56,8 @@ class SessionView:
         self.last_executed_code: dict[CellId_t, str] = {}
         # Map of cell id to the last cell execution time
         self.last_execution_time: dict[CellId_t, float] = {}
+        # Map of cell id to the resources used by its last run
+        self.cell_profiles: dict[CellId_t, CellProfile] = {}
 
         # Auto-saving
         self.has_auto_exported_html = False
@@ -169,6 +175,10 @@ class SessionView:
                 tables[table.name] = table
             self.datasets = Datasets(tables=list(tables.values()))
 
+        elif isinstance(operation, CellProfiles):
+            for profile in operation.profiles:
+                self.cell_profiles[profile.cell_id] = profile
+
         elif isinstance(operation, UpdateCellIdsRequest):
             self.cell_ids = operation
 
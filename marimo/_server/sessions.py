@@ -15,6 +15,8 @@ even if its socket is closed.
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import multiprocessing as mp
 import os
 import queue
@@ -27,7 +29,7 @@ import time
 from multiprocessing import connection
 from multiprocessing.queues import Queue as MPQueue
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 from uuid import uuid4
 
 from marimo import _loggers
@@ -35,14 +37,26 @@ from marimo._ast.cell import CellConfig, CellId_t
 from marimo._cli.print import red
 from marimo._config.manager import MarimoConfigReader
 from marimo._config.settings import GLOBAL_SETTINGS
+from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.ops import (
     Alert,
+    CellOp,
+    CompletedRun,
     FocusCell,
     MessageOperation,
     Reload,
     UpdateCellCodes,
 )
 from marimo._messaging.types import KernelMessage
+from marimo._metrics import (
+    BROADCAST_OPERATIONS,
+    CONTROL_REQUESTS,
+    KERNEL_MESSAGE_BYTES,
+    KERNEL_MESSAGES,
+    SESSIONS_CLOSED,
+    SESSIONS_CREATED,
+    SESSIONS_EVICTED,
+)
 from marimo._output.formatters.formatters import register_formatters
 from marimo._runtime import requests, runtime
 from marimo._runtime.requests import (
@@ -54,14 +68,22 @@ from marimo._runtime.requests import (
     SerializedQueryParams,
     SetUIElementValueRequest,
 )
-from marimo._server.exceptions import InvalidSessionException
+from marimo._runtime.virtual_file import (
+    create_spill_directory,
+    resolve_spill_file,
+)
+from marimo._server.exceptions import (
+    InvalidSessionException,
+    TooManySessionsException,
+)
 from marimo._server.file_manager import AppFileManager
 from marimo._server.file_router import AppFileRouter, MarimoFileKey
 from marimo._server.ids import ConsumerId, SessionId
 from marimo._server.model import ConnectionState, SessionConsumer, SessionMode
 from marimo._server.models.models import InstantiateRequest
 from marimo._server.recents import RecentFilesManager
-from marimo._server.session.session_view import SessionView
+from marimo._server.session.frames import FrameLog
+from marimo._server.session.session_view import SessionView, as_list
 from marimo._server.tokens import AuthToken, SkewProtectionToken
 from marimo._server.types import QueueType
 from marimo._server.utils import print_, print_tabbed
@@ -165,7 +187,9 @@ class KernelManager:
         virtual_files_supported: bool,
         redirect_console_to_browser: bool,
     ) -> None:
-        self.kernel_task: Optional[threading.Thread] | Optional[mp.Process]
+        self.kernel_task: Optional[threading.Thread] | Optional[mp.Process] = (
+            None
+        )
         self.queue_manager = queue_manager
         self.mode = mode
         self.configs = configs
@@ -176,6 +200,11 @@ class KernelManager:
         # Only used in edit mode
         self._read_conn: Optional[TypedConnection[KernelMessage]] = None
         self._virtual_files_supported = virtual_files_supported
+        # Private directory for the spill files of large virtual files;
+        # the kernel writes them and the server streams them
+        self.spill_directory: Optional[str] = (
+            create_spill_directory() if virtual_files_supported else None
+        )
 
     def start_kernel(self) -> None:
         # We use a process in edit mode so that we can interrupt the app
@@ -205,6 +234,7 @@ class KernelManager:
                     self.queue_manager.win32_interrupt_queue,
                     self.profile_path,
                     GLOBAL_SETTINGS.LOG_LEVEL,
+                    self.spill_directory,
                 ),
                 # The process can't be a daemon, because daemonic processes
                 # can't create children
@@ -253,6 +283,7 @@ class KernelManager:
                     None,
                     # log level
                     GLOBAL_SETTINGS.LOG_LEVEL,
+                    self.spill_directory,
                 ),
                 # daemon threads can create child processes, unlike
                 # daemon processes
@@ -305,9 +336,11 @@ class KernelManager:
                 os.kill(self.kernel_task.pid, signal.SIGINT)
 
     def close_kernel(self) -> None:
-        assert self.kernel_task is not None, "kernel not started"
-
-        if isinstance(self.kernel_task, mp.Process):
+        if self.kernel_task is None:
+            # Sessions served from a cached initial render may be closed
+            # before their kernel is ever started
+            pass
+        elif isinstance(self.kernel_task, mp.Process):
             if self.profile_path is not None and self.kernel_task.is_alive():
                 self.queue_manager.control_queue.put(requests.StopRequest())
                 # Hack: Wait for kernel to exit and write out profile;
@@ -331,6 +364,15 @@ class KernelManager:
             # to block on it finishing
             self.queue_manager.control_queue.put(requests.StopRequest())
 
+        if self.spill_directory is not None:
+            shutil.rmtree(self.spill_directory, ignore_errors=True)
+
+    def resolve_spill_file(self, filename: str) -> Optional[str]:
+        """Path of a spill file written by this kernel, if it exists."""
+        if self.spill_directory is None:
+            return None
+        return resolve_spill_file(self.spill_directory, filename)
+
     @property
     def kernel_connection(self) -> TypedConnection[KernelMessage]:
         assert self._read_conn is not None, "connection not started"
@@ -391,6 +433,7 @@ class Room:
         operation: MessageOperation,
         except_consumer: Optional[ConsumerId],
     ) -> None:
+        BROADCAST_OPERATIONS.inc(op=operation.name)
         for consumer in self.consumers:
             if consumer.consumer_id == except_consumer:
                 continue
@@ -428,6 +471,8 @@ class Session:
         virtual_files_supported: bool,
         redirect_console_to_browser: bool,
         ttl_seconds: Optional[int],
+        initial_view: Optional[SessionView] = None,
+        on_initial_render: Optional[Callable[[SessionView], None]] = None,
     ) -> Session:
         """
         Create a new session.
@@ -451,6 +496,8 @@ class Session:
             kernel_manager,
             app_file_manager,
             ttl_seconds,
+            initial_view=initial_view,
+            on_initial_render=on_initial_render,
         )
 
     def __init__(
@@ -461,8 +508,17 @@ class Session:
         kernel_manager: KernelManager,
         app_file_manager: AppFileManager,
         ttl_seconds: Optional[int],
+        initial_view: Optional[SessionView] = None,
+        on_initial_render: Optional[Callable[[SessionView], None]] = None,
     ) -> None:
-        """Initialize kernel and client connection to it."""
+        """Initialize kernel and client connection to it.
+
+        If `initial_view` is given, the session starts out with a copy of
+        that view and its kernel is only started on the first control
+        request. `on_initial_render` is called with the session view once
+        the app's first run completes, unless the client interacted with
+        the app before then.
+        """
         # This is some unique ID that we can use to identify the session
         # in edit mode. We don't use the session_id because this can change if
         # the session is resumed
@@ -474,9 +530,21 @@ class Session:
         self.ttl_seconds = (
             ttl_seconds if ttl_seconds is not None else _DEFAULT_TTL_SECONDS
         )
-        self.session_view = SessionView()
-
-        self.kernel_manager.start_kernel()
+        self.session_view = (
+            copy.deepcopy(initial_view)
+            if initial_view is not None
+            else SessionView()
+        )
+        self._kernel_deferred = initial_view is not None
+        # Frames sent to the consumers, for clients that reconnect
+        self.frame_log = FrameLog()
+        self._on_initial_render = on_initial_render
+        # Monotonic timestamp of the last client activity, used to pick
+        # eviction candidates when the server is over its kernel budget
+        self.last_active = time.monotonic()
+
+        if not self._kernel_deferred:
+            self.kernel_manager.start_kernel()
         # Reads from the kernel connection and distributes the
         # messages to each subscriber.
         self.message_distributor: (
@@ -492,9 +560,7 @@ class Session:
             assert q is not None
             self.message_distributor = QueueDistributor[KernelMessage](queue=q)
 
-        self.message_distributor.add_consumer(
-            lambda msg: self.session_view.add_raw_operation(msg[1])
-        )
+        self.message_distributor.add_consumer(self._on_kernel_message)
         self.connect_consumer(session_consumer, main=True)
         self.message_distributor.start()
 
@@ -502,8 +568,23 @@ class Session:
         self._start_heartbeat()
         self._closed = False
 
+    def _on_kernel_message(self, msg: KernelMessage) -> None:
+        KERNEL_MESSAGES.inc(op=msg[0])
+        # Logging here, as the first consumer of the message, also encodes
+        # the frame that the websocket consumers send
+        frame = self.frame_log.append_kernel_message(msg)
+        if frame is not None:
+            KERNEL_MESSAGE_BYTES.inc(len(frame))
+        self.session_view.add_raw_operation(msg[1])
+        if self._on_initial_render is not None and msg[0] == CompletedRun.name:
+            on_initial_render = self._on_initial_render
+            self._on_initial_render = None
+            on_initial_render(self.session_view)
+
     def _start_heartbeat(self) -> None:
         def _check_alive() -> None:
+            if self._kernel_deferred:
+                return
             if not self.kernel_manager.is_alive():
                 LOGGER.debug(
                     "Closing session %s because kernel died",
@@ -535,6 +616,21 @@ class Session:
             # This can happen if there is no event loop running
             self.heartbeat_task = None
 
+    @property
+    def kernel_deferred(self) -> bool:
+        """Whether the kernel has yet to be started."""
+        return self._kernel_deferred
+
+    def _start_deferred_kernel(self) -> None:
+        """Start the kernel of a session served from a cached initial
+        render, and run the app so that it catches up with the view."""
+        self._kernel_deferred = False
+        LOGGER.debug("Starting deferred kernel for %s", self.initialization_id)
+        self.kernel_manager.start_kernel()
+        self.instantiate(
+            InstantiateRequest(object_ids=[], values=[], auto_run=True)
+        )
+
     def try_interrupt(self) -> None:
         """Try to interrupt the kernel."""
         self.kernel_manager.interrupt_kernel()
@@ -545,6 +641,17 @@ class Session:
         from_consumer_id: Optional[ConsumerId],
     ) -> None:
         """Put a control request in the control queue."""
+        CONTROL_REQUESTS.inc(request=type(request).__name__)
+        self.last_active = time.monotonic()
+        if self._kernel_deferred:
+            self._start_deferred_kernel()
+        if self._on_initial_render is not None and not (
+            isinstance(request, CreationRequest)
+            and not request.set_ui_element_value_request.object_ids
+        ):
+            # The client interacted with the app: the first run no longer
+            # reflects what every new viewer would see
+            self._on_initial_render = None
         self._queue_manager.control_queue.put(request)
         if isinstance(request, SetUIElementValueRequest):
             self._queue_manager.set_ui_element_queue.put(request)
@@ -582,6 +689,7 @@ class Session:
         This will disconnect the main session consumer,
         or a kiosk consumer.
         """
+        self.last_active = time.monotonic()
         self.room.remove_consumer(session_consumer)
 
     def maybe_disconnect_consumer(self) -> None:
@@ -600,6 +708,7 @@ class Session:
         If its the main consumer and one already exists,
         an exception is raised.
         """
+        self.last_active = time.monotonic()
         subscribe = session_consumer.on_start()
         unsubscribe_consumer = self.message_distributor.add_consumer(subscribe)
         self.room.add_consumer(
@@ -628,6 +737,8 @@ class Session:
     ) -> None:
         """Write an operation to the session consumer and the session view."""
         self.session_view.add_operation(operation)
+        if from_consumer_id is None:
+            self.frame_log.append_operation(operation)
         self.room.broadcast(operation, except_consumer=from_consumer_id)
 
     def close(self) -> None:
@@ -689,6 +800,14 @@ class SessionManager:
     - the app mode (edit or run)
     - the auth token
     - the skew-protection token
+
+    In run mode, the number of concurrent sessions and the memory used by
+    their kernels can be capped; when a new session would exceed the budget,
+    the least recently used orphaned sessions are closed to make room.
+
+    Run mode can also cache the initial render of each app: once a session
+    has completed its first run without any interaction, new sessions are
+    served that view and only start a kernel when their viewer interacts.
     """
 
     def __init__(
@@ -704,6 +823,9 @@ class SessionManager:
         auth_token: Optional[AuthToken],
         redirect_console_to_browser: bool,
         ttl_seconds: Optional[int],
+        max_sessions: Optional[int] = None,
+        max_kernel_memory: Optional[int] = None,
+        cache_initial_render: bool = False,
     ) -> None:
         self.file_router = file_router
         self.mode = mode
@@ -712,6 +834,13 @@ class SessionManager:
         self.sessions: dict[SessionId, Session] = {}
         self.include_code = include_code
         self.ttl_seconds = ttl_seconds
+        # Run-mode budget: maximum number of concurrent sessions, and
+        # maximum memory (in bytes) used by the server and its kernels
+        self.max_sessions = max_sessions
+        self.max_kernel_memory = max_kernel_memory
+        self.cache_initial_render = cache_initial_render
+        # App path -> (code hash, view after the first run)
+        self._initial_renders: dict[str, tuple[str, SessionView]] = {}
         self.lsp_server = lsp_server
         self.watcher: Optional[FileWatcher] = None
         self.recents = RecentFilesManager()
@@ -772,6 +901,24 @@ class SessionManager:
             if app_file_manager.path:
                 self.recents.touch(app_file_manager.path)
 
+            self._evict_idle_sessions()
+            SESSIONS_CREATED.inc(mode=self.mode.value)
+            initial_view: Optional[SessionView] = None
+            on_initial_render: Optional[Callable[[SessionView], None]] = None
+            render_key = self._initial_render_key(
+                app_file_manager, query_params
+            )
+            if render_key is not None:
+                path, code_hash = render_key
+                cached = self._initial_renders.get(path)
+                if cached is not None and cached[0] == code_hash:
+                    LOGGER.debug("Serving cached initial render for %s", path)
+                    initial_view = cached[1]
+                else:
+
+                    def on_initial_render(view: SessionView) -> None:
+                        self._cache_initial_render(path, code_hash, view)
+
             self.sessions[session_id] = Session.create(
                 initialization_id=file_key,
                 session_consumer=session_consumer,
@@ -786,9 +933,101 @@ class SessionManager:
                 virtual_files_supported=True,
                 redirect_console_to_browser=self.redirect_console_to_browser,
                 ttl_seconds=self.ttl_seconds,
+                initial_view=initial_view,
+                on_initial_render=on_initial_render,
             )
         return self.sessions[session_id]
 
+    def _initial_render_key(
+        self,
+        app_file_manager: AppFileManager,
+        query_params: SerializedQueryParams,
+    ) -> Optional[tuple[str, str]]:
+        """The app path and code hash that key its cached initial render,
+        or None if the initial render can't be shared."""
+        if (
+            not self.cache_initial_render
+            or self.mode != SessionMode.RUN
+            or app_file_manager.path is None
+            # Outputs may depend on the query params
+            or query_params
+        ):
+            return None
+        codes = "\0".join(app_file_manager.app.cell_manager.codes())
+        return (
+            app_file_manager.path,
+            hashlib.sha256(codes.encode("utf-8")).hexdigest(),
+        )
+
+    def _cache_initial_render(
+        self, path: str, code_hash: str, view: SessionView
+    ) -> None:
+        for op in view.operations:
+            if not isinstance(op, CellOp):
+                continue
+            outputs = [op.output, *as_list(op.console)]
+            for output in outputs:
+                if output is None:
+                    continue
+                if output.channel == CellChannel.MARIMO_ERROR:
+                    # Don't share errors, which may be transient
+                    return
+                if "@file/" in str(output.data):
+                    # Virtual files are owned by the kernel that created them
+                    return
+        LOGGER.debug("Caching initial render for %s", path)
+        self._initial_renders[path] = (code_hash, copy.deepcopy(view))
+
+    def _evict_idle_sessions(self) -> None:
+        """Make room for a new run-mode session.
+
+        Closes orphaned sessions, least recently used first, until the
+        session and memory budgets allow one more session. Memory is only
+        reclaimed once an evicted kernel has wound down, so at most one
+        session is evicted per new session for the memory budget.
+
+        Raises TooManySessionsException if the budget can't be met.
+        """
+        if self.mode != SessionMode.RUN:
+            return
+        if self.max_sessions is None and self.max_kernel_memory is None:
+            return
+
+        idle = sorted(
+            (
+                (session_id, session)
+                for session_id, session in self.sessions.items()
+                if session.connection_state() == ConnectionState.ORPHANED
+            ),
+            key=lambda item: item[1].last_active,
+            reverse=True,
+        )
+
+        def evict() -> bool:
+            if not idle:
+                return False
+            session_id, _ = idle.pop()
+            LOGGER.debug("Evicting idle session %s", session_id)
+            SESSIONS_EVICTED.inc()
+            self.close_session(session_id)
+            return True
+
+        if (
+            self.max_kernel_memory is not None
+            and _kernel_memory_bytes() > self.max_kernel_memory
+            and not evict()
+        ):
+            raise TooManySessionsException(
+                "Kernel memory budget exceeded and no idle session to evict"
+            )
+
+        if self.max_sessions is not None:
+            while len(self.sessions) >= self.max_sessions:
+                if not evict():
+                    raise TooManySessionsException(
+                        f"Session limit of {self.max_sessions} reached"
+                    )
+
     def get_session(self, session_id: SessionId) -> Optional[Session]:
         session = self.sessions.get(session_id)
         if session:
@@ -801,6 +1040,15 @@ class SessionManager:
 
         return None
 
+    def resolve_spill_file(self, filename: str) -> Optional[str]:
+        """Path of a spill file written by the kernel of one of this
+        server's sessions, if it exists."""
+        for session in self.sessions.values():
+            path = session.kernel_manager.resolve_spill_file(filename)
+            if path is not None:
+                return path
+        return None
+
     def get_session_by_file_key(
         self, file_key: MarimoFileKey
     ) -> Optional[Session]:
@@ -910,6 +1158,7 @@ class SessionManager:
         if session is not None:
             session.close()
             del self.sessions[session_id]
+            SESSIONS_CLOSED.inc(mode=self.mode.value)
             return True
         return False
 
@@ -917,6 +1166,7 @@ class SessionManager:
         LOGGER.debug("Closing all sessions (sessions: %s)", self.sessions)
         for session in self.sessions.values():
             session.close()
+            SESSIONS_CLOSED.inc(mode=self.mode.value)
         LOGGER.debug("Closed all sessions.")
         self.sessions = {}
 
@@ -924,6 +1174,7 @@ class SessionManager:
         LOGGER.debug("Shutting down")
         self.close_all_sessions()
         self.lsp_server.stop()
+        self.file_router.close()
         if self.watcher:
             self.watcher.stop()
 
@@ -968,6 +1219,24 @@ class SessionManager:
         )
 
 
+def _kernel_memory_bytes() -> int:
+    """Resident memory of the server and its child processes.
+
+    Run-mode kernels are threads of the server process, so their memory is
+    accounted for in the server's own RSS.
+    """
+    import psutil
+
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return int(total)
+
+
 class LspServer:
     def __init__(self, port: int) -> None:
         self.port = port
@@ -82,6 +82,9 @@ def start(
     allow_origins: Optional[tuple[str, ...]] = None,
     auth_token: Optional[AuthToken],
     redirect_console_to_browser: bool,
+    max_sessions: Optional[int] = None,
+    max_kernel_memory: Optional[int] = None,
+    cache_initial_render: bool = False,
 ) -> None:
     """
     Start the server.
@@ -115,6 +118,9 @@ def start(
         cli_args=cli_args,
         auth_token=auth_token,
         redirect_console_to_browser=redirect_console_to_browser,
+        max_sessions=max_sessions,
+        max_kernel_memory=max_kernel_memory,
+        cache_initial_render=cache_initial_render,
     )
 
     log_level = "info" if development_mode else "error"
@@ -182,6 +188,8 @@ def start(
             ws_ping_interval=1,
             # close the websocket if we don't receive a pong after 60 seconds
             ws_ping_timeout=60,
+            # compress websocket messages when the client supports it
+            ws_per_message_deflate=True,
             timeout_graceful_shutdown=1,
             # Under uvloop, reading the socket we monitor under add_reader()
             # occasionally throws BlockingIOError (errno 11, or errno 35,
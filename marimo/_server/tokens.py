@@ -1,6 +1,7 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import hashlib
 import secrets
 
 
@@ -51,7 +52,7 @@ class SkewProtectionToken:
 
     @staticmethod
     def from_code(code: str) -> SkewProtectionToken:
-        return SkewProtectionToken(str(hash(code)))
+        return SkewProtectionToken(_digest(code))
 
     @staticmethod
     def random() -> SkewProtectionToken:
@@ -59,3 +60,7 @@ class SkewProtectionToken:
 
     def __str__(self) -> str:
         return self.token
+
+
+def _digest(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
@@ -13,7 +13,7 @@ else:
 
 
 if TYPE_CHECKING:
-    from narwhals.typing import IntoFrame
+    from narwhals.stable.v1.typing import IntoFrame
 
 
 def empty_df(native_df: IntoFrame) -> IntoFrame:
@@ -133,7 +133,7 @@ def unwrap_narwhals_dataframe(df: Any) -> Any:
     """
     Unwrap a narwhals dataframe.
     """
-    if isinstance(df, nw.DataFrame):
+    if isinstance(df, (nw.DataFrame, nw.LazyFrame)):
         return df.to_native()  # type: ignore[return-value]
     return df
 
@@ -862,6 +862,41 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/kernel/cell_profiles": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get: {
+      parameters: {
+        query?: never;
+        header?: never;
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: never;
+      responses: {
+        /** @description Get the resources used by each cell's last run */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/json": components["schemas"]["CellProfilesResponse"];
+          };
+        };
+      };
+    };
+    put?: never;
+    post?: never;
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/kernel/code_autocomplete": {
     parameters: {
       query?: never;
@@ -1216,6 +1251,45 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/kernel/preview_variables": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    post: {
+      parameters: {
+        query?: never;
+        header?: never;
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: {
+        content: {
+          "application/json": components["schemas"]["PreviewVariablesRequest"];
+        };
+      };
+      responses: {
+        /** @description Preview variables in the variables panel */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/json": components["schemas"]["SuccessResponse"];
+          };
+        };
+      };
+    };
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/kernel/read_code": {
     parameters: {
       query?: never;
@@ -2075,6 +2149,48 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/metrics": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get: {
+      parameters: {
+        query?: never;
+        header?: never;
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: never;
+      responses: {
+        /** @description Get server metrics in the OpenMetrics text format. Only available when MARIMO_METRICS is set. */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/openmetrics-text": string;
+          };
+        };
+        /** @description Metrics are not enabled */
+        404: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content?: never;
+        };
+      };
+    };
+    put?: never;
+    post?: never;
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
 }
 export type webhooks = Record<string, never>;
 export interface components {
@@ -2133,6 +2249,12 @@ export interface components {
     BaseResponse: {
       success: boolean;
     };
+    CellAllocation: {
+      count: number;
+      filename: string;
+      lineno: number;
+      size: number;
+    };
     /** @enum {string} */
     CellChannel:
       | "stdout"
@@ -2174,6 +2296,24 @@ export interface components {
       mimetype: components["schemas"]["MimeType"];
       timestamp: number;
     };
+    CellProfile: {
+      allocations?: components["schemas"]["CellAllocation"][] | null;
+      cell_id: string;
+      cpu_time: number;
+      peak_rss_delta?: number | null;
+      post_execution_hooks: {
+        [key: string]: number;
+      };
+      wall_time: number;
+    };
+    CellProfiles: {
+      /** @enum {string} */
+      name: "cell-profiles";
+      profiles: components["schemas"]["CellProfile"][];
+    };
+    CellProfilesResponse: {
+      profiles: components["schemas"]["CellProfile"][];
+    };
     CodeCompletionRequest: {
       cellId: string;
       document: string;
@@ -2639,6 +2779,7 @@ export interface components {
       | components["schemas"]["QueryParamsClear"]
       | components["schemas"]["Datasets"]
       | components["schemas"]["DataColumnPreview"]
+      | components["schemas"]["CellProfiles"]
       | components["schemas"]["FocusCell"]
       | components["schemas"]["UpdateCellCodes"]
       | components["schemas"]["UpdateCellIdsRequest"];
@@ -2710,6 +2851,9 @@ export interface components {
       sourceType: "local" | "duckdb";
       tableName: string;
     };
+    PreviewVariablesRequest: {
+      variableNames: string[];
+    };
     QueryParamsAppend: {
       key: string;
       /** @enum {string} */
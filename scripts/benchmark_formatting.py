@@ -0,0 +1,32 @@
+# Copyright 2024 Marimo. All rights reserved.
+"""Micro-benchmark for formatting large lists and dicts.
+
+Usage: python scripts/benchmark_formatting.py [size]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from marimo._output.formatting import try_format
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cases: dict[str, object] = {
+        "list[int]": list(range(size)),
+        "list[str]": [str(i) for i in range(size)],
+        "dict[str, float]": {str(i): float(i) for i in range(size)},
+        "list[dict]": [{"a": i, "b": [i, str(i)]} for i in range(size // 10)],
+    }
+    for name, value in cases.items():
+        # Warm up (registers formatters)
+        try_format(value)
+        runs = 5
+        total = timeit.timeit(lambda v=value: try_format(v), number=runs)
+        print(f"{name:<20} {total / runs * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,15 @@ if $cmd; then
   mkdir -p ../marimo/_static/
   cp -R dist/* ../marimo/_static/
   rm -rf ../marimo/_static/files/wasm-intro.py
+  echo "Precompressing assets..."
+  find ../marimo/_static/assets -type f \
+    \( -name '*.js' -o -name '*.css' -o -name '*.json' -o -name '*.svg' -o -name '*.wasm' \) \
+    -size +1k -exec gzip -k -9 -f {} \;
+  if command -v brotli >/dev/null 2>&1; then
+    find ../marimo/_static/assets -type f \
+      \( -name '*.js' -o -name '*.css' -o -name '*.json' -o -name '*.svg' -o -name '*.wasm' \) \
+      -size +1k -exec brotli -k -f {} \;
+  fi
   echo "Compilation succeeded.\n"
 else
   echo "Frontend compilation failed.\n"
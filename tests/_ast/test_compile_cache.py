@@ -0,0 +1,128 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._ast import compile_cache, compiler
+from marimo._ast.cell import SourcePosition
+from marimo._ast.compile_cache import CompileCache, cache_key
+from marimo._dependencies.dependencies import DependencyManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+CODE = """
+import os
+_private = 1
+def f():
+    return [lambda: x for x in range(_private)]
+x = f()
+x
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    with (
+        patch.object(
+            compile_cache, "_compile_cache", CompileCache(str(tmp_path))
+        ),
+        patch.object(sys, "dont_write_bytecode", False),
+    ):
+        yield tmp_path
+
+
+def test_cache_key() -> None:
+    assert cache_key("x = 1", "a", None) == cache_key("x = 1", "a", None)
+    assert cache_key("x = 1", "a", None) != cache_key("x = 2", "a", None)
+    # Private names are mangled with the cell id
+    assert cache_key("x = 1", "a", None) != cache_key("x = 1", "b", None)
+    assert cache_key("x = 1", "a", None) != cache_key(
+        "x = 1", "a", SourcePosition("app.py", 1, 4)
+    )
+
+
+
+def test_cache_key_depends_on_sql_parser() -> None:
+    sql = 'df = mo.sql("SELECT * FROM t")'
+    duckdb = DependencyManager.duckdb
+    # SQL refs and defs are only found when duckdb is installed
+    with patch.object(duckdb, "has", return_value=False):
+        without_duckdb = cache_key(sql, "a", None)
+        python_key = cache_key("x = 1", "a", None)
+    with patch.object(duckdb, "has", return_value=True):
+        with patch.object(duckdb, "get_version", return_value="1.0.0"):
+            v1_key = cache_key(sql, "a", None)
+            # Python cells don't depend on duckdb
+            assert cache_key("x = 1", "a", None) == python_key
+        with patch.object(duckdb, "get_version", return_value="1.1.0"):
+            v2_key = cache_key(sql, "a", None)
+    assert len({without_duckdb, v1_key, v2_key}) == 3
+
+
+def test_compiled_cells_are_reused(cache_dir: Path) -> None:
+    cell = compiler.compile_cell(CODE, cell_id="Hbol")
+    assert list(cache_dir.glob("*/*"))
+
+    # A new process: nothing in memory, and a different tmpdir
+    compile_cache._compile_cache = CompileCache(str(cache_dir))
+    with (
+        patch.object(compiler, "ScopedVisitor") as visitor,
+        patch.object(compiler, "get_filename", return_value="other.py"),
+    ):
+        cached = compiler.compile_cell(CODE, cell_id="Hbol")
+    visitor.assert_not_called()
+
+    assert cached.defs == cell.defs == {"os", "f", "x"}
+    assert cached.refs == cell.refs
+    assert cached.temporaries == cell.temporaries
+    assert cached.variable_data == cell.variable_data
+    assert cached.import_workspace == cell.import_workspace
+    assert cached.language == cell.language
+
+    # Code objects point to this process's file, including nested ones
+    assert cached.body is not None
+    assert cached.body.co_filename == "other.py"
+    f_code = next(
+        const
+        for const in cached.body.co_consts
+        if hasattr(const, "co_filename")
+    )
+    assert f_code.co_filename == "other.py"
+
+    glbls: dict[str, object] = {}
+    exec(cached.body, glbls)
+    assert eval(cached.last_expr, glbls) == glbls["x"]
+
+
+def test_changed_cells_are_recompiled(cache_dir: Path) -> None:
+    del cache_dir
+    compiler.compile_cell("x = 1", cell_id="Hbol")
+    cell = compiler.compile_cell("y = 1", cell_id="Hbol")
+    assert cell.defs == {"y"}
+
+
+def test_corrupt_entries_are_misses(cache_dir: Path) -> None:
+    compiler.compile_cell("x = 1", cell_id="Hbol")
+    for path in cache_dir.glob("*/*"):
+        path.write_bytes(b"not a pickle")
+
+    compile_cache._compile_cache = CompileCache(str(cache_dir))
+    cell = compiler.compile_cell("x = 1", cell_id="Hbol")
+    assert cell.defs == {"x"}
+
+
+def test_dont_write_bytecode(cache_dir: Path) -> None:
+    with patch.object(sys, "dont_write_bytecode", True):
+        compiler.compile_cell("x = 1", cell_id="Hbol")
+    assert not list(cache_dir.glob("*/*"))
+
+
+def test_test_rewrite_is_not_cached(cache_dir: Path) -> None:
+    compiler.compile_cell("assert True", cell_id="Hbol", test_rewrite=True)
+    assert not list(cache_dir.glob("*/*"))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import gc
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
+from marimo._data import get_datasets
 from marimo._data.get_datasets import (
     get_datasets_from_duckdb,
     get_datasets_from_variables,
@@ -244,3 +247,47 @@ def test_get_datasets_from_variables(df: Any) -> None:
             ],
         )
     ]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_get_datasets_from_variables_caches_columns() -> None:
+    import pandas as pd
+
+    from marimo._plugins.ui._impl.tables.narwhals_table import (
+        NarwhalsTableManager,
+    )
+
+    df = pd.DataFrame({"A": [1, 2, 3], "B": ["a", "a", "a"]})
+    with patch.object(
+        NarwhalsTableManager,
+        "get_sample_values",
+        side_effect=NarwhalsTableManager.get_sample_values,
+        autospec=True,
+    ) as get_sample_values:
+        first = get_datasets_from_variables([("df", df)])
+        second = get_datasets_from_variables([("other_df", df)])
+        assert get_sample_values.call_count == 2
+        assert second[0].name == "other_df"
+        assert second[0].columns == first[0].columns
+
+        # Mutating the dataframe invalidates the cache
+        df["C"] = [1.0, 2.0, 3.0]
+        third = get_datasets_from_variables([("df", df)])
+        assert get_sample_values.call_count == 5
+        assert [c.name for c in third[0].columns] == ["A", "B", "C"]
+
+        # So does changing the type of a column in place
+        df["A"] = df["A"].astype(str)
+        fourth = get_datasets_from_variables([("df", df)])
+        assert get_sample_values.call_count == 8
+        assert fourth[0].columns[0].type != "integer"
+
+    # Entries are dropped when the dataframe is collected
+    get_sample_values.reset_mock()
+    key = id(df)
+    assert key in get_datasets._COLUMNS_CACHE
+    del df
+    gc.collect()
+    assert key not in get_datasets._COLUMNS_CACHE
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import json
 import sys
 
 import pytest
 
 from marimo._data.preview_column import (
+    CHART_MAX_ROWS,
+    _sample_rows,
     get_column_preview_dataframe,
     get_column_preview_for_sql,
 )
 from marimo._dependencies.dependencies import DependencyManager
+from marimo._messaging.ops import DataColumnPreview
 from marimo._plugins.ui._impl.charts.altair_transformer import (
     register_transformers,
 )
@@ -328,3 +332,94 @@ def test_get_column_preview_for_duckdb_bool() -> None:
     # Not implemented yet
     assert result_bool.chart_code is None
     assert result_bool.chart_spec is None
+
+
+@pytest.mark.skipif(
+    not HAS_DF_DEPS, reason="optional dependencies not installed"
+)
+def test_get_column_preview_dataframe_cached() -> None:
+    import pandas as pd
+
+    register_transformers()
+
+    df = pd.DataFrame({"A": [1, 2, 3]})
+    request = PreviewDatasetColumnRequest(
+        source="source",
+        table_name="cached_table",
+        column_name="A",
+        source_type="local",
+    )
+    result = get_column_preview_dataframe(df, request)
+    assert result is not None
+    assert get_column_preview_dataframe(df, request) is result
+
+    # A different dataframe under the same name isn't served from the cache
+    other = pd.DataFrame({"A": [1, 2, 3]})
+    assert get_column_preview_dataframe(other, request) is not result
+
+    # Neither is a mutated dataframe
+    other_result = get_column_preview_dataframe(other, request)
+    other.loc[3] = [4]
+    updated = get_column_preview_dataframe(other, request)
+    assert updated is not other_result
+    assert updated is not None
+    assert updated.summary is not None
+    assert updated.summary.total == 4
+
+    # Or one with a column whose type changed in place
+    other["A"] = other["A"].astype(float)
+    retyped = get_column_preview_dataframe(other, request)
+    assert retyped is not updated
+
+
+@pytest.mark.skipif(
+    not HAS_DF_DEPS, reason="optional dependencies not installed"
+)
+def test_get_column_preview_dataframe_large_column_is_sampled() -> None:
+    import pandas as pd
+
+    register_transformers()
+
+    num_rows = CHART_MAX_ROWS * 3
+    df = pd.DataFrame({"A": range(num_rows)})
+    partial_previews: list[DataColumnPreview] = []
+    result = get_column_preview_dataframe(
+        df,
+        request=PreviewDatasetColumnRequest(
+            source="source",
+            table_name="large_table",
+            column_name="A",
+            source_type="local",
+        ),
+        on_partial_preview=partial_previews.append,
+    )
+
+    # The summary is sent before the chart, and covers all rows
+    assert len(partial_previews) == 1
+    assert partial_previews[0].chart_spec is None
+    assert partial_previews[0].summary is not None
+    assert partial_previews[0].summary.total == num_rows
+
+    assert result is not None
+    assert result.error is None
+    assert result.chart_spec is not None
+    assert not result.chart_max_rows_errors
+    # The chart's counts are from a sample, which the chart says
+    assert json.loads(result.chart_spec)["title"] == "Sample of 1 in 3 rows"
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_sample_rows_reports_whether_it_sampled() -> None:
+    import narwhals.stable.v1 as nw
+    import pandas as pd
+
+    df = nw.from_native(pd.DataFrame({"A": range(6)}))
+    sampled, was_sampled = _sample_rows(df, 3)
+    assert was_sampled
+    assert sampled["A"].to_list() == [0, 3]
+
+    # Other data is left as is, e.g. the output of other backends
+    data = {"A": list(range(6))}
+    assert _sample_rows(data, 3) == (data, False)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
 from marimo._dependencies.dependencies import (
@@ -167,3 +169,36 @@ def test_version_check():
         str(excinfo.value)
         == "Mismatched version of test: expected <3.0.0, got 3.0.0"
     )
+
+
+def test_has_is_cached(tmp_path, monkeypatch) -> None:
+    import importlib.util
+
+    from marimo._dependencies import dependencies
+
+    dep = Dependency("marimo_test_cached_dependency")
+    assert not dep.has()
+
+    calls: list[str] = []
+    find_spec = importlib.util.find_spec
+
+    def counting_find_spec(name: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(name)
+        return find_spec(name, *args, **kwargs)
+
+    monkeypatch.setattr(importlib.util, "find_spec", counting_find_spec)
+    monkeypatch.setattr(dependencies, "_RECHECK_INTERVAL", float("inf"))
+    assert not dep.has()
+    assert calls == []
+
+    # Installing the package is picked up once caches are invalidated
+    (tmp_path / "marimo_test_cached_dependency.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert dep.has()
+    assert calls == ["marimo_test_cached_dependency"]
+    assert dep.has()
+    assert calls == ["marimo_test_cached_dependency"]
+
+    (tmp_path / "marimo_test_cached_dependency.py").unlink()
+    DependencyManager.invalidate_caches()
+    assert not dep.has()
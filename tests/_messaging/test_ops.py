@@ -1,6 +1,8 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+from unittest.mock import PropertyMock, patch
+
 from marimo._messaging.ops import VariableValue
 from marimo._output.hypertext import Html
 from marimo._plugins.ui._impl.input import slider
@@ -27,3 +29,30 @@ def test_variable_value_broken_str() -> None:
     variable_value = VariableValue(name="o", value=Broken())
     assert variable_value.datatype == "Broken"
     assert variable_value.value == "<UNKNOWN>"
+
+
+def test_variable_value_broken_ui_element_value() -> None:
+    s = slider(1, 10, value=5)
+    with patch.object(
+        type(s), "value", new_callable=PropertyMock, side_effect=ValueError
+    ):
+        variable_value = VariableValue(name="s", value=s)
+    # Previewed values are never None
+    assert variable_value.value == "<UNKNOWN>"
+
+
+def test_variable_value_without_preview() -> None:
+    variable_value = VariableValue(name="x", value=[1, 2, 3], preview=False)
+    assert variable_value.datatype == "list"
+    assert variable_value.value is None
+
+
+def test_variable_value_large_container_is_bounded() -> None:
+    variable_value = VariableValue(name="x", value=list(range(10**6)))
+    assert variable_value.datatype == "list"
+    assert variable_value.value is not None
+    assert variable_value.value.startswith("[0, 1, 2")
+    assert len(variable_value.value) <= 50
+
+    nested = VariableValue(name="y", value={"a": [[1, 2], [3, 4]]})
+    assert nested.value == "{'a': [[...], [...]]}"
@@ -10,6 +10,7 @@ import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.mimetypes import KnownMimeType
+from marimo._output.formatters import formatters
 from marimo._output.formatters.formatters import register_formatters
 from marimo._output.formatting import (
     Plain,
@@ -144,6 +145,45 @@ def test_pre_imported_formatter(mock_third_party_factories):
     assert mock_factory.register.call_count == 1
 
 
+def test_formatters_registered_on_import(tmp_path, monkeypatch) -> None:
+    (tmp_path / "marimo_test_formatted_pkg.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    factory = Mock()
+    monkeypatch.setitem(
+        formatters.THIRD_PARTY_FACTORIES, "marimo_test_formatted_pkg", factory
+    )
+
+    register_formatters()
+    register_formatters()
+    # Finding a module doesn't register its formatters
+    assert importlib.util.find_spec("marimo_test_formatted_pkg") is not None
+    assert factory.register.call_count == 0
+
+    try:
+        importlib.import_module("marimo_test_formatted_pkg")
+        # Registered once, even though the hooks were installed twice
+        assert factory.register.call_count == 1
+    finally:
+        sys.modules.pop("marimo_test_formatted_pkg", None)
+
+
+def test_third_party_formatter_modules_are_lazy() -> None:
+    import subprocess
+
+    # Formatter modules are only imported when their package is
+    code = (
+        "import sys\n"
+        "from marimo._output.formatters import formatters\n"
+        "formatters.register_formatters()\n"
+        "print([m for m in sys.modules if m.endswith('_formatters')])"
+    )
+    p = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert p.returncode == 0, p.stderr
+    assert p.stdout.strip() == "['marimo._output.formatters.repr_formatters']"
+
+
 def test_repr_markdown():
     class ReprMarkdown:
         def _repr_markdown_(self):
@@ -441,3 +481,72 @@ def test_display_protocol_takes_precedence() -> None:
     mime, content = formatter(obj)
     assert mime == "text/html"
     assert content == "<span>foo</span>"
+
+
+def test_formatter_resolves_nearest_base_class() -> None:
+    class Base: ...
+
+    class Child(Base): ...
+
+    class GrandChild(Child): ...
+
+    def _format_base(obj: Base) -> tuple[KnownMimeType, str]:
+        del obj
+        return ("text/plain", "base")
+
+    def _format_child(obj: Child) -> tuple[KnownMimeType, str]:
+        del obj
+        return ("text/plain", "child")
+
+    formatter(Base)(_format_base)
+    assert get_formatter(GrandChild()) is _format_base
+
+    # Registering a formatter invalidates the per-type cache
+    formatter(Child)(_format_child)
+    assert get_formatter(GrandChild()) is _format_child
+    assert get_formatter(Base()) is _format_base
+
+
+def test_formatter_resolves_virtual_subclass() -> None:
+    import abc
+
+    class Interface(abc.ABC):
+        @abc.abstractmethod
+        def name(self) -> str: ...
+
+    class Impl: ...
+
+    Interface.register(Impl)
+
+    def _format(obj: Interface) -> tuple[KnownMimeType, str]:
+        del obj
+        return ("text/plain", "interface")
+
+    formatter(Interface)(_format)
+    assert get_formatter(Impl()) is _format
+
+
+def test_instance_protocol_methods_are_respected() -> None:
+    class Foo:
+        pass
+
+    obj = Foo()
+    assert get_formatter(Foo()) is None
+    # Protocol methods can be set on instances, after the type was cached
+    obj._mime_ = lambda: ("text/plain", "foo")  # type: ignore
+    formatter = get_formatter(obj)
+    assert formatter is not None
+    assert formatter(obj) == ("text/plain", "foo")
+
+
+def test_format_large_structures() -> None:
+    register_formatters()
+
+    obj = {
+        "list": list(range(10_000)),
+        "dict": {str(i): float(i) for i in range(10_000)},
+    }
+    formatter = get_formatter(obj)
+    assert formatter is not None
+    mime, _ = formatter(obj)
+    assert mime == "application/json"
@@ -0,0 +1,272 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+import narwhals.stable.v1 as nw
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.charts.altair_aggregate import (
+    COUNT_COLUMN,
+    DEFERRED_DATA_NAME,
+    _bin,
+    preaggregate,
+)
+from tests._data.mocks import create_dataframes
+
+HAS_DEPS = DependencyManager.polars.has() and DependencyManager.pandas.has()
+
+
+def _to_dicts(data: Any) -> list[dict[str, Any]]:
+    return nw.from_native(data, eager_only=True).rows(named=True)
+
+
+def test_bin_matches_vega() -> None:
+    # Values computed with vega-statistics' `bin`
+    params = _bin(
+        extent=(0, 99),
+        maxbins=10,
+        step=None,
+        steps=None,
+        minstep=0,
+        divide=[5, 2],
+        base=10,
+        nice=True,
+    )
+    assert (params.start, params.stop, params.step) == (0, 100, 10)
+
+    params = _bin(
+        extent=(-2.3, 3.7),
+        maxbins=20,
+        step=None,
+        steps=None,
+        minstep=0,
+        divide=[5, 2],
+        base=10,
+        nice=True,
+    )
+    assert (params.start, params.stop, params.step) == (-2.5, 4, 0.5)
+
+    params = _bin(
+        extent=(5, 5),
+        maxbins=10,
+        step=None,
+        steps=None,
+        minstep=0,
+        divide=[5, 2],
+        base=10,
+        nice=True,
+    )
+    assert params.stop > params.start
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"values": list(range(100))}, exclude=["ibis", "duckdb"]
+    ),
+)
+def test_preaggregate_histogram(df: Any) -> None:
+    spec = {
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "values", "type": "quantitative", "bin": True},
+            "y": {"aggregate": "count", "type": "quantitative"},
+        },
+    }
+    result = preaggregate(spec, df)
+    assert result is not None
+    assert result.spec["data"] == {"name": DEFERRED_DATA_NAME}
+    encoding = result.spec["encoding"]
+    assert encoding["x"]["field"] == "bin_maxbins_10_values"
+    assert encoding["x"]["bin"] == {"binned": True, "step": 10}
+    assert encoding["x2"] == {"field": "bin_maxbins_10_values_end"}
+    assert encoding["y"]["field"] == COUNT_COLUMN
+    assert encoding["y"]["aggregate"] == "sum"
+    assert encoding["y"]["title"] == "Count of Records"
+
+    rows = _to_dicts(result.data)
+    assert len(rows) == 10
+    assert rows[0] == {
+        "bin_maxbins_10_values": 0,
+        COUNT_COLUMN: 10,
+        "bin_maxbins_10_values_end": 10,
+    }
+    # The max value falls into the last bin
+    assert rows[-1]["bin_maxbins_10_values"] == 90
+    assert sum(row[COUNT_COLUMN] for row in rows) == 100
+    # The original spec is not modified
+    assert "x2" not in spec["encoding"]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            "category": ["a", "b", "a", "b", "c"],
+            "value": [1, 2, 3, 4, 5],
+        },
+        exclude=["ibis", "duckdb"],
+    ),
+)
+def test_preaggregate_groups_and_filters(df: Any) -> None:
+    spec = {
+        "mark": "bar",
+        "transform": [{"filter": {"field": "value", "lt": 5}}],
+        "encoding": {
+            "x": {"field": "category", "type": "nominal"},
+            "y": {
+                "field": "value",
+                "aggregate": "mean",
+                "type": "quantitative",
+            },
+            "tooltip": [
+                {"field": "category", "type": "nominal"},
+                {"aggregate": "count", "type": "quantitative"},
+            ],
+        },
+    }
+    result = preaggregate(spec, df)
+    assert result is not None
+    assert "transform" not in result.spec
+    assert result.spec["encoding"]["y"]["title"] == "Mean of value"
+    assert _to_dicts(result.data) == [
+        {"category": "a", "mean_value": 2.0, COUNT_COLUMN: 2},
+        {"category": "b", "mean_value": 3.0, COUNT_COLUMN: 2},
+    ]
+    assert result.derived_fields == {"mean_value", COUNT_COLUMN}
+
+    # Reduced rows map back to the original rows
+    filtered = result.apply_row_transforms(df).filter(
+        result.groups_predicate([1])
+    )
+    assert filtered["value"].to_list() == [2, 4]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            "date": [
+                datetime.datetime(2024, 1, 1),
+                datetime.datetime(2024, 1, 15),
+                datetime.datetime(2024, 2, 3),
+            ],
+            "value": [1, 2, 3],
+        },
+        exclude=["ibis", "duckdb", "pyarrow"],
+    ),
+)
+def test_preaggregate_time_unit(df: Any) -> None:
+    spec = {
+        "mark": "line",
+        "encoding": {
+            "x": {
+                "field": "date",
+                "type": "temporal",
+                "timeUnit": "yearmonth",
+            },
+            "y": {
+                "field": "value",
+                "aggregate": "sum",
+                "type": "quantitative",
+            },
+        },
+    }
+    result = preaggregate(spec, df)
+    assert result is not None
+    assert result.spec["encoding"]["x"]["timeUnit"] == "yearmonth"
+    rows = _to_dicts(result.data)
+    assert [row["sum_value"] for row in rows] == [3, 3]
+    assert [row["date"].replace(tzinfo=None) for row in rows] == [
+        datetime.datetime(2024, 1, 1),
+        datetime.datetime(2024, 2, 1),
+    ]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"x": [1, 2, 3], "y": [4, 5, 6]}, exclude=["ibis", "duckdb"]
+    ),
+)
+def test_preaggregate_aggregate_transform(df: Any) -> None:
+    spec = {
+        "mark": "bar",
+        "transform": [
+            {
+                "aggregate": [{"op": "sum", "field": "y", "as": "total"}],
+                "groupby": ["x"],
+            }
+        ],
+        "encoding": {
+            "x": {"field": "x", "type": "ordinal"},
+            "y": {"field": "total", "type": "quantitative"},
+        },
+    }
+    result = preaggregate(spec, df)
+    assert result is not None
+    assert sorted(_to_dicts(result.data), key=lambda r: r["x"]) == [
+        {"x": 1, "total": 4},
+        {"x": 2, "total": 5},
+        {"x": 3, "total": 6},
+    ]
+    assert result.spec["encoding"] == spec["encoding"]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "spec",
+    [
+        # Does not reduce the data
+        {
+            "mark": "point",
+            "encoding": {"x": {"field": "x", "type": "quantitative"}},
+        },
+        # Expression filters
+        {
+            "mark": "bar",
+            "transform": [{"filter": "datum.x > 1"}],
+            "encoding": {"y": {"aggregate": "count"}},
+        },
+        # Unsupported transforms
+        {
+            "mark": "bar",
+            "transform": [{"calculate": "datum.x * 2", "as": "x2"}],
+            "encoding": {"y": {"aggregate": "count"}},
+        },
+        # Binned color channels
+        {
+            "mark": "bar",
+            "encoding": {
+                "color": {"field": "x", "bin": True},
+                "y": {"aggregate": "count"},
+            },
+        },
+        # Unsupported aggregate ops
+        {
+            "mark": "bar",
+            "encoding": {
+                "x": {"field": "x", "aggregate": {"argmax": "y"}},
+            },
+        },
+        # Layered charts
+        {"layer": [{"mark": "bar"}]},
+    ],
+)
+def test_preaggregate_unsupported(spec: dict[str, Any]) -> None:
+    import polars as pl
+
+    df = pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+    assert preaggregate(spec, df) is None
+
+
+def test_preaggregate_not_a_dataframe() -> None:
+    spec = {"mark": "bar", "encoding": {"y": {"aggregate": "count"}}}
+    assert preaggregate(spec, [{"x": 1}]) is None
@@ -13,6 +13,7 @@ from marimo._plugins.ui._impl.charts.altair_transformer import (
     _data_to_csv_string,
     _data_to_json_string,
     _to_marimo_csv,
+    _to_marimo_deferred,
     _to_marimo_inline_csv,
     _to_marimo_json,
     register_transformers,
@@ -223,7 +224,7 @@ def test_data_to_csv_string_with_different_dtypes(df: IntoDataFrame):
 def test_register_transformers(mock_data_transformers: MagicMock):
     register_transformers()
 
-    assert mock_data_transformers.register.call_count == 4
+    assert mock_data_transformers.register.call_count == 5
     mock_data_transformers.register.assert_any_call("marimo", _to_marimo_csv)
     mock_data_transformers.register.assert_any_call(
         "marimo_inline_csv", _to_marimo_inline_csv
@@ -234,3 +235,6 @@ def test_register_transformers(mock_data_transformers: MagicMock):
     mock_data_transformers.register.assert_any_call(
         "marimo_csv", _to_marimo_csv
     )
+    mock_data_transformers.register.assert_any_call(
+        "marimo_deferred", _to_marimo_deferred
+    )
@@ -369,6 +369,48 @@ def test_ibis_with_polars_backend() -> None:
     ibis.set_backend(prev_backend)
 
 
+@pytest.mark.skipif(
+    not HAS_POLARS, reason="optional dependencies not installed"
+)
+def test_polars_lazy_frame() -> None:
+    import polars as pl
+
+    data = pl.LazyFrame({"a": list(range(20)), "b": ["x", "y"] * 10})
+    dataframe = ui.dataframe(data)
+    assert dataframe._get_dataframe(EmptyArgs()).total_rows == 20
+
+    value = dataframe._convert_value(
+        {
+            "transforms": [
+                {
+                    "type": "filter_rows",
+                    "operation": "keep_rows",
+                    "where": [
+                        {"column_id": "b", "operator": "==", "value": "x"}
+                    ],
+                },
+                {"type": "sample_rows", "n": 5, "seed": 1, "replace": False},
+                {
+                    "type": "sort_column",
+                    "column_id": "a",
+                    "ascending": True,
+                    "na_position": "last",
+                },
+            ]
+        }
+    )
+    # The result of a lazy frame stays lazy
+    assert isinstance(value, pl.LazyFrame)
+    result = value.collect()
+    assert len(result) == 5
+    assert result["b"].to_list() == ["x"] * 5
+    assert result["a"].is_sorted()
+
+    dataframe._value = value
+    response = dataframe._search(SearchTableArgs(page_size=2, page_number=0))
+    assert response.total_rows == 5
+
+
 @pytest.mark.skipif(
     not DependencyManager.pandas.has(), reason="Pandas not installed"
 )
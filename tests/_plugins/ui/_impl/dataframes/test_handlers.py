@@ -952,12 +952,8 @@ class TestTransformHandler:
             where=[Condition(column_id="A", operator=">=", value=2)],
         )
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
+        # Nothing is cached yet
+        assert container._common_prefix_length(transformations) == 0
 
         # Apply the transformations
         result = container.apply(transformations)
@@ -975,11 +971,8 @@ class TestTransformHandler:
         transformations = Transformations(
             [sort_transform, filter_transform, filter_again_transform]
         )
-        # Verify the next transformation
-        assert container._is_superset(transformations) is True
-        assert container._get_next_transformations(
-            transformations
-        ) == Transformations([filter_again_transform])
+        # Only the new transformation is applied
+        assert container._common_prefix_length(transformations) == 2
         result = container.apply(
             transformations,
         )
@@ -987,15 +980,166 @@ class TestTransformHandler:
         assert_frame_equal(result, expected2)
 
         transformations = Transformations([sort_transform, filter_transform])
-        # Verify the next transformation
-        assert container._is_superset(transformations) is False
-        assert (
-            container._get_next_transformations(transformations)
-            == transformations
-        )
+        # The result of the prefix is cached
+        assert container._common_prefix_length(transformations) == 2
         # Reapply by removing the last transform
         result = container.apply(
             transformations,
         )
         # Check that the transformations were applied correctly
         assert_frame_equal(result, expected)
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+class TestTransformsContainerCache:
+    sort_transform = SortColumnTransform(
+        type=TransformType.SORT_COLUMN,
+        column_id="B",
+        ascending=True,
+        na_position="last",
+    )
+    filter_transform = FilterRowsTransform(
+        type=TransformType.FILTER_ROWS,
+        operation="keep_rows",
+        where=[Condition(column_id="A", operator=">=", value=2)],
+    )
+    select_transform = SelectColumnsTransform(
+        type=TransformType.SELECT_COLUMNS, column_ids=["A"]
+    )
+
+    @staticmethod
+    def _spy(df: DataFrameType) -> tuple[TransformsContainer[Any], Mock]:
+        handler = get_handler_for_dataframe(df)
+        spy = Mock(wraps=handler.handle_filter_rows)
+        handler.handle_filter_rows = spy  # type: ignore
+        return TransformsContainer(df, handler), spy
+
+    def test_resumes_from_edited_step(self) -> None:
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 6, 5]})
+        container, spy = self._spy(df)
+
+        container.apply(
+            Transformations([self.filter_transform, self.sort_transform])
+        )
+        assert spy.call_count == 1
+
+        # Editing the second step resumes from the first one
+        edited_sort = SortColumnTransform(
+            type=TransformType.SORT_COLUMN,
+            column_id="B",
+            ascending=False,
+            na_position="last",
+        )
+        result = container.apply(
+            Transformations([self.filter_transform, edited_sort])
+        )
+        assert spy.call_count == 1
+        assert_frame_equal(result, pd.DataFrame({"A": [2, 3], "B": [6, 5]}))
+
+        # Removing the last step returns the cached prefix
+        result = container.apply(Transformations([self.filter_transform]))
+        assert spy.call_count == 1
+        assert_frame_equal(result, pd.DataFrame({"A": [2, 3], "B": [6, 5]}))
+
+        # Removing everything returns the original dataframe
+        assert container.apply(Transformations([])) is df
+
+    def test_evicts_over_budget(self) -> None:
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 6, 5]})
+        container, spy = self._spy(df)
+        container._max_cache_bytes = 0
+
+        container.apply(
+            Transformations([self.filter_transform, self.sort_transform])
+        )
+        # The latest result is always kept
+        assert container._snapshots[0] is None
+        assert container._snapshots[1] is not None
+
+        edited_sort = SortColumnTransform(
+            type=TransformType.SORT_COLUMN,
+            column_id="B",
+            ascending=False,
+            na_position="last",
+        )
+        container.apply(Transformations([self.filter_transform, edited_sort]))
+        # The evicted prefix is recomputed from the original dataframe
+        assert spy.call_count == 2
+
+    def test_polars_fuses_lazy_transforms(self) -> None:
+        df = pl.DataFrame({"A": [1, 2, 3], "B": [4, 6, 5]})
+        handler = get_handler_for_dataframe(df)
+        container = TransformsContainer(df, handler)
+
+        shuffle_transform = ShuffleRowsTransform(
+            type=TransformType.SHUFFLE_ROWS, seed=42
+        )
+        result = container.apply(
+            Transformations(
+                [
+                    self.filter_transform,
+                    self.sort_transform,
+                    shuffle_transform,
+                    self.select_transform,
+                ]
+            )
+        )
+        assert isinstance(result, pl.DataFrame)
+        assert sorted(result["A"].to_list()) == [2, 3]
+        # Only the results before the eager shuffle and at the end
+        # are materialized
+        assert container._snapshots[0] is None
+        assert isinstance(container._snapshots[1], pl.DataFrame)
+        assert isinstance(container._snapshots[2], pl.DataFrame)
+        assert isinstance(container._snapshots[3], pl.DataFrame)
+        assert_frame_equal(
+            container._snapshots[1],
+            pl.DataFrame({"A": [3, 2], "B": [5, 6]}),
+        )
+
+    def test_polars_resumes_from_edited_fused_step(self) -> None:
+        df = pl.DataFrame({"A": [1, 2, 3], "B": [4, 6, 5]})
+        handler = get_handler_for_dataframe(df)
+        container = TransformsContainer(df, handler)
+
+        container.apply(
+            Transformations([self.sort_transform, self.select_transform])
+        )
+        assert container._snapshots[0] is None
+
+        # Editing the second step materializes the fused prefix
+        edited_select = SelectColumnsTransform(
+            type=TransformType.SELECT_COLUMNS, column_ids=["B"]
+        )
+        result = container.apply(
+            Transformations([self.sort_transform, edited_select])
+        )
+        assert_frame_equal(result, pl.DataFrame({"B": [4, 5, 6]}))
+        assert_frame_equal(
+            container._snapshots[0],
+            pl.DataFrame({"A": [1, 3, 2], "B": [4, 5, 6]}),
+        )
+
+        # Further edits of the second step resume from the first one
+        spy = Mock(wraps=handler.handle_sort_column)
+        handler.handle_sort_column = spy  # type: ignore
+        result = container.apply(
+            Transformations([self.sort_transform, self.select_transform])
+        )
+        assert spy.call_count == 0
+        assert_frame_equal(result, pl.DataFrame({"A": [1, 3, 2]}))
+
+    def test_pandas_estimates_string_contents(self) -> None:
+        df = pd.DataFrame({"A": ["x" * 1000] * 10})
+        handler = get_handler_for_dataframe(df)
+        assert handler.estimate_size(df) > 10 * 1000
+
+    def test_ibis_builds_single_expression(self) -> None:
+        df = ibis.memtable({"A": [1, 2, 3], "B": [4, 6, 5]})
+        container = TransformsContainer(df, get_handler_for_dataframe(df))
+        result = container.apply(
+            Transformations([self.filter_transform, self.sort_transform])
+        )
+        assert isinstance(result, ibis.Table)
+        assert container._snapshot_sizes == [0, 0]
+        assert_frame_equal(result, ibis.memtable({"A": [3, 2], "B": [5, 6]}))
@@ -279,6 +279,44 @@ class TestIbisTableManagerFactory(unittest.TestCase):
         manager = self.factory.create()(table)
         assert manager.get_field_type("A") == ("unknown", "unknown")
 
+    def test_search_compiles_to_ilike(self) -> None:
+        import ibis
+
+        df = ibis.memtable({"A": [1, 12, 3], "B": ["Foo", "bar", "baz"]})
+        manager = self.factory.create()(df)
+        result = manager.search("FO")
+        sql = ibis.to_sql(result.data)
+        assert "ILIKE '%fo%'" in sql
+        assert result.get_num_rows() == 1
+        assert manager.search("1").get_num_rows() == 2
+
+        # Derived views are cached
+        assert manager.search("fo") is result
+        assert manager.sort_values("A", True) is manager.sort_values("A", True)
+
+    def test_derived_views_are_bounded(self) -> None:
+        from marimo._plugins.ui._impl.tables.ibis_table import _MAX_VIEWS
+
+        first = self.manager.search("first")
+        for i in range(_MAX_VIEWS):
+            self.manager.search(f"query {i}")
+        assert len(self.manager._views) == _MAX_VIEWS
+        # The least recently used view was evicted
+        assert self.manager.search("first") is not first
+
+    def test_search_non_string_columns_literally(self) -> None:
+        import ibis
+
+        table = ibis.memtable({"A": [1.5, 105.0, 2.0]})
+        manager = self.factory.create()(table)
+        # "." is not a wildcard for numeric columns
+        assert manager.search("1.5").get_num_rows() == 1
+
+    def test_summary_is_cached(self) -> None:
+        summary = self.manager.get_summary("A")
+        assert self.manager.get_summary("A") is summary
+        assert summary.total == 3
+
     def test_search_with_regex(self) -> None:
         import ibis
 
@@ -842,3 +842,87 @@ def test_get_field_types_with_many_columns_is_performant(df: Any) -> None:
     assert (
         total_ms < 500
     ), f"Total time: {total_ms}ms for {df.shape[1]} columns with {type(df)}"
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_lazy_frame() -> None:
+    import narwhals.stable.v1 as nw
+    import polars as pl
+
+    data = {
+        "A": [3, 1, None, 2, 5],
+        "B": ["a", "b", "c", None, "e"],
+        "C": [True, False, True, None, True],
+        "D": [datetime.timedelta(seconds=i) for i in range(5)],
+    }
+    eager = NarwhalsTableManager(nw.from_native(pl.DataFrame(data)))
+    manager = NarwhalsTableManager(nw.from_native(pl.LazyFrame(data)))
+
+    assert manager.get_num_rows(force=False) is None
+    assert manager.get_num_rows(force=True) == 5
+
+    page = manager.take(2, 1)
+    assert isinstance(page.data, nw.LazyFrame)
+    assert page.data.collect()["A"].to_list() == [1, None]
+    assert manager.take(2, 4).get_num_rows() == 1
+
+    selected = manager.select_rows([0, 4])
+    assert isinstance(selected.data, nw.LazyFrame)
+    assert selected.data.collect()["B"].to_list() == ["a", "e"]
+
+    searched = manager.select_columns(["A", "B"]).search("b")
+    assert isinstance(searched.data, nw.LazyFrame)
+    assert searched.get_num_rows() == 1
+
+    sorted_manager = manager.sort_values("A", descending=False)
+    assert isinstance(sorted_manager.data, nw.LazyFrame)
+
+    # Summaries are computed with a single aggregation query and
+    # match the eager summaries
+    for column in data:
+        assert manager.get_summary(column) == eager.get_summary(column)
+
+    assert set(manager.get_unique_column_values("B")) == {
+        "a",
+        "b",
+        "c",
+        "e",
+        None,
+    }
+    assert manager.get_sample_values("A") == [3, 1, None]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.skipif(
+    not DependencyManager.pyarrow.has(), reason="pyarrow not installed"
+)
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"A": list(range(7)), "B": list("abcdefg")},
+        exclude=["ibis", "duckdb"],
+    ),
+)
+def test_export_to(df: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    import io
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from marimo._plugins.ui._impl.tables import narwhals_table
+
+    # Export in several chunks
+    monkeypatch.setattr(narwhals_table, "EXPORT_CHUNK_SIZE", 3)
+    manager = get_table_manager(df)
+
+    def export(file_format: Any) -> bytes:
+        file = io.BytesIO()
+        manager.export_to(file, file_format)
+        return file.getvalue()
+
+    assert export("csv") == manager.to_csv()
+    assert json.loads(export("json")) == json.loads(manager.to_json())
+    table = pq.read_table(io.BytesIO(export("parquet")))
+    assert table.column("A").to_pylist() == list(range(7))
+    table = pa.ipc.open_file(io.BytesIO(export("arrow"))).read_all()
+    assert table.column("B").to_pylist() == list("abcdefg")
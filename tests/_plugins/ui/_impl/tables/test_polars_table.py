@@ -789,3 +789,29 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
             "datetime[μs]",
         )
         assert manager.get_field_type("time_col") == ("time", "Time")
+
+    def test_lazy_frame(self) -> None:
+        import polars as pl
+
+        data = pl.LazyFrame({"A": list(range(10)), "B": ["a", "b"] * 5})
+        manager = self.factory.create()(data)
+
+        assert manager.is_type(data)
+        assert manager.get_field_types() == [
+            ("A", ("integer", "i64")),
+            ("B", ("string", "str")),
+        ]
+        assert manager.get_num_rows(force=True) == 10
+
+        page = manager.take(3, 8)
+        assert isinstance(page.data.to_native(), pl.LazyFrame)
+        assert page.collect()["A"].to_list() == [8, 9]
+
+        searched = manager.search("b")
+        assert isinstance(searched.data.to_native(), pl.LazyFrame)
+        assert searched.get_num_rows() == 5
+
+        summary = manager.get_summary("A")
+        assert summary.min == 0
+        assert summary.max == 9
+        assert summary.unique == 10
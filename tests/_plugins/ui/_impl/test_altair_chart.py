@@ -801,6 +801,138 @@ def test_apply_selection(df: IntoDataFrame):
     assert all(filtered_data["category"] == "A")
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {
+            "x": [1, 2, 3, 4, 5],
+            "category": ["A", "A", "B", "B", "C"],
+        },
+        exclude=["ibis", "duckdb"],
+    ),
+)
+def test_preaggregate(df: IntoDataFrame):
+    import altair as alt
+
+    chart = alt.Chart(df).mark_bar().encode(x="category", y="sum(x)")
+
+    marimo_chart = altair_chart(chart, preaggregate=True)
+    assert marimo_chart._preaggregation is not None
+    assert get_len(marimo_chart._preaggregation.data) == 3
+    assert marimo_chart._spec["encoding"]["y"]["field"] == "sum_x"
+    assert "url" in marimo_chart._spec["data"]
+
+    # Selections filter the original rows
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "category": ["A"]}}
+    )
+    assert nw.from_native(value)["x"].to_list() == [1, 2]
+
+    # Points selected by index map to their group
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "_vgsid_": [2]}}
+    )
+    assert nw.from_native(value)["x"].to_list() == [3, 4]
+    assert nw.from_native(value).columns == ["x", "category"]
+
+    # Aggregated fields are ignored
+    value = marimo_chart._convert_value(
+        {"select_interval": {"sum_x": [0, 1], "category": ["C"]}}
+    )
+    assert nw.from_native(value)["x"].to_list() == [5]
+
+    # Not opted-in
+    assert altair_chart(chart)._preaggregation is None
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes({"v": list(range(100))}, exclude=["ibis", "duckdb"]),
+)
+def test_preaggregate_binned_selection(df: IntoDataFrame):
+    import altair as alt
+
+    chart = (
+        alt.Chart(df).mark_bar().encode(x=alt.X("v", bin=True), y="count()")
+    )
+    marimo_chart = altair_chart(chart, preaggregate=True)
+    assert marimo_chart._preaggregation is not None
+
+    # Intervals over bins select the original rows in the interval,
+    # like without pre-aggregation
+    expected = altair_chart(chart)._convert_value(
+        {"select_interval": {"v": [0, 20]}}
+    )
+    for field in ("bin_maxbins_10_v", "bin_maxbins_10_v_end"):
+        value = marimo_chart._convert_value(
+            {"select_interval": {field: [0, 20]}}
+        )
+        assert get_len(value) == get_len(expected) == 21
+
+    # Points on bins select the rows of the bins
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "bin_maxbins_10_v": [10, 30]}}
+    )
+    assert sorted(nw.from_native(value)["v"].to_list()) == [
+        *range(10, 20),
+        *range(30, 40),
+    ]
+    assert nw.from_native(value).columns == ["v"]
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "bin_maxbins_10_v": [[90, 100]]}}
+    )
+    assert sorted(nw.from_native(value)["v"].to_list()) == list(range(90, 100))
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_preaggregate_time_unit_selection():
+    import altair as alt
+    import polars as pl
+
+    df = pl.DataFrame(
+        {
+            "date": [
+                datetime.datetime(2024, 1, 1),
+                datetime.datetime(2024, 1, 15),
+                datetime.datetime(2024, 2, 3),
+            ],
+            "value": [1, 2, 3],
+        }
+    )
+    chart = (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(x=alt.X("date", timeUnit="yearmonth"), y="sum(value)")
+    )
+    marimo_chart = altair_chart(chart, preaggregate=True)
+    assert marimo_chart._preaggregation is not None
+
+    january = datetime.datetime(2024, 1, 1).timestamp() * 1000
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "yearmonth_date": [january]}}
+    )
+    assert value["value"].to_list() == [1, 2]
+    value = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "date": ["2024-02-01T00:00:00"]}}
+    )
+    assert value["value"].to_list() == [3]
+    assert value.columns == ["date", "value"]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_preaggregate_unsupported_chart():
+    import altair as alt
+    import polars as pl
+
+    df = pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+    chart = alt.Chart(df).mark_point().encode(x="x", y="y")
+    marimo_chart = altair_chart(chart, preaggregate=True)
+    assert marimo_chart._preaggregation is None
+    assert marimo_chart._spec == altair_chart(chart)._spec
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_chart_with_url_data():
     import altair as alt
@@ -907,6 +907,93 @@ def test_column_clamping_with_polars():
     assert len(table._component_args["field-types"]) == 60
 
 
+@pytest.mark.skipif(
+    not DependencyManager.polars.has() or not DependencyManager.pyarrow.has(),
+    reason="Polars or PyArrow not installed",
+)
+def test_download_as():
+    import io
+
+    import polars as pl
+
+    from marimo._plugins.ui._impl.table import DownloadAsArgs
+
+    data = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    table = ui.table(data)
+
+    csv = from_data_uri(table._download_as(DownloadAsArgs(format="csv")))[1]
+    assert csv == b"a,b\n1,x\n2,y\n3,z\n"
+
+    arrow = from_data_uri(table._download_as(DownloadAsArgs(format="arrow")))
+    assert pl.read_ipc(io.BytesIO(arrow[1])).equals(data)
+    parquet = from_data_uri(
+        table._download_as(DownloadAsArgs(format="parquet"))
+    )
+    assert pl.read_parquet(io.BytesIO(parquet[1])).equals(data)
+
+    # Selected rows are downloaded
+    table._convert_value(["1"])
+    json = from_data_uri(table._download_as(DownloadAsArgs(format="json")))
+    assert json[1] == b'[{"a":2,"b":"y"}]'
+
+    with pytest.raises(ValueError):
+        table._download_as(DownloadAsArgs(format="xlsx"))  # type: ignore
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="Polars not installed"
+)
+def test_table_with_polars_lazy_frame():
+    import polars as pl
+
+    data = pl.LazyFrame(
+        {"a": list(range(30)), "b": [str(i) for i in range(30)]}
+    )
+    table = ui.table(data, page_size=10)
+
+    assert table._component_args["total-rows"] == 30
+    csv = from_data_uri(table._component_args["data"])[1].decode("utf-8")
+    assert csv.splitlines()[1:] == [f"{i},{i}" for i in range(10)]
+
+    # Search, sort and paginate lazily
+    response = table._search(
+        SearchTableArgs(
+            page_size=5,
+            page_number=1,
+            query="1",
+            sort=SortArgs(by="a", descending=True),
+        )
+    )
+    assert response.total_rows == 12
+    csv = from_data_uri(response.data)[1].decode("utf-8")
+    assert [line.split(",")[0] for line in csv.splitlines()[1:]] == [
+        "15",
+        "14",
+        "13",
+        "12",
+        "11",
+    ]
+
+    # Filters are applied to the lazy frame
+    response = table._search(
+        SearchTableArgs(
+            page_size=10,
+            page_number=0,
+            filters=[Condition(column_id="a", operator=">=", value=25)],
+        )
+    )
+    assert response.total_rows == 5
+
+    # Selection stays lazy
+    value = table._convert_value(["0", "2"])
+    assert isinstance(value, pl.LazyFrame)
+    assert value.collect()["a"].to_list() == [25, 27]
+
+    summaries = table._get_column_summaries(EmptyArgs())
+    assert summaries.summaries[0].min == 25
+    assert summaries.summaries[0].max == 29
+
+
 @pytest.mark.skipif(
     not DependencyManager.pandas.has(), reason="Pandas not installed"
 )
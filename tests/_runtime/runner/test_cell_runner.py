@@ -1,6 +1,9 @@
 # Copyright 2024 Marimo. All rights reserved.
+import tracemalloc
+
 from marimo._runtime.capture import capture_stderr
 from marimo._runtime.runner.cell_runner import Runner
+from marimo._runtime.runner.profiler import CellProfiler
 from marimo._runtime.runtime import Kernel
 from tests.conftest import ExecReqProvider
 
@@ -83,3 +86,60 @@ async def test_base_exception_caught(
     with capture_stderr() as buffer:
         await runner.run(er.cell_id)
     assert "line 3" in buffer.getvalue()
+
+
+async def test_cell_profiles_recorded(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run([er := exec_req.get("x = sum(range(1000))")])
+
+    hook_calls = []
+    runner = Runner(
+        roots=set(k.graph.cells.keys()),
+        graph=k.graph,
+        glbls=k.globals,
+        debugger=k.debugger,
+        post_execution_hooks=[
+            lambda cell, _runner, _run_result: hook_calls.append(cell.cell_id)
+        ],
+    )
+    await runner.run_all()
+
+    assert hook_calls == [er.cell_id]
+    assert len(runner.cell_profiles) == 1
+    profile = runner.cell_profiles[0]
+    assert profile.cell_id == er.cell_id
+    assert profile.wall_time >= 0
+    assert profile.cpu_time >= 0
+    assert list(profile.post_execution_hooks) == ["<lambda>"]
+    # tracemalloc isn't tracing
+    assert profile.allocations is None
+
+
+async def test_cell_profiles_broadcast(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run([er := exec_req.get("x = 1")])
+
+    assert k.stream.messages[-1][0] == "cell-profiles"
+    (profile,) = k.stream.messages[-1][1]["profiles"]
+    assert profile["cell_id"] == er.cell_id
+    assert "broadcast_outputs" in profile["post_execution_hooks"]
+
+
+def test_profiler_records_allocations() -> None:
+    tracemalloc.start()
+    try:
+        profiler = CellProfiler("cell")
+        data = [bytearray(1024) for _ in range(100)]
+        profile = profiler.executed()
+    finally:
+        tracemalloc.stop()
+
+    assert data
+    assert profile.allocations is not None
+    assert profile.allocations
+    assert profile.allocations[0].filename == __file__
+    assert profile.allocations[0].size >= 100 * 1024
@@ -1,4 +1,11 @@
-from marimo._runtime.complete import _build_docstring_cached
+from marimo._ast import compiler
+from marimo._runtime import dataflow
+from marimo._runtime.complete import (
+    CompletionIndex,
+    _build_docstring_cached,
+    _get_completions_with_script,
+    _stub_cell_code,
+)
 from tests.mocks import snapshotter
 
 snapshot = snapshotter(__file__)
@@ -109,3 +116,144 @@ def test_build_docstring_no_signature_no_body():
         init_docstring=None,
     )
     assert len(result.strip()) == 0
+
+
+def _graph(codes: dict[str, str]) -> dataflow.DirectedGraph:
+    graph = dataflow.DirectedGraph()
+    for cell_id, code in codes.items():
+        graph.register_cell(
+            cell_id, compiler.compile_cell(code, cell_id=cell_id)
+        )
+    return graph
+
+
+def test_stub_cell_code():
+    assert _stub_cell_code("x = 1\nx", {"x"}) == "x = 1"
+    assert (
+        _stub_cell_code("import os\nos.getcwd()\npass", {"os"}) == "import os"
+    )
+    # Private names aren't visible to other cells
+    assert _stub_cell_code("_y = 1\nx: int = _y", {"x"}) == "x: int = _y"
+    # Unchanged when the code doesn't parse
+    assert _stub_cell_code("x = (", {"x"}) == "x = ("
+
+
+def test_stub_cell_code_stubs_definitions():
+    code = """
+@decorator
+def f(a: int, b=2) -> str:
+    \"\"\"Docs.\"\"\"
+    for i in range(a):
+        print(i)
+    return str(b)
+
+async def g():
+    await h()
+
+class C(Base):
+    \"\"\"A class.\"\"\"
+    attr: int = 1
+
+    def method(self, x):
+        self.x = x
+
+    class Inner:
+        pass
+
+    print("side effect")
+
+def _private():
+    return 1
+"""
+    assert _stub_cell_code(code, {"f", "g", "C"}) == (
+        "@decorator\n"
+        "def f(a: int, b=2) -> str:\n"
+        '    """Docs."""\n'
+        "\n"
+        "async def g():\n"
+        "    ...\n"
+        "\n"
+        "class C(Base):\n"
+        '    """A class."""\n'
+        "    attr: int = 1\n"
+        "\n"
+        "    def method(self, x):\n"
+        "        ...\n"
+        "\n"
+        "    class Inner:\n"
+        "        ..."
+    )
+
+
+def test_stub_cell_code_hoists_definitions_from_control_flow():
+    code = """
+try:
+    import numpy as np
+except ImportError:
+    np = None
+finally:
+    done = True
+
+with open("data.json") as f:
+    data = json.load(f)
+
+for i in range(3):
+    total = i
+    print(total)
+"""
+    assert _stub_cell_code(code, {"np", "done", "data", "total"}) == (
+        "import numpy as np\n"
+        "np = None\n"
+        "done = True\n"
+        "data = json.load(f)\n"
+        "total = i"
+    )
+
+
+def test_completion_index_source():
+    graph = _graph(
+        {
+            "0": "import os",
+            "1": "x = os.getcwd()\nx",
+            "2": "mo.md('no definitions')",
+        }
+    )
+    index = CompletionIndex()
+
+    source = index.source(graph, "2")
+    assert source == "import os\nx = os.getcwd()"
+    # Cached until the graph changes
+    assert index.source(graph, "2") is source
+
+    # The cell being completed is left out
+    assert index.source(graph, "1") == "import os"
+
+    graph.delete_cell("1")
+    graph.register_cell("1", compiler.compile_cell("y = 1", cell_id="1"))
+    assert index.source(graph, "2") == "import os\ny = 1"
+
+    graph.delete_cell("0")
+    assert index.source(graph, "2") == "y = 1"
+    assert "0" not in index._stubs
+
+
+def test_completions_with_index():
+    graph = _graph(
+        {
+            "0": "import os",
+            "1": "value = 1\nvalue",
+            "2": "class Model:\n    def predict(self):\n        return 1",
+        }
+    )
+    index = CompletionIndex()
+    source = index.source(graph, "3")
+
+    _, completions = _get_completions_with_script(index, source, "os.getc")
+    assert [c.name for c in completions] == ["getcwd", "getcwdb"]
+
+    _, completions = _get_completions_with_script(index, source, "val")
+    assert "value" in [c.name for c in completions]
+
+    # Methods of stubbed classes
+    _, completions = _get_completions_with_script(index, source, "Model().pre")
+    assert [c.name for c in completions] == ["predict"]
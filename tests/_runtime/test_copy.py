@@ -1,10 +1,12 @@
 import pytest
 
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.copy import (
     ReadOnlyError,
     ShallowCopy,
     ZeroCopy,
     _Copy,
+    cheap_copy,
     shadow_wrap,
     shallow_copy,
     unwrap_copy,
@@ -135,3 +137,68 @@ def test_cross_shallow_zero() -> None:
     assert isinstance(unwrap_copy(shadow2), list)
     assert not isinstance(unwrap_copy(shadow2), ShallowCopy)
     assert id(unwrap_copy(shadow2)) != id(base)
+
+
+def test_cheap_copy_unknown_type() -> None:
+    assert cheap_copy([1, 2, 3]) is None
+    assert cheap_copy({"a": 1}) is None
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(), reason="numpy not installed"
+)
+def test_cheap_copy_numpy() -> None:
+    import numpy as np
+
+    base = np.arange(10)
+    view = cheap_copy(base)
+    assert view is not None
+    assert np.shares_memory(view, base)
+    with pytest.raises(ValueError):
+        view[0] = 1
+    # Views are reused while alive, and track the base
+    assert cheap_copy(base) is view
+    base[0] = 5
+    assert view[0] == 5
+    # but not across reshapes
+    base.shape = (2, 5)
+    reshaped = cheap_copy(base)
+    assert reshaped is not view
+    assert reshaped.shape == (2, 5)
+
+    # Object arrays may hold mutable objects
+    assert cheap_copy(np.array([[1], [2]], dtype=object)) is None
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_cheap_copy_polars() -> None:
+    import polars as pl
+
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    clone = cheap_copy(df)
+    assert clone is not None
+    assert clone is not df
+    clone[0, "a"] = 10
+    assert df["a"].to_list() == [1, 2, 3]
+
+    lazy = df.lazy()
+    assert cheap_copy(lazy) is lazy
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_cheap_copy_pandas() -> None:
+    import pandas as pd
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    copied = cheap_copy(df)
+    if copied is None:
+        # copy-on-write is disabled
+        assert not pd.options.mode.copy_on_write
+        return
+    assert copied is not df
+    copied.loc[0, "a"] = 10
+    assert df["a"].tolist() == [1, 2, 3]
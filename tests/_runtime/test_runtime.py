@@ -35,6 +35,7 @@ from marimo._runtime.requests import (
     CreationRequest,
     DeleteCellRequest,
     ExecutionRequest,
+    PreviewVariablesRequest,
     SetCellConfigRequest,
     SetUIElementValueRequest,
 )
@@ -1257,19 +1258,20 @@ class TestExecution:
         )
         # Runtime error expected- since not a kernel error check stderr
         assert "C" not in k.globals
+        cell_ops = [m for m in k.stream.messages if m[0] == "cell-op"]
         if k.execution_type == "strict":
             assert (
                 "name `R` is referenced before definition."
-                in k.stream.messages[-4][1]["output"]["data"][0]["msg"]
+                in cell_ops[-4][1]["output"]["data"][0]["msg"]
             )
             assert (
                 "This cell wasn't run"
-                in k.stream.messages[-1][1]["output"]["data"][0]["msg"]
+                in cell_ops[-1][1]["output"]["data"][0]["msg"]
             )
         else:
             assert (
                 "marimo came across the undefined variable `C` during runtime."
-                in k.stream.messages[-2][1]["output"]["data"][0]["msg"]
+                in cell_ops[-2][1]["output"]["data"][0]["msg"]
             )
             assert "NameError" in k.stderr.messages[0]
             assert "NameError" in k.stderr.messages[-1]
@@ -1559,6 +1561,39 @@ class TestStrictExecution:
         else:
             assert k.globals["V1"] == 11
 
+    @staticmethod
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(), reason="numpy not installed"
+    )
+    async def test_cell_numpy_read_only_view(
+        strict_kernel: Kernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = strict_kernel
+        await k.run(
+            [
+                exec_req.get(
+                    """
+                    import numpy as np
+                    X = np.zeros(3)
+                    """
+                ),
+                exec_req.get("B = X.base"),
+                exec_req.get(
+                    """
+                    try:
+                        X[0] = 1
+                    except ValueError as exc:
+                        e = exc
+                    """
+                ),
+            ]
+        )
+        assert not k.errors
+        # Cells receive a read-only view of the array instead of a copy
+        assert k.globals["B"] is k.globals["X"]
+        assert isinstance(k.globals["e"], ValueError)
+        assert k.globals["X"][0] == 0
+
     @staticmethod
     async def test_wont_execute_bad_ref(execution_kernel: Kernel) -> None:
         k = execution_kernel
@@ -2707,6 +2742,30 @@ class TestStateTransitions:
         await k.delete_cell(DeleteCellRequest(cell_id=er_2.cell_id))
         assert sum(1 for m in stream.messages if m[0] == "variables") == 1
 
+    @staticmethod
+    async def test_variable_previews_on_request(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        stream = mocked_kernel.stream
+
+        await k.run([exec_req.get("x = 1; y = list(range(1000))")])
+        values = [m[1] for m in stream.messages if m[0] == "variable-values"]
+        assert values
+        assert all(v["value"] is None for v in values[-1]["variables"])
+
+        stream.messages.clear()
+        await k.preview_variables(
+            PreviewVariablesRequest(variable_names=["x", "y", "missing"])
+        )
+        values = [m[1] for m in stream.messages if m[0] == "variable-values"]
+        assert len(values) == 1
+        previews = {v["name"]: v["value"] for v in values[0]["variables"]}
+        assert previews["x"] == "1"
+        assert previews["y"].startswith("[0, 1, 2")
+        assert len(previews["y"]) <= 50
+        assert "missing" not in previews
+
 
 class TestErrorHandling:
     async def test_error_handling(
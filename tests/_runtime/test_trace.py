@@ -202,19 +202,20 @@ class TestAppTrace:
         )
         # Runtime error expected- since not a kernel error check stderr
         assert "C" not in k.globals
+        cell_ops = [m for m in k.stream.messages if m[0] == "cell-op"]
         if k.execution_type == "strict":
             assert (
                 "name `R` is referenced before definition."
-                in k.stream.messages[-4][1]["output"]["data"][0]["msg"]
+                in cell_ops[-4][1]["output"]["data"][0]["msg"]
             )
             assert (
                 "This cell wasn't run"
-                in k.stream.messages[-1][1]["output"]["data"][0]["msg"]
+                in cell_ops[-1][1]["output"]["data"][0]["msg"]
             )
         else:
             assert (
                 "marimo came across the undefined variable `C` during runtime."
-                in k.stream.messages[-2][1]["output"]["data"][0]["msg"]
+                in cell_ops[-2][1]["output"]["data"][0]["msg"]
             )
             assert "NameError" in k.stderr.messages[0]
             assert "NameError" in k.stderr.messages[-1]
@@ -1,11 +1,21 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING
+
 from marimo._runtime.context import get_context
 from marimo._runtime.requests import DeleteCellRequest
 from marimo._runtime.runtime import Kernel
+from marimo._runtime.virtual_file import (
+    read_virtual_file,
+    resolve_spill_file,
+)
 from tests.conftest import ExecReqProvider
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 async def test_virtual_file_creation(
     execution_kernel: Kernel, exec_req: ExecReqProvider
@@ -281,3 +291,64 @@ async def test_virtual_files_not_supported(
     ctx = get_context()
     assert len(ctx.virtual_file_registry.registry) == 0
     ctx.virtual_files_supported = True
+
+
+async def test_spilled_virtual_file(
+    execution_kernel: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    k = execution_kernel
+    get_context().virtual_file_registry.spill_directory = str(tmp_path)
+    await k.run(
+        [
+            er := exec_req.get(
+                """
+                import marimo as mo
+                from marimo._output.data.data import stream
+
+                def write(f):
+                    for i in range(3):
+                        f.write(b"chunk")
+
+                vfile = stream(write, ext="txt")
+                """
+            ),
+        ]
+    )
+    registry = get_context().virtual_file_registry.registry
+    assert len(registry) == 1
+    (fname, item), *_ = registry.items()
+    assert item.shm is None
+    assert item.path is not None
+    assert os.path.getsize(item.path) == 15
+    vfile = k.globals["vfile"]
+    assert vfile.url == f"./@file/15-{fname}"
+    assert os.path.dirname(item.path) == str(tmp_path)
+    assert resolve_spill_file(str(tmp_path), fname) == item.path
+    assert resolve_spill_file(str(tmp_path), "..") is None
+
+    await k.delete_cell(DeleteCellRequest(cell_id=er.cell_id))
+    assert not registry
+    assert not os.path.exists(item.path)
+
+
+async def test_spilled_virtual_file_without_spill_directory(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run(
+        [
+            exec_req.get(
+                """
+                from marimo._output.data.data import stream
+
+                vfile = stream(lambda f: f.write(b"data"), ext="txt")
+                """
+            ),
+        ]
+    )
+    registry = get_context().virtual_file_registry.registry
+    assert len(registry) == 1
+    (fname, item), *_ = registry.items()
+    # Falls back to an in-memory virtual file
+    assert item.path is None
+    assert read_virtual_file(fname, 4) == b"data"
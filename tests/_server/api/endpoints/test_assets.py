@@ -6,15 +6,25 @@ import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
 
 from marimo._server.api.deps import AppState
+from marimo._server.api.endpoints import assets
 from marimo._server.api.utils import parse_title
 from marimo._server.file_router import AppFileRouter
-from tests._server.mocks import token_header, with_file_router
+from marimo._server.model import SessionMode
+from tests._server.mocks import (
+    get_session_manager,
+    token_header,
+    with_file_router,
+    with_session,
+)
 
 if TYPE_CHECKING:
     from starlette.testclient import TestClient
 
+SESSION_ID = "session-123"
+
 
 def test_index(client: TestClient) -> None:
     session_manager = AppState.from_app(cast(Any, client.app)).session_manager
@@ -85,6 +95,47 @@ def test_index_with_directory(client: TestClient) -> None:
     assert "<title>marimo</title>" in content
 
 
+def test_index_cached_in_run_mode(client: TestClient) -> None:
+    session_manager = get_session_manager(client)
+    filename = session_manager.file_router.get_unique_file_key()
+    assert filename is not None
+    assets._rendered_pages.clear()
+
+    session_manager.mode = SessionMode.RUN
+    try:
+        with patch.object(
+            assets,
+            "notebook_page_template",
+            wraps=assets.notebook_page_template,
+        ) as render:
+            first = client.get("/", headers=token_header())
+            second = client.get("/", headers=token_header())
+            assert first.status_code == 200, first.text
+            assert first.text == second.text
+            assert render.call_count == 1
+
+            # Re-rendered when the notebook changes
+            stat = os.stat(filename)
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            client.get("/", headers=token_header())
+            assert render.call_count == 2
+
+            # Re-rendered when index.html changes
+            index_html = os.path.join(assets.root, "index.html")
+            stat = os.stat(index_html)
+            try:
+                os.utime(
+                    index_html, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1)
+                )
+                client.get("/", headers=token_header())
+                assert render.call_count == 3
+            finally:
+                os.utime(index_html, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    finally:
+        session_manager.mode = SessionMode.EDIT
+        assets._rendered_pages.clear()
+
+
 def test_favicon(client: TestClient) -> None:
     response = client.get("/favicon.ico")
     assert response.status_code == 200, response.text
@@ -117,6 +168,32 @@ def test_vfile(client: TestClient) -> None:
     assert response.json() == {"detail": "Invalid virtual file request"}
 
 
+@with_session(SESSION_ID)
+def test_spilled_vfile(client: TestClient) -> None:
+    session = get_session_manager(client).get_session(SESSION_ID)
+    assert session is not None
+    spill_directory = session.kernel_manager.spill_directory
+    assert spill_directory is not None
+
+    path = os.path.join(spill_directory, "test-spilled.csv")
+    with open(path, "wb") as f:
+        f.write(b"a,b\n1,2\n")
+    response = client.get("/@file/8-test-spilled.csv", headers=token_header())
+    assert response.status_code == 200, response.text
+    assert response.content == b"a,b\n1,2\n"
+    assert response.headers["content-type"].startswith("text/csv")
+
+    response = client.get("/@file/8-..", headers=token_header())
+    assert response.status_code == 404
+
+    # Files outside of the session's spill directory are not served
+    with TemporaryDirectory() as other_directory:
+        with open(os.path.join(other_directory, "other.csv"), "wb") as f:
+            f.write(b"a,b\n1,2\n")
+        response = client.get("/@file/8-other.csv", headers=token_header())
+        assert response.status_code == 404
+
+
 def test_public_file_serving(client: TestClient) -> None:
     # Setup app state with a mock notebook
     app_state = AppState.from_app(cast(Any, client.app))
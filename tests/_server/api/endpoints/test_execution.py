@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from marimo._messaging.cell_profile import CellProfile
+from marimo._messaging.ops import CellProfiles
 from tests._server.conftest import get_session_manager
 from tests._server.mocks import token_header, with_read_session, with_session
 
@@ -155,6 +157,33 @@ class TestExecutionRoutes_EditMode:
         assert response.headers["content-type"] == "application/json"
         assert response.json()["status"] == "ok"
 
+    @staticmethod
+    @with_session(SESSION_ID)
+    def test_cell_profiles(client: TestClient) -> None:
+        session = get_session_manager(client).get_session(SESSION_ID)
+        assert session
+        session.session_view.add_operation(
+            CellProfiles(
+                profiles=[
+                    CellProfile(cell_id="fast", wall_time=0.1, cpu_time=0.1),
+                    CellProfile(
+                        cell_id="slow",
+                        wall_time=2.0,
+                        cpu_time=1.0,
+                        peak_rss_delta=1024,
+                        post_execution_hooks={"broadcast_outputs": 0.5},
+                    ),
+                ]
+            )
+        )
+
+        response = client.get("/api/kernel/cell_profiles", headers=HEADERS)
+        assert response.status_code == 200, response.text
+        profiles = response.json()["profiles"]
+        assert [p["cellId"] for p in profiles] == ["slow", "fast"]
+        assert profiles[0]["wallTime"] == 2.0
+        assert profiles[0]["peakRssDelta"] == 1024
+
 
 class TestExecutionRoutes_RunMode:
     @staticmethod
@@ -258,6 +258,36 @@ def test_copy_file(client: TestClient) -> None:
     assert 'marimo.App(width="full"' in file_contents
 
 
+def _receive_variable_previews(
+    client: TestClient, websocket: WebSocketTestSession, names: list[str]
+) -> dict[str, str]:
+    # Variable values are broadcast without previews; wait for the names,
+    # then request their previews explicitly.
+    seen: set[str] = set()
+    while len(seen) < len(names):
+        data = websocket.receive_json()
+        if data["op"] == "variable-values":
+            for var in data["data"]["variables"]:
+                assert var["value"] is None
+                seen.add(var["name"])
+
+    response = client.post(
+        "/api/kernel/preview_variables",
+        headers=HEADERS,
+        json={"variableNames": names},
+    )
+    assert response.json() == {"success": True}
+
+    variables: dict[str, str] = {}
+    while len(variables) < len(names):
+        data = websocket.receive_json()
+        if data["op"] == "variable-values":
+            for var in data["data"]["variables"]:
+                if var["value"] is not None:
+                    variables[var["name"]] = var["value"]
+    return variables
+
+
 @with_websocket_session(SESSION_ID)
 def test_rename_propagates(
     client: TestClient, websocket: WebSocketTestSession
@@ -280,12 +310,7 @@ def test_rename_propagates(
     assert initial_response.json() == {"success": True}
     assert initial_response.status_code == 200, initial_response.text
 
-    variables = {}
-    while len(variables) < 2:
-        data = websocket.receive_json()
-        if data["op"] == "variable-values":
-            for var in data["data"]["variables"]:
-                variables[var["name"]] = var["value"]
+    variables = _receive_variable_previews(client, websocket, ["a", "b"])
 
     # Variable outputs are truncated to 50 characters
     # current_filename can exceed this count on windows and OSX.
@@ -306,12 +331,7 @@ def test_rename_propagates(
     assert response.json() == {"success": True}
     assert response.status_code == 200, response.text
 
-    variables = {}
-    while len(variables) < 2:
-        data = websocket.receive_json()
-        if data["op"] == "variable-values":
-            for var in data["data"]["variables"]:
-                variables[var["name"]] = var["value"]
+    variables = _receive_variable_previews(client, websocket, ["a", "b"])
 
     assert ("x" + new_filename).startswith(variables["a"])
     assert new_filename.startswith(variables["b"])
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from marimo import __version__
+from marimo._metrics import METRICS
 from tests._server.mocks import token_header, with_session
 
 if TYPE_CHECKING:
@@ -80,3 +82,23 @@ def test_read_code(client: TestClient) -> None:
     response = client.get("/api/status/connections", headers=HEADERS)
     assert response.status_code == 200, response.text
     assert response.json()["active"] == 1
+
+
+def test_metrics_disabled(client: TestClient) -> None:
+    response = client.get("/metrics", headers=token_header())
+    assert response.status_code == 404, response.text
+
+
+@with_session(SESSION_ID)
+def test_metrics(client: TestClient) -> None:
+    with patch.object(METRICS, "enabled", True):
+        response = client.get("/metrics", headers=HEADERS)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith(
+        "application/openmetrics-text"
+    )
+    text = response.text
+    assert text.endswith("# EOF\n")
+    assert 'marimo_sessions{state="open"} 1' in text
+    assert "# TYPE marimo_server_memory_bytes gauge" in text
+    assert "# TYPE marimo_cell_execution_seconds histogram" in text
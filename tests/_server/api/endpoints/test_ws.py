@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pycrdt import (
@@ -14,9 +16,20 @@ from pycrdt import (
 from starlette.websockets import WebSocketDisconnect
 
 from marimo._config.manager import UserConfigManager
-from marimo._messaging.ops import KernelCapabilities, KernelReady
-from marimo._server.api.endpoints.ws import CellIdAndFileKey, WebSocketCodes
+from marimo._messaging.ops import (
+    Alert,
+    FocusCell,
+    KernelCapabilities,
+    KernelReady,
+)
+from marimo._server.api.endpoints import ws
+from marimo._server.api.endpoints.ws import (
+    CellIdAndFileKey,
+    WebSocketCodes,
+    WebsocketHandler,
+)
 from marimo._server.model import SessionMode
+from marimo._server.session.frames import FrameLog
 from marimo._server.sessions import SessionManager
 from marimo._utils.parse_dataclass import parse_raw
 from tests._server.conftest import get_session_manager, get_user_config_manager
@@ -222,7 +235,7 @@ async def test_file_watcher_calls_reload(client: TestClient) -> None:
         await session_manager.watcher.callback(Path(filename))
         unsubscribe()
         data = websocket.receive_json()
-        assert data == {"op": "reload", "data": {}}
+        assert data == {"op": "reload", "data": {}, "seq": 1}
         session_manager.mode = SessionMode.EDIT
     client.post("/api/kernel/shutdown", headers=HEADERS)
 
@@ -583,3 +596,117 @@ async def test_ycell_invalid_session(client: TestClient) -> None:
 
     assert exc_info.value.code == WebSocketCodes.FORBIDDEN
     assert exc_info.value.reason == "MARIMO_NOT_ALLOWED"
+
+
+async def test_slow_consumer_is_resynced() -> None:
+    handler = WebsocketHandler(
+        websocket=MagicMock(),
+        manager=MagicMock(),
+        rtc_enabled=False,
+        session_id="session",
+        mode=SessionMode.RUN,
+        file_key="app.py",
+        kiosk=False,
+    )
+    handler.message_queue = asyncio.Queue()
+
+    def replay(session: Any) -> None:
+        del session
+        handler.write_operation(Alert(title="replayed", description=""))
+
+    with (
+        patch.object(ws, "MAX_PENDING_FRAMES", 2),
+        patch.object(handler, "_replay_session_view", side_effect=replay),
+    ):
+        for i in range(3):
+            handler.write_operation(Alert(title=str(i), description=""))
+
+    # The backlog is replaced by the session's current view
+    assert handler.message_queue.qsize() == 1
+    op, frame = handler.message_queue.get_nowait()
+    assert op == "alert"
+    assert json.loads(frame)["data"]["title"] == "replayed"
+
+
+@pytest.mark.parametrize("batch", [True, False])
+async def test_next_frames(batch: bool) -> None:
+    handler = WebsocketHandler(
+        websocket=MagicMock(),
+        manager=MagicMock(),
+        rtc_enabled=False,
+        session_id="session",
+        mode=SessionMode.RUN,
+        file_key="app.py",
+        kiosk=False,
+        batch=batch,
+    )
+    handler.message_queue = asyncio.Queue()
+    for i in range(3):
+        handler.write_operation(Alert(title=str(i), description=""))
+    # Kiosk-only operations are filtered out of batches
+    handler.write_operation(FocusCell(cell_id="1"))
+
+    if batch:
+        frames = await handler._next_frames()
+        assert [json.loads(frame)["data"]["title"] for frame in frames] == [
+            "0",
+            "1",
+            "2",
+        ]
+    else:
+        for i in range(3):
+            (frame,) = await handler._next_frames()
+            assert json.loads(frame)["data"]["title"] == str(i)
+        assert await handler._next_frames() == []
+    assert handler.message_queue.empty()
+
+
+@pytest.mark.parametrize(
+    ("last_seq", "expected_ops"),
+    [
+        # Only the missed frames are resent
+        (1, ["reconnected", "alert", "alert", "alert"]),
+        # Up to date
+        (3, ["reconnected", "alert"]),
+        # Unknown sequence number: full replay
+        (10, ["reconnected", "kernel-ready", "banner", "batch"]),
+        # Legacy clients
+        (None, ["reconnected", "alert"]),
+    ],
+)
+async def test_reconnect_resends_missed_frames(
+    last_seq: Optional[int], expected_ops: list[str]
+) -> None:
+    session = MagicMock()
+    session.frame_log = FrameLog()
+    for i in range(3):
+        session.frame_log.append_operation(Alert(title=str(i), description=""))
+    session.get_current_state.return_value.operations = []
+    handler = WebsocketHandler(
+        websocket=MagicMock(),
+        manager=MagicMock(),
+        rtc_enabled=False,
+        session_id="session",
+        mode=SessionMode.EDIT,
+        file_key="app.py",
+        kiosk=False,
+        batch=True,
+        last_seq=last_seq,
+    )
+    handler.message_queue = asyncio.Queue()
+
+    with patch.object(handler, "_write_kernel_ready") as write_kernel_ready:
+        write_kernel_ready.side_effect = lambda *_args, **_kwargs: (
+            handler._enqueue("kernel-ready", "{}")
+        )
+        handler._reconnect_session(session, replay=False)
+
+    ops: list[str] = []
+    frames: list[str] = []
+    while not handler.message_queue.empty():
+        op, frame = handler.message_queue.get_nowait()
+        ops.append(op)
+        frames.append(frame)
+    assert ops == expected_ops
+    if last_seq == 1:
+        assert [json.loads(frame)["seq"] for frame in frames[1:3]] == [2, 3]
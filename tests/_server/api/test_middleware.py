@@ -29,6 +29,7 @@ from marimo._server.utils import find_free_port
 from tests._server.mocks import get_mock_session_manager, token_header
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
     from starlette.requests import Request
@@ -332,6 +333,37 @@ def run_static_server():
     server.run()
 
 
+def test_proxy_pools_are_bounded() -> None:
+    proxy = ProxyMiddleware(
+        Starlette(),
+        proxy_path="/mpl",
+        target_url=lambda path: f"http://localhost:{path.split('/')[2]}",
+        max_pools=2,
+    )
+    first = proxy._get_pool("http://localhost:8001")
+    # Pools are shared by the targets of a host and port
+    assert proxy._get_pool("http://localhost:8001/other") is first
+    second = proxy._get_pool("http://localhost:8002")
+    third = proxy._get_pool("https://localhost:8002")
+    assert third is not second
+
+    # The least recently used pool is closed
+    assert list(proxy._pools.values()) == [second, third]
+    assert first.closed
+    assert not second.closed
+
+
+def test_proxy_pools_closed_on_shutdown() -> None:
+    proxy = ProxyMiddleware(
+        Starlette(), proxy_path="/proxy", target_url="http://localhost:8001"
+    )
+    with TestClient(proxy):
+        pool = proxy._get_pool("http://localhost:8001")
+        assert not pool.closed
+    assert pool.closed
+    assert not proxy._pools
+
+
 class TestProxyMiddleware:
     @pytest.fixture(scope="module")
     def target_server(self):
@@ -517,6 +549,51 @@ class TestProxyMiddleware:
         assert response.headers.get("content-type") == "application/json"
         await response.aclose()
 
+    async def test_http_client_reuses_connections(
+        self, app_with_proxy: Starlette
+    ) -> None:
+        del app_with_proxy
+        client = _AsyncHTTPClient(base_url="http://127.0.0.1:8765")
+
+        for _ in range(3):
+            request = _URLRequest(
+                "http://127.0.0.1:8765/test",
+                method="GET",
+                headers={},
+                data=None,
+            )
+            response = await client.send(request)
+            assert response.status_code == 200
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+            assert json.loads(body)["message"] == "response from proxied app"
+
+        # Each request reused the connection of the previous one
+        assert len(client.pool._idle) == 1
+        client.pool.close()
+
+    async def test_http_client_streams_body(
+        self, app_with_proxy: Starlette
+    ) -> None:
+        del app_with_proxy
+        client = _AsyncHTTPClient(base_url="http://127.0.0.1:8765")
+
+        async def body() -> AsyncIterator[bytes]:
+            yield b'{"test": '
+            yield b'"data"}'
+
+        url = type("URL", (), {"path": "/test", "query": b""})()
+        request = client.build_request(
+            "POST",
+            url,
+            headers={"Transfer-Encoding": "chunked"},
+            content=body(),
+        )
+        assert "Transfer-Encoding" not in request.headers
+        response = await client.send(request)
+        assert response.status_code == 200
+        await response.aclose()
+        client.pool.close()
+
     def test_http_client_url_building(self) -> None:
         client = _AsyncHTTPClient(base_url="http://127.0.0.1:8765")
 
@@ -0,0 +1,126 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from marimo._server.api.static import (
+    HASHED_FILE,
+    IMMUTABLE_CACHE_CONTROL,
+    AssetFiles,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONTENTS = "console.log('hello');\n" * 100
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> Path:
+    (tmp_path / "index-Bx3Kf9aQ.js").write_text(CONTENTS)
+    (tmp_path / "small.js").write_text("1;")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" * 1000)
+    return tmp_path
+
+
+def _client(directory: Path) -> TestClient:
+    app = Starlette(
+        routes=[Mount("/assets", app=AssetFiles(directory=str(directory)))]
+    )
+    return TestClient(app)
+
+
+def test_hashed_assets_are_immutable(assets: Path) -> None:
+    client = _client(assets)
+    response = client.get("/assets/index-Bx3Kf9aQ.js")
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    response = client.get("/assets/small.js")
+    assert "cache-control" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("name", "hashed"),
+    [
+        ("index-Bx3Kf9aQ.js", True),
+        ("worker-D2_kq0aZ.js", True),
+        ("assets/style-0a1b2c3d.css", True),
+        ("vega-embed-module.js", False),
+        ("some-long-name.css", False),
+        ("chart-renderer.js", False),
+        ("index-Bx3Kf9aQ.js.map.txt", False),
+        ("logo.png", False),
+    ],
+)
+def test_hashed_file_names(name: str, hashed: bool) -> None:
+    assert bool(HASHED_FILE.search(name)) is hashed
+
+
+def test_gzipped_on_request(assets: Path) -> None:
+    client = _client(assets)
+    response = client.get(
+        "/assets/index-Bx3Kf9aQ.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    # The test client decompresses the response
+    assert response.text == CONTENTS
+    etag = response.headers["etag"]
+
+    # Conditional requests are answered for either encoding
+    response = client.get(
+        "/assets/index-Bx3Kf9aQ.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    # Not compressed unless accepted
+    response = client.get(
+        "/assets/index-Bx3Kf9aQ.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize(
+    "path", ["/assets/small.js", "/assets/logo.png"], ids=["small", "binary"]
+)
+def test_not_compressed(assets: Path, path: str) -> None:
+    response = _client(assets).get(path, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_precompressed_siblings(assets: Path) -> None:
+    # Siblings are preferred over compressing on request
+    (assets / "index-Bx3Kf9aQ.js.gz").write_bytes(
+        gzip.compress(b"precompressed")
+    )
+    (assets / "index-Bx3Kf9aQ.js.br").write_bytes(b"brotli")
+    client = _client(assets)
+
+    response = client.get(
+        "/assets/index-Bx3Kf9aQ.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.text == "precompressed"
+
+    response = client.get(
+        "/assets/index-Bx3Kf9aQ.js",
+        headers={"Accept-Encoding": "gzip, br;q=0"},
+    )
+    assert response.headers["content-encoding"] == "gzip"
+
+    # Only check the headers, the body may not be decodable here
+    with client.stream(
+        "GET",
+        "/assets/index-Bx3Kf9aQ.js",
+        headers={"Accept-Encoding": "gzip, br"},
+    ) as response:
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["content-length"] == str(len(b"brotli"))
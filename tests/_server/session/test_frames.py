@@ -0,0 +1,87 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from marimo._messaging.ops import Alert
+from marimo._server.session import frames
+from marimo._server.session.frames import (
+    FrameLog,
+    encode_kernel_message,
+    encode_operation,
+    sequence_frame,
+)
+
+
+def test_encode_operation_once() -> None:
+    alert = Alert(title="title", description="description")
+    with patch.object(
+        frames, "serialize", wraps=frames.serialize
+    ) as serialize:
+        frame = encode_operation(alert)
+        assert encode_operation(alert) is frame
+        assert serialize.call_count == 1
+
+    assert frame is not None
+    assert json.loads(frame) == {
+        "op": "alert",
+        "data": {
+            "title": "title",
+            "description": "description",
+            "variant": None,
+        },
+    }
+
+    # An equal but distinct operation is encoded again
+    other = Alert(title="title", description="description")
+    with patch.object(
+        frames, "serialize", wraps=frames.serialize
+    ) as serialize:
+        assert encode_operation(other) == frame
+        assert serialize.call_count == 1
+
+
+def test_encode_kernel_message() -> None:
+    message = ("completed-run", {})
+    frame = encode_kernel_message(message)
+    assert frame == '{"op": "completed-run", "data": {}}'
+    assert encode_kernel_message(message) is frame
+
+    # Unencodable messages are dropped
+    assert encode_kernel_message(("op", {"data": object()})) is None
+
+
+def test_frame_log() -> None:
+    log = FrameLog(max_bytes=200)
+    assert log.last_seq == 0
+    assert log.since(0) == []
+
+    frame = log.append_operation(Alert(title="1", description=""))
+    assert frame is not None
+    assert json.loads(frame)["seq"] == 1
+    # Consumers encoding the same operation get the numbered frame
+    alert = Alert(title="2", description="")
+    assert log.append_operation(alert) == encode_operation(alert)
+    assert log.append_kernel_message(("completed-run", {})) is not None
+    assert log.last_seq == 3
+
+    assert [op for op, _ in log.since(1) or []] == ["alert", "completed-run"]
+    assert log.since(3) == []
+    # Sequence numbers the log never handed out
+    assert log.since(4) is None
+    assert log.since(-1) is None
+
+    # Old frames are dropped once the log is over budget
+    for i in range(5):
+        log.append_operation(Alert(title=str(i), description=""))
+    assert log.since(0) is None
+    assert log.since(log.last_seq - 1) is not None
+
+
+def test_sequence_frame() -> None:
+    assert json.loads(sequence_frame(3)) == {
+        "op": "batch",
+        "data": [],
+        "seq": 3,
+    }
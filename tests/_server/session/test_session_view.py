@@ -7,8 +7,10 @@ from unittest.mock import patch
 from marimo._ast.cell import CellId_t, RuntimeStateType
 from marimo._data.models import DataTable, DataTableColumn
 from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.cell_profile import CellProfile
 from marimo._messaging.ops import (
     CellOp,
+    CellProfiles,
     Datasets,
     UpdateCellIdsRequest,
     VariableDeclaration,
@@ -250,6 +252,42 @@ def test_add_variables() -> None:
     assert session_view.variable_values["var2"].datatype == "str"
 
 
+def test_add_cell_profiles() -> None:
+    session_view = SessionView()
+
+    session_view.add_raw_operation(
+        serialize(
+            CellProfiles(
+                profiles=[
+                    CellProfile(cell_id=cell_id, wall_time=1.0, cpu_time=0.5),
+                    CellProfile(cell_id="cell_2", wall_time=2.0, cpu_time=1.0),
+                ]
+            )
+        )
+    )
+    # Later runs replace the profiles of the cells they ran
+    session_view.add_raw_operation(
+        serialize(
+            CellProfiles(
+                profiles=[
+                    CellProfile(
+                        cell_id=cell_id,
+                        wall_time=3.0,
+                        cpu_time=0.5,
+                        post_execution_hooks={"broadcast_outputs": 0.1},
+                    )
+                ]
+            )
+        )
+    )
+
+    assert session_view.cell_profiles[cell_id].wall_time == 3.0
+    assert session_view.cell_profiles[cell_id].post_execution_hooks == {
+        "broadcast_outputs": 0.1
+    }
+    assert session_view.cell_profiles["cell_2"].wall_time == 2.0
+
+
 def test_add_datasets() -> None:
     session_view = SessionView()
 
@@ -4,12 +4,16 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest.mock import patch
 
+from marimo._dependencies.dependencies import DependencyManager
 from marimo._server.file_router import (
     AppFileRouter,
     LazyListOfFilesAppFileRouter,
     ListOfFilesAppFileRouter,
+    MarimoAppIndex,
     NewFileAppFileRouter,
+    _is_marimo_app,
 )
 from marimo._server.models.home import MarimoFile
 
@@ -131,6 +135,127 @@ class TestAppFileRouter(unittest.TestCase):
         files = router.files
         assert len(files) == 4
 
+    def test_lazy_list_only_reads_changed_files(self):
+        router = LazyListOfFilesAppFileRouter(
+            self.test_dir, include_markdown=False
+        )
+        with patch(
+            "marimo._server.file_router._is_marimo_app",
+            wraps=_is_marimo_app,
+        ) as is_marimo_app:
+            assert len(router.files) == 3
+            assert is_marimo_app.call_count == 3
+
+            # Unchanged files are not read again
+            router.mark_stale()
+            assert len(router.files) == 3
+            assert is_marimo_app.call_count == 3
+
+            # Nor when toggling markdown
+            router = router.toggle_markdown(True)
+            assert len(router.files) == 4
+            assert is_marimo_app.call_count == 4
+
+            # Changed files are
+            with open(self.test_file1.name, "w") as f:
+                f.write("print('not an app anymore')")
+            router.mark_stale()
+            assert len(router.files) == 3
+            assert is_marimo_app.call_count == 5
+
+    def test_lazy_list_sees_new_files_when_marked_stale(self):
+        router = LazyListOfFilesAppFileRouter(
+            self.test_dir, include_markdown=False
+        )
+        try:
+            assert len(router.files) == 3
+            # Events from a watcher arrive asynchronously; marking the
+            # router stale is enough to see the new file
+            new_file = os.path.join(self.test_dir, "new_app.py")
+            with open(new_file, "w") as f:
+                f.write(file_contents)
+            router.mark_stale()
+            assert len(router.files) == 4
+        finally:
+            router.close()
+        assert not router._index.watching
+
+    def test_index_ignores_hidden_and_skipped_dirs(self):
+        index = MarimoAppIndex(self.test_dir)
+        join = os.path.join
+        assert index.is_relevant(join(self.test_dir, "app.py"))
+        assert index.is_relevant(join(self.test_dir, "nested", "app.py"))
+        assert not index.is_relevant(join(self.test_dir, ".git", "index"))
+        assert not index.is_relevant(
+            join(self.test_dir, ".venv", "lib", "mod.py")
+        )
+        assert not index.is_relevant(
+            join(self.test_dir, "node_modules", "pkg", "index.js")
+        )
+        assert not index.is_relevant(join(os.path.dirname(self.test_dir), "x"))
+
+    @unittest.skipIf(
+        not DependencyManager.watchdog.has(), "watchdog not installed"
+    )
+    def test_index_close_stops_watching(self):
+        index = MarimoAppIndex(self.test_dir)
+        index.watch()
+        assert index.watching
+        index.close()
+        assert not index.watching
+        # Closing twice is fine
+        index.close()
+
+    @unittest.skipIf(
+        not DependencyManager.watchdog.has(), "watchdog not installed"
+    )
+    def test_index_watches_searched_directories(self):
+        join = os.path.join
+        os.makedirs(join(self.test_dir, ".git", "objects"))
+        os.makedirs(join(self.test_dir, "node_modules", "pkg"))
+        deep = join(self.test_dir, *"abcdefg")
+        os.makedirs(deep)
+        index = MarimoAppIndex(self.test_dir)
+        index.watch()
+        try:
+            assert set(index._watches) == {
+                self.test_dir,
+                self.nested_dir,
+                *(join(self.test_dir, *"abcdefg"[:i]) for i in range(1, 6)),
+            }
+        finally:
+            index.close()
+        assert index._watches == {}
+
+    @unittest.skipIf(
+        not DependencyManager.watchdog.has(), "watchdog not installed"
+    )
+    def test_index_watches_new_directories(self):
+        import time
+
+        def wait_for(condition) -> None:
+            deadline = time.time() + 5
+            while not condition():
+                assert time.time() < deadline, "timed out waiting for event"
+                time.sleep(0.01)
+
+        index = MarimoAppIndex(self.test_dir)
+        index.watch()
+        try:
+            new_dir = os.path.join(self.nested_dir, "new")
+            os.mkdir(new_dir)
+            wait_for(lambda: new_dir in index._watches)
+
+            generation = index.generation
+            with open(os.path.join(new_dir, "app.py"), "w") as f:
+                f.write(file_contents)
+            wait_for(lambda: index.generation > generation)
+
+            shutil.rmtree(new_dir)
+            wait_for(lambda: new_dir not in index._watches)
+        finally:
+            index.close()
+
     def test_lazy_list_of_get_app_file_manager(self):
         router = LazyListOfFilesAppFileRouter(
             self.test_dir, include_markdown=False
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, Mock
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from marimo._config.manager import get_default_config_manager
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.ops import CellOp
+from marimo._server.exceptions import TooManySessionsException
 from marimo._server.file_manager import AppFileManager
 from marimo._server.file_router import AppFileRouter
 from marimo._server.model import ConnectionState, SessionConsumer, SessionMode
+from marimo._server.session.session_view import SessionView
 from marimo._server.sessions import (
     KernelManager,
     LspServer,
     Session,
     SessionManager,
 )
+from marimo._utils.marimo_path import MarimoPath
 
 
 @pytest.fixture
@@ -208,3 +214,156 @@ def test_shutdown(
     session_manager.lsp_server.stop.assert_called_once()
     assert len(session_manager.sessions) == 0
     assert mock_session.close.call_count == 2
+
+
+def _run_session_manager(
+    temp_marimo_file: str, **kwargs: Any
+) -> SessionManager:
+    return SessionManager(
+        file_router=AppFileRouter.from_filename(MarimoPath(temp_marimo_file)),
+        mode=SessionMode.RUN,
+        development_mode=False,
+        quiet=False,
+        include_code=True,
+        lsp_server=MagicMock(spec=LspServer),
+        user_config_manager=get_default_config_manager(current_path=None),
+        cli_args={},
+        auth_token=None,
+        redirect_console_to_browser=False,
+        ttl_seconds=None,
+        **kwargs,
+    )
+
+
+def _mock_run_session(state: ConnectionState, last_active: float) -> Mock:
+    session = Mock(spec=Session)
+    session.connection_state.return_value = state
+    session.last_active = last_active
+    return session
+
+
+def test_evict_idle_sessions_lru(temp_marimo_file: str) -> None:
+    manager = _run_session_manager(temp_marimo_file, max_sessions=2)
+    old = _mock_run_session(ConnectionState.ORPHANED, 1)
+    recent = _mock_run_session(ConnectionState.ORPHANED, 2)
+    manager.sessions = {"old": old, "recent": recent}
+
+    manager._evict_idle_sessions()
+    assert list(manager.sessions) == ["recent"]
+    old.close.assert_called_once()
+    recent.close.assert_not_called()
+
+
+def test_evict_idle_sessions_only_orphaned(temp_marimo_file: str) -> None:
+    manager = _run_session_manager(temp_marimo_file, max_sessions=1)
+    active = _mock_run_session(ConnectionState.OPEN, 1)
+    manager.sessions = {"active": active}
+
+    with pytest.raises(TooManySessionsException):
+        manager._evict_idle_sessions()
+    active.close.assert_not_called()
+
+
+def test_evict_idle_sessions_memory_budget(temp_marimo_file: str) -> None:
+    manager = _run_session_manager(temp_marimo_file, max_kernel_memory=100)
+    old = _mock_run_session(ConnectionState.ORPHANED, 1)
+    recent = _mock_run_session(ConnectionState.ORPHANED, 2)
+    manager.sessions = {"old": old, "recent": recent}
+
+    with patch(
+        "marimo._server.sessions._kernel_memory_bytes", return_value=50
+    ):
+        manager._evict_idle_sessions()
+    assert len(manager.sessions) == 2
+
+    # Evicts one session per new session while over budget
+    with patch(
+        "marimo._server.sessions._kernel_memory_bytes", return_value=200
+    ):
+        manager._evict_idle_sessions()
+        assert list(manager.sessions) == ["recent"]
+        manager._evict_idle_sessions()
+        assert manager.sessions == {}
+        with pytest.raises(TooManySessionsException):
+            manager._evict_idle_sessions()
+
+
+def test_evict_idle_sessions_edit_mode(
+    session_manager: SessionManager,
+) -> None:
+    session_manager.max_sessions = 1
+    session = _mock_run_session(ConnectionState.ORPHANED, 1)
+    session_manager.sessions = {"session": session}
+
+    session_manager._evict_idle_sessions()
+    session.close.assert_not_called()
+
+
+def _view_with_output(output: CellOutput) -> SessionView:
+    view = SessionView()
+    view.add_operation(CellOp(cell_id="1", output=output, status="idle"))
+    return view
+
+
+async def test_cached_initial_render(
+    temp_marimo_file: str, mock_session_consumer: SessionConsumer
+) -> None:
+    manager = _run_session_manager(temp_marimo_file, cache_initial_render=True)
+    app_file_manager = manager.app_manager(temp_marimo_file)
+    key = manager._initial_render_key(app_file_manager, {})
+    assert key is not None
+    assert manager._initial_render_key(app_file_manager, {"a": "1"}) is None
+
+    view = _view_with_output(
+        CellOutput(
+            channel=CellChannel.OUTPUT, mimetype="text/html", data="<p>1</p>"
+        )
+    )
+    manager._cache_initial_render(*key, view)
+
+    session = manager.create_session(
+        "session",
+        mock_session_consumer,
+        query_params={},
+        file_key=temp_marimo_file,
+    )
+    assert session.kernel_deferred
+    assert session.kernel_manager.kernel_task is None
+    assert session.session_view is not manager._initial_renders[key[0]][1]
+    assert session.session_view.operations == view.operations
+    manager.close_all_sessions()
+
+    # A new version of the app doesn't use the stale render
+    manager._initial_renders[key[0]] = ("stale", view)
+    assert manager._initial_render_key(app_file_manager, {}) == key
+    session = manager.create_session(
+        "session",
+        mock_session_consumer,
+        query_params={},
+        file_key=temp_marimo_file,
+    )
+    assert not session.kernel_deferred
+    manager.close_all_sessions()
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        CellOutput(
+            channel=CellChannel.MARIMO_ERROR,
+            mimetype="application/vnd.marimo+error",
+            data=[],
+        ),
+        CellOutput(
+            channel=CellChannel.OUTPUT,
+            mimetype="text/html",
+            data="<img src='./@file/10-image.png'/>",
+        ),
+    ],
+)
+def test_initial_render_not_cached(
+    temp_marimo_file: str, output: CellOutput
+) -> None:
+    manager = _run_session_manager(temp_marimo_file, cache_initial_render=True)
+    manager._cache_initial_render("app.py", "hash", _view_with_output(output))
+    assert manager._initial_renders == {}
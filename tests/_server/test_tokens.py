@@ -0,0 +1,22 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from marimo._server.tokens import SkewProtectionToken
+
+
+def test_skew_protection_token_is_stable_across_processes() -> None:
+    code = "import marimo as mo\nx = 1"
+    script = (
+        "from marimo._server.tokens import SkewProtectionToken;"
+        f"print(SkewProtectionToken.from_code({code!r}))"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", script], text=True
+    ).strip()
+    assert output == str(SkewProtectionToken.from_code(code))
+    assert str(SkewProtectionToken.from_code(code)) != str(
+        SkewProtectionToken.from_code(code + "\n")
+    )
@@ -41,6 +41,11 @@ if TYPE_CHECKING:
 # register import hooks for third-party module formatters
 register_formatters()
 
+# Compile cells into a cache private to the test session, instead of the
+# home directory of whoever runs the tests
+_compile_cache_dir = TemporaryDirectory()
+os.environ["MARIMO_COMPILE_CACHE_DIR"] = _compile_cache_dir.name
+
 
 @dataclasses.dataclass
 class _MockStream(ThreadSafeStream):
@@ -0,0 +1,85 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import marimo
+
+# Modules that should only be loaded once they're needed
+HEAVY_MODULES = [
+    "starlette",
+    "uvicorn",
+    "marimo._server.start",
+    "marimo._plugins.ui",
+    "marimo._runtime.runtime",
+]
+
+
+# Importing marimo loads a handful of modules; resolving its API eagerly
+# loads hundreds. Unlike the import's wall-clock time, the number of
+# modules doesn't depend on the machine.
+MAX_IMPORTED_MODULES = 20
+
+
+def _loaded_modules(code: str) -> list[str]:
+    p = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            code + "\nimport json, sys\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} "
+            "if m in sys.modules]))",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert p.returncode == 0, p.stderr
+    return json.loads(p.stdout.strip().splitlines()[-1])
+
+
+def test_import_marimo_is_lazy() -> None:
+    assert _loaded_modules("import marimo") == []
+
+
+def test_cli_help_is_lazy() -> None:
+    assert (
+        _loaded_modules(
+            "from click.testing import CliRunner\n"
+            "from marimo._cli.cli import main\n"
+            "assert CliRunner().invoke(main, ['--help']).exit_code == 0"
+        )
+        == []
+    )
+
+
+def test_import_marimo_module_budget() -> None:
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import marimo"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert p.returncode == 0, p.stderr
+    # Lines are "import time: self [us] | cumulative | name", where the name
+    # is indented by nesting depth, and modules come before their parent
+    names = [
+        line.split("|")[2]
+        for line in p.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    ]
+    (index,) = [i for i, name in enumerate(names) if name == " marimo"]
+    imported = 0
+    for name in reversed(names[:index]):
+        if not name.startswith("   "):
+            break
+        imported += 1
+    assert imported <= MAX_IMPORTED_MODULES, "\n".join(names[:index])
+
+
+def test_public_api_resolves() -> None:
+    for name in marimo.__all__:
+        assert getattr(marimo, name) is not None, name
+    assert set(marimo.__all__) <= set(dir(marimo))
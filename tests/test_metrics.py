@@ -0,0 +1,87 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from marimo._metrics import (
+    METRICS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+@pytest.fixture
+def _enabled():
+    with patch.object(METRICS, "enabled", True):
+        yield
+
+
+def test_disabled_metrics_are_noops() -> None:
+    counter = Counter("c", "A counter.")
+    gauge = Gauge("g", "A gauge.")
+    histogram = Histogram("h", "A histogram.")
+    with patch.object(METRICS, "enabled", False):
+        counter.inc()
+        gauge.set(3)
+        gauge.inc()
+        histogram.observe(0.1)
+    assert counter.get() == 0
+    assert gauge.get() == 0
+    assert histogram.count() == 0
+
+
+@pytest.mark.usefixtures("_enabled")
+def test_counter_exposition() -> None:
+    counter = Counter("requests", 'Requests "sent".', ["op"])
+    counter.inc(op="a")
+    counter.inc(2, op="a")
+    counter.inc(op='b"')
+    assert counter.expose() == (
+        "# TYPE requests counter\n"
+        '# HELP requests Requests \\"sent\\".\n'
+        'requests_total{op="a"} 3\n'
+        'requests_total{op="b\\""} 1'
+    )
+
+    with pytest.raises(ValueError):
+        counter.inc(other="a")
+
+
+@pytest.mark.usefixtures("_enabled")
+def test_histogram_exposition() -> None:
+    histogram = Histogram("latency", "Latency.", buckets=[0.1, 1])
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    assert histogram.samples() == [
+        'latency_bucket{le="0.1"} 1',
+        'latency_bucket{le="1.0"} 2',
+        'latency_bucket{le="+Inf"} 3',
+        "latency_count 3",
+        "latency_sum 5.55",
+    ]
+
+
+@pytest.mark.usefixtures("_enabled")
+def test_registry_exposition() -> None:
+    registry = MetricsRegistry()
+    gauge = registry.gauge("depth", "Queue depth.")
+    gauge.set(2)
+    extra = Gauge("extra", "Collected at scrape time.")
+    extra.set(1.5)
+    assert registry.expose([extra]) == (
+        "# TYPE depth gauge\n"
+        "# HELP depth Queue depth.\n"
+        "depth 2\n"
+        "# TYPE extra gauge\n"
+        "# HELP extra Collected at scrape time.\n"
+        "extra 1.5\n"
+        "# EOF\n"
+    )
+
+    with pytest.raises(ValueError):
+        registry.gauge("depth", "Duplicate.")